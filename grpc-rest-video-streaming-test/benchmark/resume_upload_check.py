@@ -0,0 +1,115 @@
+"""재개 가능한 업로드 중단/재개 확인
+
+가짜 비디오 파일을 resumable=True로 올리다가 청크 interrupt_after개를 보낸 뒤 연결이 끊긴
+것처럼 나머지 청크를 실패시키고, 같은 파일을 다시 올려 두 번째 업로드가 서버에 없는 청크만
+보내는지와 완료된 파일의 SHA-256이 원본과 같은지 확인합니다. 업로드 세션 상태 파일은 임시
+디렉토리에 두며, 업로드된 파일(`resume_check_*.mp4`)은 서버에 남습니다.
+
+    python server/server.py &
+    python benchmark/resume_upload_check.py --size-mb 64 --chunk-size-mb 4 --interrupt-after 5
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import uuid
+from typing import List, Optional, Set
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "client"))
+
+from client import VideoClient  # noqa: E402
+
+MIB = 1024 * 1024
+
+
+class RecordingClient(VideoClient):
+    """보낸 청크의 offset을 기록하고, fail_after개를 보낸 뒤에는 청크 전송을 실패시키는 클라이언트"""
+
+    def __init__(self, base_url: str, fail_after: Optional[int] = None):
+        super().__init__(base_url)
+        self.fail_after = fail_after
+        self.sent: List[int] = []
+        self._sent_lock = threading.Lock()
+
+    def _upload_chunk(
+        self, upload_id: str, file_path: str, offset: int, length: int, max_retries: int
+    ) -> None:
+        with self._sent_lock:
+            if self.fail_after is not None and len(self.sent) >= self.fail_after:
+                raise requests.exceptions.ConnectionError("simulated interruption")
+            self.sent.append(offset)
+        super()._upload_chunk(upload_id, file_path, offset, length, max_retries)
+
+
+def make_file(path: str, size: int) -> str:
+    """size 바이트 임의 데이터 파일을 만들고 SHA-256 반환"""
+    digest = hashlib.sha256()
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            block = os.urandom(min(MIB, remaining))
+            f.write(block)
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resumable upload interruption check")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--size-mb", type=float, default=64)
+    parser.add_argument("--chunk-size-mb", type=float, default=4)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--interrupt-after", type=int, default=5, help="중단 전에 보낼 청크 수")
+    args = parser.parse_args()
+
+    size = int(args.size_mb * MIB)
+    chunk_size = int(args.chunk_size_mb * MIB)
+    all_chunks: Set[int] = set(range(0, size, chunk_size))
+    if not 0 < args.interrupt_after < len(all_chunks):
+        parser.error(f"--interrupt-after must be between 1 and {len(all_chunks) - 1}")
+
+    workdir = tempfile.mkdtemp(prefix="resume_check_")
+    try:
+        path = os.path.join(workdir, f"resume_check_{uuid.uuid4().hex[:8]}.mp4")
+        state_path = os.path.join(workdir, "upload.json")
+        checksum = make_file(path, size)
+        options = dict(
+            resumable=True, chunk_size=chunk_size, concurrency=args.concurrency,
+            max_retries=0, state_path=state_path,
+        )
+
+        first = RecordingClient(args.base_url, fail_after=args.interrupt_after)
+        try:
+            first.upload_video(path, **options)
+        except requests.exceptions.RequestException:
+            pass
+        else:
+            raise SystemExit("first upload was expected to be interrupted")
+        assert os.path.exists(state_path), "upload session state was not saved"
+
+        second = RecordingClient(args.base_url)
+        result = second.upload_video(path, **options)
+
+        resent = set(second.sent)
+        expected = all_chunks - set(first.sent)
+        assert len(second.sent) == len(resent), f"chunks sent twice: {sorted(second.sent)}"
+        assert resent == expected, f"resent {sorted(resent)}, expected {sorted(expected)}"
+        assert result["sha256"] == checksum, f"sha256 mismatch: {result['sha256']} != {checksum}"
+        assert not os.path.exists(state_path), "upload session state was not removed"
+        print(
+            f"{len(all_chunks)} chunks x {chunk_size / MIB:g} MiB: "
+            f"{len(first.sent)} sent before interruption, {len(resent)} missing chunks resent, "
+            f"sha256 ok ({result['filename']})"
+        )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
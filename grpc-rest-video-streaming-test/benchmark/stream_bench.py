@@ -0,0 +1,87 @@
+"""/stream/{video_name} 동시 시청 처리량 벤치마크
+
+서버에 있는 비디오 하나를 동시 시청자 수만큼의 스레드가 반복해서 받아 전체 처리량(MB/s)과
+첫 바이트까지의 시간(TTFB)을 측정합니다. `--mode range`는 시청 중 탐색(seek)처럼 임의 위치의
+`--range-size` 바이트를 Range 요청으로 받습니다.
+
+    python benchmark/stream_bench.py --video sample.mp4 --viewers 100 --duration 20
+    python benchmark/stream_bench.py --video sample.mp4 --viewers 100 --mode range
+"""
+import argparse
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import requests
+
+
+def watch(
+    url: str, mode: str, range_size: int, size: int, deadline: float, read_size: int
+) -> Tuple[int, List[float]]:
+    """마감 시각까지 반복해서 받은 바이트 수와 요청별 TTFB 목록 반환"""
+    session = requests.Session()
+    received = 0
+    ttfbs: List[float] = []
+    while time.perf_counter() < deadline:
+        headers = {}
+        if mode == "range":
+            start = random.randrange(0, max(1, size - range_size))
+            headers["Range"] = f"bytes={start}-{start + range_size - 1}"
+        started = time.perf_counter()
+        with session.get(url, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            first = True
+            for chunk in response.iter_content(chunk_size=read_size):
+                if first:
+                    ttfbs.append(time.perf_counter() - started)
+                    first = False
+                received += len(chunk)
+    return received, ttfbs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Video streaming throughput benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--video", required=True, help="서버에 업로드된 비디오 파일명")
+    parser.add_argument("--viewers", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--mode", choices=["full", "range"], default="full")
+    parser.add_argument("--range-size", type=int, default=1024 * 1024)
+    parser.add_argument("--read-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    url = f"{args.base_url.rstrip('/')}/stream/{args.video}"
+    # 본문은 읽지 않고 크기만 확인 (HEAD/Content-Length가 없는 이전 서버와도 비교할 수 있도록 GET 사용)
+    with requests.get(url, stream=True) as probe:
+        probe.raise_for_status()
+        size = int(probe.headers.get("content-length", 0))
+    if args.mode == "range" and not size:
+        parser.error("range mode needs a server that reports Content-Length")
+
+    deadline = time.perf_counter() + args.duration
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.viewers) as executor:
+        futures = [
+            executor.submit(
+                watch, url, args.mode, args.range_size, size, deadline, args.read_size
+            )
+            for _ in range(args.viewers)
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+
+    total = sum(received for received, _ in results)
+    ttfbs = sorted(t for _, viewer_ttfbs in results for t in viewer_ttfbs)
+    p50 = statistics.median(ttfbs) * 1000
+    p95 = ttfbs[int(len(ttfbs) * 0.95)] * 1000
+    print(
+        f"mode={args.mode} viewers={args.viewers} "
+        f"requests={len(ttfbs)} {total / elapsed / 1024 / 1024:,.1f} MB/s "
+        f"TTFB p50 {p50:.1f}ms p95 {p95:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
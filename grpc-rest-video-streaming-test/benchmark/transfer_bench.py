@@ -0,0 +1,339 @@
+"""REST vs gRPC 업로드/다운로드 벤치마크
+
+합성 비디오 파일을 만들어 REST(VideoClient)와 gRPC(GrpcVideoClient)로 동시 전송 수와 청크 크기를
+바꿔 가며 업로드/다운로드하고, 시나리오마다 처리량(MB/s), 첫 바이트까지의 시간(TTFB, 다운로드만),
+클라이언트/서버 프로세스의 CPU 사용량과 피크 RSS를 CSV와 JSON으로 기록합니다.
+
+    python server/server.py &
+    python benchmark/transfer_bench.py --server-pid <pid> --sizes-mb 10 100 \\
+        --concurrency 1 4 16 --chunk-sizes-kb 64 1024
+
+- 동시 전송마다 클라이언트를 따로 만듭니다 (REST 세션/gRPC 채널을 공유하지 않음)
+- 프로토콜 `rest`는 스트리밍 업로드(`POST /upload`, multipart 한 번)와 `GET /stream`,
+  `rest-resumable`은 재개 가능한 청크 업로드(`/uploads`, 업로드만)입니다
+- 청크 크기는 rest-resumable 업로드는 업로드 청크, REST 다운로드는 클라이언트가 읽는 크기
+  (서버 쪽은 STREAM_CHUNK_SIZE), gRPC는 양방향 메시지 크기입니다. rest 업로드에는 청크
+  크기가 없어 청크 크기마다 반복하지 않습니다
+- REST와 gRPC를 각각 `server/server.py`(GRPC_PORT=0)와 `server/grpc_server.py`로 따로 띄우면
+  서버 CPU/RSS를 프로토콜별로 나눠 잴 수 있습니다 (`--grpc-server-pid`)
+- 업로드한 벤치마크 파일(`bench_*.mp4`)은 서버에 남습니다
+"""
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import psutil
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "client"))
+
+from client import GrpcVideoClient, VideoClient  # noqa: E402
+
+BLOCK = os.urandom(1024 * 1024)
+MIB = 1024 * 1024
+
+FIELDS = [
+    "protocol", "operation", "size_mb", "concurrency", "chunk_kb", "run",
+    "seconds", "mb_per_s", "ttfb_p50_ms", "ttfb_max_ms",
+    "client_cpu_s", "client_cpu_pct", "client_peak_rss_mib",
+    "server_cpu_s", "server_cpu_pct", "server_peak_rss_mib",
+]
+
+
+class ResourceMonitor:
+    """with 블록 동안 프로세스별 CPU 시간과 피크 RSS 측정"""
+
+    def __init__(self, processes: Dict[str, Optional[psutil.Process]], interval: float = 0.05):
+        self.processes = {side: p for side, p in processes.items() if p is not None}
+        self.interval = interval
+        self.peak_rss: Dict[str, int] = {}
+        self.cpu_seconds: Dict[str, float] = {}
+        self._cpu_start: Dict[str, float] = {}
+        self._done = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while True:
+            for side, process in self.processes.items():
+                self.peak_rss[side] = max(self.peak_rss.get(side, 0), process.memory_info().rss)
+            if self._done.wait(self.interval):
+                break
+
+    def __enter__(self) -> "ResourceMonitor":
+        for side, process in self.processes.items():
+            times = process.cpu_times()
+            self._cpu_start[side] = times.user + times.system
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._done.set()
+        self._sampler.join()
+        for side, process in self.processes.items():
+            times = process.cpu_times()
+            self.cpu_seconds[side] = times.user + times.system - self._cpu_start[side]
+
+
+class SyntheticFiles:
+    """크기별 합성 비디오 파일 (1 MiB 난수 블록 반복)과 동시 업로드용 이름이 다른 심볼릭 링크"""
+
+    def __init__(self, work_dir: str):
+        self.work_dir = work_dir
+        self.sha256: Dict[int, str] = {}
+        os.makedirs(work_dir, exist_ok=True)
+
+    def base_path(self, size_mb: int) -> str:
+        return os.path.join(self.work_dir, f"bench_{size_mb}mb.mp4")
+
+    def create(self, size_mb: int) -> str:
+        """파일이 없으면 만들고 SHA-256을 기록"""
+        path = self.base_path(size_mb)
+        digest = hashlib.sha256()
+        if os.path.exists(path) and os.path.getsize(path) == size_mb * MIB:
+            with open(path, "rb") as f:
+                while block := f.read(MIB):
+                    digest.update(block)
+        else:
+            with open(path, "wb") as f:
+                for _ in range(size_mb):
+                    f.write(BLOCK)
+                    digest.update(BLOCK)
+        self.sha256[size_mb] = digest.hexdigest()
+        return path
+
+    def upload_path(self, size_mb: int, index: int) -> str:
+        """동시 업로드가 서버에서 같은 파일을 덮어쓰지 않도록 전송마다 다른 파일명 사용"""
+        path = os.path.join(self.work_dir, f"bench_{size_mb}mb_{index}.mp4")
+        if not os.path.lexists(path):
+            os.symlink(os.path.basename(self.base_path(size_mb)), path)
+        return path
+
+
+REST_PROTOCOLS = ("rest", "rest-resumable")
+
+
+def make_client(protocol: str, args: argparse.Namespace, chunk_size: Optional[int]):
+    if protocol in REST_PROTOCOLS:
+        return VideoClient(args.rest_url)
+    return GrpcVideoClient(args.grpc_target, chunk_size=chunk_size)
+
+
+def chunk_sizes_for(
+    protocol: str, operation: str, chunk_sizes_kb: List[int]
+) -> List[Optional[int]]:
+    """시나리오의 청크 크기 목록 (바이트, rest 업로드는 청크 크기가 없어 None 하나)"""
+    if protocol == "rest" and operation == "upload":
+        return [None]
+    return [chunk_kb * 1024 for chunk_kb in chunk_sizes_kb]
+
+
+def run_scenario(
+    protocol: str,
+    operation: str,
+    size_mb: int,
+    concurrency: int,
+    chunk_size: Optional[int],
+    files: SyntheticFiles,
+    processes: Dict[str, Optional[psutil.Process]],
+    args: argparse.Namespace,
+) -> dict:
+    """동시 전송 concurrency개를 한 번 실행하고 결과 행 반환"""
+    clients = [make_client(protocol, args, chunk_size) for _ in range(concurrency)]
+    size = size_mb * MIB
+
+    def transfer(index: int) -> Optional[float]:
+        client = clients[index]
+        started = time.perf_counter()
+        if operation == "upload":
+            path = files.upload_path(size_mb, index)
+            if protocol == "rest":
+                result = client.upload_video(path, resumable=False)
+            elif protocol == "rest-resumable":
+                result = client.upload_video(
+                    path,
+                    resumable=True,
+                    chunk_size=chunk_size,
+                    concurrency=args.upload_parallelism,
+                    verify=False,
+                )
+            else:
+                result = client.upload_video(path, chunk_size=chunk_size)
+            if result["sha256"] != files.sha256[size_mb]:
+                raise RuntimeError(f"{protocol} upload of {path} stored a different SHA-256")
+            return None
+
+        first_byte: List[float] = []
+        received = [0]
+
+        def progress(length: int) -> None:
+            if not first_byte:
+                first_byte.append(time.perf_counter() - started)
+            received[0] += length
+
+        client.download_video(
+            os.path.basename(files.base_path(size_mb)),
+            os.devnull,
+            chunk_size=chunk_size,
+            progress=progress,
+        )
+        if received[0] != size:
+            raise RuntimeError(f"{protocol} download returned {received[0]} of {size} bytes")
+        return first_byte[0]
+
+    with ResourceMonitor(processes) as monitor:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            ttfbs = sorted(t for t in executor.map(transfer, range(concurrency)) if t is not None)
+        elapsed = time.perf_counter() - started
+
+    if protocol == "grpc":
+        for client in clients:
+            client.close()
+
+    row = {
+        "protocol": protocol,
+        "operation": operation,
+        "size_mb": size_mb,
+        "concurrency": concurrency,
+        "chunk_kb": chunk_size // 1024 if chunk_size else None,
+        "seconds": round(elapsed, 3),
+        "mb_per_s": round(size * concurrency / elapsed / MIB, 1),
+        "ttfb_p50_ms": round(ttfbs[len(ttfbs) // 2] * 1000, 2) if ttfbs else None,
+        "ttfb_max_ms": round(ttfbs[-1] * 1000, 2) if ttfbs else None,
+    }
+    for side in ("client", "server"):
+        if side in monitor.cpu_seconds:
+            row[f"{side}_cpu_s"] = round(monitor.cpu_seconds[side], 2)
+            row[f"{side}_cpu_pct"] = round(monitor.cpu_seconds[side] / elapsed * 100, 1)
+            row[f"{side}_peak_rss_mib"] = round(monitor.peak_rss[side] / MIB, 1)
+        else:
+            row[f"{side}_cpu_s"] = row[f"{side}_cpu_pct"] = row[f"{side}_peak_rss_mib"] = None
+    return row
+
+
+def fmt(value) -> str:
+    """측정하지 않은 값은 '-'로 표시"""
+    return "-" if value is None else str(value)
+
+
+def write_report(output: str, rows: List[dict], args: argparse.Namespace) -> None:
+    """<output>.csv와 <output>.json 저장 (JSON에는 실행 설정도 함께 기록)"""
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(f"{output}.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(f"{output}.json", "w") as f:
+        json.dump(
+            {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "host": platform.node(),
+                "python": platform.python_version(),
+                "cpu_count": os.cpu_count(),
+                "config": vars(args),
+                "results": rows,
+            },
+            f,
+            indent=2,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="REST vs gRPC video transfer benchmark")
+    parser.add_argument("--rest-url", default="http://localhost:8000")
+    parser.add_argument("--grpc-target", default="localhost:50051")
+    parser.add_argument(
+        "--protocols",
+        nargs="+",
+        choices=["rest", "rest-resumable", "grpc"],
+        default=["rest", "rest-resumable", "grpc"],
+    )
+    parser.add_argument(
+        "--operations", nargs="+", choices=["upload", "download"], default=["upload", "download"]
+    )
+    parser.add_argument("--sizes-mb", nargs="+", type=int, default=[10, 100])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument("--chunk-sizes-kb", nargs="+", type=int, default=[64, 1024])
+    parser.add_argument("--repeat", type=int, default=1, help="시나리오별 반복 횟수")
+    parser.add_argument(
+        "--upload-parallelism", type=int, default=1, help="rest-resumable 업로드 한 건의 동시 청크 수"
+    )
+    parser.add_argument("--server-pid", type=int, help="REST 서버 PID (CPU/RSS 측정)")
+    parser.add_argument(
+        "--grpc-server-pid", type=int, help="gRPC 서버 PID (기본값: --server-pid, 같은 프로세스)"
+    )
+    parser.add_argument("--work-dir", default="bench_files", help="합성 파일을 만들 디렉토리")
+    parser.add_argument(
+        "--output", default="benchmark/results/transfer", help="<output>.csv / <output>.json"
+    )
+    args = parser.parse_args()
+
+    # 전송마다 남는 클라이언트 INFO 로그는 숨김
+    logging.getLogger("client").setLevel(logging.WARNING)
+    server_pids = {
+        "rest": args.server_pid,
+        "rest-resumable": args.server_pid,
+        "grpc": args.grpc_server_pid or args.server_pid,
+    }
+    client_process = psutil.Process()
+
+    files = SyntheticFiles(args.work_dir)
+    setup = VideoClient(args.rest_url)
+    if not setup.wait_for_server():
+        parser.error(f"REST server at {args.rest_url} is not reachable")
+    if "grpc" in args.protocols:
+        probe = GrpcVideoClient(args.grpc_target)
+        ready = probe.wait_for_server(10)
+        probe.close()
+        if not ready:
+            parser.error(f"gRPC server at {args.grpc_target} is not reachable")
+    for size_mb in args.sizes_mb:
+        path = files.create(size_mb)
+        if "download" in args.operations:
+            setup.upload_video(path, resumable=False)
+
+    rows = []
+    for protocol in args.protocols:
+        server = psutil.Process(server_pids[protocol]) if server_pids[protocol] else None
+        processes = {"client": client_process, "server": server}
+        for operation in args.operations:
+            if protocol == "rest-resumable" and operation == "download":
+                # 다운로드 경로는 rest와 같음
+                continue
+            for size_mb in args.sizes_mb:
+                for concurrency in args.concurrency:
+                    for chunk_size in chunk_sizes_for(protocol, operation, args.chunk_sizes_kb):
+                        for run in range(1, args.repeat + 1):
+                            row = run_scenario(
+                                protocol, operation, size_mb, concurrency, chunk_size,
+                                files, processes, args,
+                            )
+                            row["run"] = run
+                            rows.append(row)
+                            print(
+                                f"{protocol:14} {operation:8} {size_mb:>5} MB x{concurrency:<3} "
+                                f"chunk {fmt(row['chunk_kb']):>5} KiB  "
+                                f"{row['mb_per_s']:>8,.1f} MB/s  "
+                                f"TTFB p50 {fmt(row['ttfb_p50_ms']):>7} ms  "
+                                f"client CPU {fmt(row['client_cpu_pct']):>5}%  "
+                                f"server CPU {fmt(row['server_cpu_pct']):>5}%  "
+                                f"server RSS {fmt(row['server_peak_rss_mib'])} MiB"
+                            )
+
+    write_report(args.output, rows, args)
+    print(f"Wrote {args.output}.csv and {args.output}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""/upload 동시 업로드 메모리 벤치마크
+
+크기가 큰 가짜 비디오 여러 개를 동시에 업로드하면서 서버 프로세스의 RSS를 주기적으로 측정합니다.
+업로드 본문은 1 MiB 블록을 반복하는 multipart 스트림으로 만들어(chunked 전송) 클라이언트도
+파일 전체를 메모리나 디스크에 만들지 않습니다. 업로드 경로가 스트리밍이면 피크 RSS가 파일
+크기/동시 업로드 수와 무관하게 거의 일정합니다.
+
+    python benchmark/upload_memory_bench.py --server-pid <pid> --size-gb 4 --concurrency 4
+"""
+import argparse
+import hashlib
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
+
+import psutil
+import requests
+
+BLOCK = os.urandom(1024 * 1024)
+
+
+def multipart_body(boundary: str, filename: str, size: int) -> Iterator[bytes]:
+    """size 바이트 파일 필드 하나를 담은 multipart/form-data 본문 스트림"""
+    yield (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: video/mp4\r\n\r\n"
+    ).encode()
+    remaining = size
+    while remaining > 0:
+        block = BLOCK[:remaining]
+        remaining -= len(block)
+        yield block
+    yield f"\r\n--{boundary}--\r\n".encode()
+
+
+def expected_sha256(size: int) -> str:
+    """multipart_body가 보내는 파일 내용의 SHA-256"""
+    digest = hashlib.sha256()
+    remaining = size
+    while remaining > 0:
+        block = BLOCK[:remaining]
+        remaining -= len(block)
+        digest.update(block)
+    return digest.hexdigest()
+
+
+def upload(base_url: str, filename: str, size: int) -> dict:
+    """스트리밍 업로드 한 건"""
+    boundary = uuid.uuid4().hex
+    response = requests.post(
+        f"{base_url.rstrip('/')}/upload",
+        data=multipart_body(boundary, filename, size),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Upload memory benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--server-pid", type=int, required=True, help="RSS를 측정할 서버 PID")
+    parser.add_argument("--size-gb", type=float, default=4.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--interval", type=float, default=0.2)
+    args = parser.parse_args()
+
+    server = psutil.Process(args.server_pid)
+    size = int(args.size_gb * 1024 ** 3)
+    baseline = server.memory_info().rss
+    samples: List[int] = []
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.is_set():
+            samples.append(server.memory_info().rss)
+            time.sleep(args.interval)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(
+            executor.map(
+                lambda i: upload(args.base_url, f"bench_upload_{i}.mp4", size),
+                range(args.concurrency),
+            )
+        )
+    elapsed = time.perf_counter() - started
+    done.set()
+    sampler.join()
+
+    # 이전 서버처럼 크기/해시를 돌려주지 않는 응답은 확인하지 않음
+    checksum = expected_sha256(size)
+    assert all(r.get("sha256", checksum) == checksum for r in results), results
+    mib = 1024 * 1024
+    print(
+        f"uploads={args.concurrency} x {args.size_gb:g} GiB  "
+        f"{size * args.concurrency / elapsed / mib:,.1f} MB/s  "
+        f"server RSS baseline {baseline / mib:,.1f} MiB  peak {max(samples) / mib:,.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
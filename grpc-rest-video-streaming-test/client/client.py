@@ -1,7 +1,13 @@
+import grpc
 import requests
+import hashlib
+import json
 import os
+import sys
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
 import logging
 from urllib.parse import urljoin
 
@@ -9,10 +15,16 @@ from urllib.parse import urljoin
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "common"))
+
+from grpc_stubs import DEFAULT_MAX_MESSAGE_SIZE, channel_options, load_stubs  # noqa: E402
+
 class VideoClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.session = requests.Session()
+        # 병렬 청크 업로드용 스레드별 세션 (requests.Session은 스레드 간 공유를 보장하지 않음)
+        self._local = threading.local()
 
     def wait_for_server(self, timeout: int = 30, interval: int = 1) -> bool:
         """서버가 준비될 때까지 대기"""
@@ -28,11 +40,61 @@ class VideoClient:
                 time.sleep(interval)
         return False
 
-    def upload_video(self, file_path: str) -> dict:
-        """비디오 파일을 서버에 업로드합니다."""
+    def upload_video(
+        self,
+        file_path: str,
+        resumable: bool = False,
+        chunk_size: int = 8 * 1024 * 1024,
+        concurrency: int = 4,
+        max_retries: int = 5,
+        verify: bool = True,
+        state_path: Optional[str] = None,
+    ) -> dict:
+        """비디오 파일을 서버에 업로드합니다.
+
+        기본값은 파일 전체를 multipart 요청 한 번으로 /upload에 올립니다.
+        resumable이면 업로드 세션을 만들고 chunk_size 단위 청크를 concurrency개씩 동시에 올립니다.
+        세션 ID는 state_path(기본값: 파일 옆의 `<파일>.upload.json`, 파일 디렉토리에 쓸 수 있어야 함)에
+        남겨 두므로, 중간에 끊기거나 프로세스가 다시 시작되어도 같은 파일을 다시 올리면 서버가 아직
+        받지 못한 청크만 보냅니다. 실패한 청크는 max_retries번까지 다시 보내고, verify이면 올리기 전에
+        파일 전체를 한 번 읽어 계산한 SHA-256을 서버에서 확인합니다.
+        """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        if not resumable:
+            return self._upload_whole(file_path)
+
+        if state_path is None:
+            state_path = f"{file_path}.upload.json"
+        try:
+            upload = self._resume_or_create_upload(file_path, state_path, verify)
+            missing = self._missing_chunks(upload["size"], upload["ranges"], chunk_size)
+            if missing:
+                logger.info(
+                    f"Uploading {len(missing)} chunk(s) of {os.path.basename(file_path)} "
+                    f"({upload['received']}/{upload['size']} bytes already on server)"
+                )
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(
+                    lambda chunk: self._upload_chunk(
+                        upload["upload_id"], file_path, chunk[0], chunk[1], max_retries
+                    ),
+                    missing,
+                ))
+            response = self.session.post(
+                urljoin(self.base_url, f"uploads/{upload['upload_id']}/complete")
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error uploading video: {str(e)}")
+            raise
+
+        os.remove(state_path)
+        return response.json()
+
+    def _upload_whole(self, file_path: str) -> dict:
+        """파일 전체를 multipart 요청 한 번으로 업로드"""
         try:
             with open(file_path, 'rb') as f:
                 files = {'file': (os.path.basename(file_path), f)}
@@ -46,6 +108,90 @@ class VideoClient:
             logger.error(f"Error uploading video: {str(e)}")
             raise
 
+    def _resume_or_create_upload(self, file_path: str, state_path: str, verify: bool) -> dict:
+        """저장해 둔 세션이 있고 파일이 그대로면 그 상태를, 아니면 새 세션을 반환"""
+        stat = os.stat(file_path)
+        if os.path.exists(state_path):
+            with open(state_path) as f:
+                state = json.load(f)
+            if state.get("size") == stat.st_size and state.get("mtime") == stat.st_mtime:
+                response = self.session.get(
+                    urljoin(self.base_url, f"uploads/{state['upload_id']}")
+                )
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    logger.info(f"Resuming upload {state['upload_id']}")
+                    return response.json()
+            logger.info("Saved upload session is stale, starting a new one")
+
+        body = {"filename": os.path.basename(file_path), "size": stat.st_size}
+        if verify:
+            body["sha256"] = self._sha256(file_path)
+        response = self.session.post(urljoin(self.base_url, "uploads"), json=body)
+        response.raise_for_status()
+        upload = response.json()
+        with open(state_path, "w") as f:
+            json.dump(
+                {"upload_id": upload["upload_id"], "size": stat.st_size, "mtime": stat.st_mtime}, f
+            )
+        return upload
+
+    @staticmethod
+    def _missing_chunks(
+        size: int, ranges: List[List[int]], chunk_size: int
+    ) -> List[Tuple[int, int]]:
+        """서버가 아직 받지 못한 구간을 chunk_size 이하의 (offset, length) 목록으로 나눔"""
+        chunks = []
+        position = 0
+        for start, end in ranges + [[size, size]]:
+            while position < start:
+                length = min(chunk_size, start - position)
+                chunks.append((position, length))
+                position += length
+            position = max(position, end)
+        return chunks
+
+    def _upload_chunk(
+        self, upload_id: str, file_path: str, offset: int, length: int, max_retries: int
+    ) -> None:
+        """청크 하나를 업로드 (연결 오류/5xx는 지수 백오프로 재시도)"""
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        with open(file_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(length)
+
+        url = urljoin(self.base_url, f"uploads/{upload_id}")
+        for attempt in range(max_retries + 1):
+            try:
+                response = self._local.session.put(
+                    url,
+                    params={"offset": offset},
+                    data=data,
+                    headers={"Content-Type": "application/octet-stream"},
+                )
+                if response.status_code < 500:
+                    response.raise_for_status()
+                    return
+                error = f"HTTP {response.status_code}"
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = str(e)
+            if attempt == max_retries:
+                raise requests.exceptions.RetryError(
+                    f"Chunk at offset {offset} failed after {max_retries} retries: {error}"
+                )
+            logger.warning(f"Retrying chunk at offset {offset} ({error})")
+            time.sleep(min(0.5 * 2 ** attempt, 10))
+
+    @staticmethod
+    def _sha256(file_path: str) -> str:
+        """파일 전체의 SHA-256"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            while block := f.read(1024 * 1024):
+                digest.update(block)
+        return digest.hexdigest()
+
     def list_videos(self) -> list:
         """서버에 있는 비디오 목록을 가져옵니다."""
         try:
@@ -56,8 +202,14 @@ class VideoClient:
             logger.error(f"Error listing videos: {str(e)}")
             raise
 
-    def download_video(self, video_name: str, save_path: Optional[str] = None) -> str:
-        """서버로부터 비디오를 다운로드합니다."""
+    def download_video(
+        self,
+        video_name: str,
+        save_path: Optional[str] = None,
+        chunk_size: int = 8192,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> str:
+        """서버로부터 비디오를 다운로드합니다. (progress는 받은 청크마다 바이트 수로 호출)"""
         if save_path is None:
             save_path = video_name
 
@@ -69,9 +221,11 @@ class VideoClient:
             response.raise_for_status()
 
             with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=chunk_size):
                     if chunk:
                         f.write(chunk)
+                        if progress is not None:
+                            progress(len(chunk))
 
             logger.info(f"Successfully downloaded video to {save_path}")
             return save_path
@@ -79,13 +233,129 @@ class VideoClient:
             logger.error(f"Error downloading video: {str(e)}")
             raise
 
+class GrpcVideoClient:
+    """proto/video_service.proto의 VideoService 클라이언트 (VideoClient와 같은 메서드 구성)
+
+    chunk_size는 업로드 때 보내는 메시지 크기이자 다운로드 때 서버에 요청하는 청크 크기입니다.
+    stream_window/bdp_probe는 HTTP/2 수신 윈도 설정으로, 다운로드 처리량에 영향을 줍니다.
+    스텁은 처음 만들 때 불러오므로(필요하면 protoc 실행) REST만 쓰면 코드 생성이 일어나지 않습니다.
+    """
+
+    def __init__(
+        self,
+        target: str = "localhost:50051",
+        chunk_size: int = 1024 * 1024,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+        stream_window: int = 0,
+        bdp_probe: bool = True,
+    ):
+        self.target = target
+        self.chunk_size = chunk_size
+        self.pb2, pb2_grpc = load_stubs()
+        self.channel = grpc.insecure_channel(
+            target, options=channel_options(max_message_size, stream_window, bdp_probe)
+        )
+        self.stub = pb2_grpc.VideoServiceStub(self.channel)
+
+    def wait_for_server(self, timeout: int = 30) -> bool:
+        """서버가 준비될 때까지 대기"""
+        try:
+            grpc.channel_ready_future(self.channel).result(timeout=timeout)
+            logger.info("gRPC server is ready!")
+            return True
+        except grpc.FutureTimeoutError:
+            return False
+
+    def upload_video(self, file_path: str, chunk_size: Optional[int] = None) -> dict:
+        """비디오 파일을 클라이언트 스트림으로 업로드합니다."""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        try:
+            response = self.stub.UploadVideo(
+                self._read_chunks(file_path, chunk_size or self.chunk_size)
+            )
+        except grpc.RpcError as e:
+            logger.error(f"Error uploading video: {e.code().name} {e.details()}")
+            raise
+        return {
+            "filename": os.path.basename(file_path),
+            "status": "uploaded" if response.success else "failed",
+            "size": response.size,
+            "sha256": response.sha256,
+        }
+
+    def _read_chunks(self, file_path: str, chunk_size: int) -> Iterator:
+        """파일을 chunk_size 단위 VideoChunk로 읽기 (첫 청크에만 filename 포함)"""
+        filename = os.path.basename(file_path)
+        with open(file_path, 'rb') as f:
+            # 빈 파일이어도 파일명을 담은 첫 청크는 보냄
+            yield self.pb2.VideoChunk(content=f.read(chunk_size), filename=filename)
+            while data := f.read(chunk_size):
+                yield self.pb2.VideoChunk(content=data)
+
+    def list_videos(self) -> list:
+        """서버에 있는 비디오 목록을 가져옵니다."""
+        try:
+            return list(self.stub.ListVideos(self.pb2.Empty()).filenames)
+        except grpc.RpcError as e:
+            logger.error(f"Error listing videos: {e.code().name} {e.details()}")
+            raise
+
+    def download_video(
+        self,
+        video_name: str,
+        save_path: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> str:
+        """서버 스트림으로 비디오를 다운로드합니다. (progress는 받은 청크마다 바이트 수로 호출)
+
+        저장 파일은 첫 메시지를 받은 뒤에 만들고, 도중에 실패하면 받던 파일을 지웁니다.
+        """
+        if save_path is None:
+            save_path = video_name
+
+        request = self.pb2.VideoRequest(
+            filename=video_name, chunk_size=chunk_size or self.chunk_size
+        )
+        f = None
+        try:
+            for chunk in self.stub.DownloadVideo(request):
+                if f is None:
+                    f = open(save_path, 'wb')
+                f.write(chunk.content)
+                if progress is not None:
+                    progress(len(chunk.content))
+            if f is None:
+                # 빈 파일은 메시지 없이 끝남
+                f = open(save_path, 'wb')
+        except grpc.RpcError as e:
+            logger.error(f"Error downloading video: {e.code().name} {e.details()}")
+            if f is not None:
+                f.close()
+                os.remove(save_path)
+            raise
+        finally:
+            if f is not None:
+                f.close()
+
+        logger.info(f"Successfully downloaded video to {save_path}")
+        return save_path
+
+    def close(self) -> None:
+        """채널 닫기"""
+        self.channel.close()
+
 def main():
     # 환경 변수에서 서버 정보 가져오기
     server_host = os.getenv("SERVER_HOST", "localhost")
     server_port = os.getenv("SERVER_PORT", "8000")
+    grpc_port = os.getenv("GRPC_SERVER_PORT", "50051")
     base_url = f"http://{server_host}:{server_port}"
 
     client = VideoClient(base_url)
+    grpc_client = GrpcVideoClient(f"{server_host}:{grpc_port}")
     
     try:
         # 서버가 준비될 때까지 대기
@@ -97,10 +367,15 @@ def main():
         videos = client.list_videos()
         logger.info(f"Available videos: {videos}")
 
+        if grpc_client.wait_for_server():
+            logger.info(f"Available videos (gRPC): {grpc_client.list_videos()}")
+
         # 여기에 추가적인 테스트 코드를 작성할 수 있습니다.
         
     except Exception as e:
         logger.error(f"Error in main: {str(e)}")
+    finally:
+        grpc_client.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,56 @@
+import functools
+import os
+import sys
+from typing import List, Tuple
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROTO_PATH = os.path.join(PROJECT_DIR, "proto", "video_service.proto")
+GENERATED_DIR = os.path.join(PROJECT_DIR, "generated")
+
+# 메시지 최대 크기 기본값 (서버/클라이언트 공통)
+DEFAULT_MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def load_stubs():
+    """generated/의 스텁 모듈을 import (없거나 proto보다 오래되었으면 grpc_tools로 다시 생성)"""
+    pb2_path = os.path.join(GENERATED_DIR, "video_service_pb2.py")
+    if not os.path.exists(pb2_path) or os.path.getmtime(pb2_path) < os.path.getmtime(PROTO_PATH):
+        from grpc_tools import protoc
+
+        os.makedirs(GENERATED_DIR, exist_ok=True)
+        result = protoc.main([
+            "grpc_tools.protoc",
+            f"-I{os.path.dirname(PROTO_PATH)}",
+            f"--python_out={GENERATED_DIR}",
+            f"--grpc_python_out={GENERATED_DIR}",
+            PROTO_PATH,
+        ])
+        if result != 0:
+            raise RuntimeError(f"Failed to generate gRPC stubs from {PROTO_PATH}")
+    if GENERATED_DIR not in sys.path:
+        sys.path.insert(0, GENERATED_DIR)
+    import video_service_pb2
+    import video_service_pb2_grpc
+
+    return video_service_pb2, video_service_pb2_grpc
+
+
+def channel_options(
+    max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+    stream_window: int = 0,
+    bdp_probe: bool = True,
+) -> List[Tuple[str, int]]:
+    """메시지 크기와 HTTP/2 흐름 제어 채널 옵션 (서버/클라이언트 공통)
+
+    수신 윈도는 받는 쪽이 정하므로 업로드는 서버, 다운로드는 클라이언트 옵션이 처리량을 좌우합니다.
+    stream_window가 0이면 gRPC 기본 윈도를 사용합니다.
+    """
+    options = [
+        ("grpc.max_send_message_length", max_message_size),
+        ("grpc.max_receive_message_length", max_message_size),
+        ("grpc.http2.bdp_probe", int(bdp_probe)),
+    ]
+    if stream_window:
+        options.append(("grpc.http2.lookahead_bytes", stream_window))
+    return options
@@ -0,0 +1,250 @@
+import os
+import secrets
+from email.utils import formatdate, parsedate_to_datetime
+from functools import partial
+from typing import Iterator, List, Mapping, Optional, Tuple, Union
+
+import anyio
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+# 한 요청에서 허용하는 최대 범위 수 (작은 범위를 잔뜩 요청하는 남용 방지)
+MAX_RANGES = 16
+
+# ASGI 서버가 지원하면 os.sendfile로 파일을 그대로 소켓에 보내는 확장
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+# (시작, 끝) 바이트 위치, 끝 포함
+ByteRange = Tuple[int, int]
+# 응답 본문 구성 요소: 그대로 보낼 바이트 또는 파일의 (시작, 길이)
+BodyPart = Union[bytes, Tuple[int, int]]
+
+
+class RangeNotSatisfiable(Exception):
+    """요청한 범위가 파일 크기를 벗어남 (416)"""
+
+
+def make_etag(stat: os.stat_result) -> str:
+    """수정 시각과 크기로 만든 ETag (파일 내용을 읽지 않음)"""
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def parse_range_header(header: str, size: int) -> Optional[List[ByteRange]]:
+    """Range 헤더를 정렬/병합된 (시작, 끝) 목록으로 변환
+
+    형식이 잘못되었거나 bytes 단위가 아니면 None(범위 무시 후 전체 응답),
+    모든 범위가 파일 밖이면 RangeNotSatisfiable을 던집니다.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+
+    ranges: List[ByteRange] = []
+    specs = spec.split(",")
+    if len(specs) > MAX_RANGES:
+        return None
+    for item in specs:
+        start_text, sep, end_text = item.strip().partition("-")
+        if not sep:
+            return None
+        try:
+            if not start_text:
+                # 접미사 범위: 마지막 N바이트
+                length = int(end_text)
+                if length <= 0:
+                    continue
+                start, end = max(0, size - length), size - 1
+            else:
+                start = int(start_text)
+                if end_text and int(end_text) < start:
+                    return None
+                end = min(int(end_text), size - 1) if end_text else size - 1
+        except ValueError:
+            return None
+        if start < size:
+            ranges.append((start, end))
+
+    if not ranges:
+        raise RangeNotSatisfiable()
+
+    # 겹치거나 맞닿은 범위는 하나로 합침
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def is_not_modified(headers: Mapping[str, str], etag: str, stat: os.stat_result) -> bool:
+    """조건부 요청(If-None-Match, If-Modified-Since)이 304로 응답할 대상인지 확인"""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(stat.st_mtime) <= since
+    return False
+
+
+def range_still_valid(headers: Mapping[str, str], etag: str, stat: os.stat_result) -> bool:
+    """If-Range가 없거나 현재 파일과 일치하면 True (다르면 범위를 무시하고 전체 응답)"""
+    if_range = headers.get("if-range")
+    if not if_range:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('"'):
+        return if_range == etag
+    try:
+        return int(stat.st_mtime) <= parsedate_to_datetime(if_range).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+class VideoFileResponse(Response):
+    """Range/조건부 요청을 지원하는 파일 응답
+
+    - Range가 없으면 200 전체, 범위 하나면 206, 여러 개면 206 multipart/byteranges
+    - 범위가 파일 밖이면 416, ETag/Last-Modified가 일치하면 304
+    - ASGI 서버가 `http.response.zerocopysend` 확장을 지원하면 파일 구간을 os.sendfile로
+      커널에서 바로 보내고, 아니면 chunk_size 단위로 스레드에서 os.pread로 읽어 보냅니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        request_headers: Mapping[str, str],
+        media_type: str = "video/mp4",
+        chunk_size: int = 1024 * 1024,
+        method: str = "GET",
+    ):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.media_type = media_type
+        self.background = None
+        self.send_body = method.upper() != "HEAD"
+
+        stat = os.stat(path)
+        etag = make_etag(stat)
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": etag,
+            "last-modified": formatdate(stat.st_mtime, usegmt=True),
+        }
+        self.parts: List[BodyPart] = []
+
+        if is_not_modified(request_headers, etag, stat):
+            self.status_code = 304
+            self.init_headers(headers)
+            return
+
+        ranges = None
+        range_header = request_headers.get("range")
+        if range_header and range_still_valid(request_headers, etag, stat):
+            try:
+                ranges = parse_range_header(range_header, stat.st_size)
+            except RangeNotSatisfiable:
+                self.status_code = 416
+                headers["content-range"] = f"bytes */{stat.st_size}"
+                headers["content-length"] = "0"
+                self.init_headers(headers)
+                return
+
+        if ranges is None:
+            self.status_code = 200
+            self.parts = [(0, stat.st_size)]
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.status_code = 206
+            headers["content-range"] = f"bytes {start}-{end}/{stat.st_size}"
+            self.parts = [(start, end - start + 1)]
+        else:
+            self.status_code = 206
+            boundary = secrets.token_hex(12)
+            self.media_type = f"multipart/byteranges; boundary={boundary}"
+            for start, end in ranges:
+                self.parts.append(
+                    (
+                        f"--{boundary}\r\nContent-Type: {media_type}\r\n"
+                        f"Content-Range: bytes {start}-{end}/{stat.st_size}\r\n\r\n"
+                    ).encode()
+                )
+                self.parts.append((start, end - start + 1))
+                self.parts.append(b"\r\n")
+            self.parts.append(f"--{boundary}--\r\n".encode())
+
+        headers["content-length"] = str(
+            sum(len(part) if isinstance(part, bytes) else part[1] for part in self.parts)
+        )
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers}
+        )
+        if not self.send_body or not self.parts:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        zerocopy = ZEROCOPY_EXTENSION in scope.get("extensions", {})
+        # 클라이언트가 끊으면 남은 파일을 읽지 않도록 전송을 취소
+        async with anyio.create_task_group() as task_group:
+
+            async def wrap(func) -> None:
+                await func()
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(wrap, partial(self._send_parts, send, zerocopy))
+            await wrap(partial(self._listen_for_disconnect, receive))
+
+    async def _send_parts(self, send: Send, zerocopy: bool) -> None:
+        """본문 구성 요소를 순서대로 전송"""
+        with open(self.path, "rb") as file:
+            for part in self.parts:
+                if isinstance(part, bytes):
+                    await send({"type": "http.response.body", "body": part, "more_body": True})
+                    continue
+                offset, count = part
+                if zerocopy:
+                    await send(
+                        {
+                            "type": ZEROCOPY_EXTENSION,
+                            "file": file,
+                            "offset": offset,
+                            "count": count,
+                            "more_body": True,
+                        }
+                    )
+                    continue
+                for chunk_offset, chunk_size in self._chunks(offset, count):
+                    chunk = await anyio.to_thread.run_sync(
+                        os.pread, file.fileno(), chunk_size, chunk_offset
+                    )
+                    if not chunk:
+                        # 전송 중 파일이 줄어든 경우 (Content-Length를 채울 수 없음)
+                        raise RuntimeError(f"File shrank while streaming: {self.path}")
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    def _chunks(self, offset: int, count: int) -> Iterator[Tuple[int, int]]:
+        """파일 구간을 chunk_size 단위 (위치, 길이)로 나눔"""
+        end = offset + count
+        while offset < end:
+            size = min(self.chunk_size, end - offset)
+            yield offset, size
+            offset += size
+
+    @staticmethod
+    async def _listen_for_disconnect(receive: Receive) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
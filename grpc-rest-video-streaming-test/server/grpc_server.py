@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import os
+import sys
+from typing import AsyncIterator, Optional, Tuple
+
+import anyio
+import grpc
+
+from video_storage import InvalidVideoName, UploadTooLarge, VideoStorage
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "common"))
+
+from grpc_stubs import channel_options, load_stubs  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# gRPC 포트 (server.py에서 0이면 REST 서버만 실행)
+GRPC_PORT = int(os.getenv("GRPC_PORT", "50051"))
+
+# DownloadVideo 기본 청크 크기와 메시지 최대 크기 (클라이언트가 요청한 청크 크기는 최대 크기로 제한)
+GRPC_CHUNK_SIZE = int(os.getenv("GRPC_CHUNK_SIZE", str(1024 * 1024)))
+GRPC_MAX_MESSAGE_SIZE = int(os.getenv("GRPC_MAX_MESSAGE_SIZE", str(16 * 1024 * 1024)))
+
+# HTTP/2 흐름 제어: 스트림당 수신 윈도 (0이면 gRPC 기본값), BDP 기반 윈도 자동 조정, 연결당 동시 스트림 수
+GRPC_STREAM_WINDOW = int(os.getenv("GRPC_STREAM_WINDOW", "0"))
+GRPC_BDP_PROBE = os.getenv("GRPC_BDP_PROBE", "1") == "1"
+GRPC_MAX_CONCURRENT_STREAMS = int(os.getenv("GRPC_MAX_CONCURRENT_STREAMS", "100"))
+
+# 업로드 데이터를 디스크에 한 번에 쓰는 크기
+GRPC_UPLOAD_BUFFER_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+
+# 종료 시 진행 중인 RPC를 기다리는 시간 (초)
+GRPC_SHUTDOWN_GRACE = float(os.getenv("GRPC_SHUTDOWN_GRACE", "10"))
+
+
+video_service_pb2, video_service_pb2_grpc = load_stubs()
+
+
+def _open_for_read(path: str) -> Tuple[int, int]:
+    """읽기용 파일 디스크립터와 파일 크기 (스레드에서 실행)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return fd, os.fstat(fd).st_size
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+class VideoService(video_service_pb2_grpc.VideoServiceServicer):
+    """proto/video_service.proto의 VideoService 구현 (REST 서버와 같은 VideoStorage 사용)
+
+    파일 I/O는 스레드로 넘기고, DownloadVideo는 async generator로 청크를 내보내므로 클라이언트의
+    흐름 제어 윈도가 찰 때마다 다음 청크를 읽지 않고 기다립니다. 따라서 느린 클라이언트가 있어도
+    스트림당 메모리는 청크 몇 개 크기로 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        storage: VideoStorage,
+        chunk_size: int = GRPC_CHUNK_SIZE,
+        max_chunk_size: int = GRPC_MAX_MESSAGE_SIZE,
+        upload_buffer_size: int = GRPC_UPLOAD_BUFFER_SIZE,
+    ):
+        self.storage = storage
+        self.chunk_size = chunk_size
+        # 메시지 최대 크기 안에 파일명 등 필드가 들어갈 여유를 남김
+        self.max_chunk_size = max_chunk_size - 64 * 1024
+        self.upload_buffer_size = upload_buffer_size
+
+    async def UploadVideo(
+        self, request_iterator: AsyncIterator, context: grpc.aio.ServicerContext
+    ):
+        """첫 청크의 filename으로 저장을 시작하고, 받은 데이터를 임시 파일에 써서 원자적으로 저장"""
+        writer = None
+        pending = bytearray()
+        try:
+            async for chunk in request_iterator:
+                if writer is None:
+                    writer = self.storage.open_writer(chunk.filename)
+                pending += chunk.content
+                if len(pending) >= self.upload_buffer_size:
+                    data = bytes(pending)
+                    pending.clear()
+                    await anyio.to_thread.run_sync(writer.write, data)
+            if writer is None:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Empty upload stream")
+            if pending:
+                await anyio.to_thread.run_sync(writer.write, bytes(pending))
+            stored = await anyio.to_thread.run_sync(writer.commit)
+        except InvalidVideoName as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except UploadTooLarge as e:
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+        finally:
+            if writer is not None:
+                writer.abort()
+
+        logger.info(f"Successfully uploaded video over gRPC: {stored.filename} ({stored.size} bytes)")
+        return video_service_pb2.UploadResponse(
+            message=f"Uploaded {stored.filename}",
+            success=True,
+            size=stored.size,
+            sha256=stored.sha256,
+        )
+
+    async def DownloadVideo(self, request, context: grpc.aio.ServicerContext):
+        """파일을 chunk_size 단위로 읽어 스트리밍 (첫 청크에만 filename 포함)"""
+        if request.chunk_size < 0:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"chunk_size must not be negative (got {request.chunk_size})",
+            )
+        try:
+            path = self.storage.path_for(request.filename)
+            fd, size = await anyio.to_thread.run_sync(_open_for_read, path)
+        except (InvalidVideoName, FileNotFoundError):
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND, f"Video '{request.filename}' not found"
+            )
+
+        chunk_size = min(request.chunk_size or self.chunk_size, self.max_chunk_size)
+        try:
+            offset = 0
+            while offset < size:
+                data = await anyio.to_thread.run_sync(os.pread, fd, chunk_size, offset)
+                if not data:
+                    break
+                yield video_service_pb2.VideoChunk(
+                    content=data, filename=request.filename if offset == 0 else ""
+                )
+                offset += len(data)
+        finally:
+            os.close(fd)
+
+    async def ListVideos(self, request, context: grpc.aio.ServicerContext):
+        """저장된 비디오 파일명 목록"""
+        return video_service_pb2.VideoList(filenames=self.storage.list_videos())
+
+
+async def start_grpc_server(
+    storage: VideoStorage,
+    address: str = f"[::]:{GRPC_PORT}",
+    max_concurrent_streams: int = GRPC_MAX_CONCURRENT_STREAMS,
+    maximum_concurrent_rpcs: Optional[int] = None,
+) -> grpc.aio.Server:
+    """현재 이벤트 루프에서 gRPC 서버 시작"""
+    server = grpc.aio.server(
+        options=channel_options(GRPC_MAX_MESSAGE_SIZE, GRPC_STREAM_WINDOW, GRPC_BDP_PROBE)
+        + [("grpc.max_concurrent_streams", max_concurrent_streams)],
+        maximum_concurrent_rpcs=maximum_concurrent_rpcs,
+    )
+    video_service_pb2_grpc.add_VideoServiceServicer_to_server(VideoService(storage), server)
+    server.add_insecure_port(address)
+    await server.start()
+    logger.info(f"gRPC server listening on {address}")
+    return server
+
+
+async def serve() -> None:
+    """gRPC 서버만 단독 실행 (REST와 자원을 나누지 않고 비교할 때 사용)"""
+    storage = VideoStorage(
+        "uploads", max_upload_size=int(os.getenv("MAX_UPLOAD_SIZE", str(10 * 1024 ** 3)))
+    )
+    server = await start_grpc_server(storage)
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(GRPC_SHUTDOWN_GRACE)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(serve())
@@ -0,0 +1,262 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+import anyio
+
+from video_storage import StoredVideo, UploadTooLarge, VideoStorage
+
+# 세션 파일을 두는 숨김 디렉토리 (UPLOAD_DIR 아래, 완료 시 같은 파일시스템 안에서 이동)
+SESSIONS_DIR = ".sessions"
+
+
+class UploadSessionNotFound(Exception):
+    """세션이 없거나 만료됨 (404)"""
+
+
+class InvalidChunk(ValueError):
+    """청크 위치/길이가 세션 크기를 벗어남 (400)"""
+
+
+class UploadIncomplete(Exception):
+    """아직 받지 못한 구간이 있어 완료할 수 없음 (409)"""
+
+
+class ChecksumMismatch(Exception):
+    """완료된 파일의 SHA-256이 세션 생성 시 받은 값과 다름 (422)"""
+
+
+@dataclass
+class UploadSession:
+    """재개 가능한 업로드 세션 (받은 구간은 겹치지 않게 합친 [시작, 끝) 목록)"""
+    upload_id: str
+    filename: str
+    size: int
+    sha256: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    ranges: List[List[int]] = field(default_factory=list)
+
+    @property
+    def offset(self) -> int:
+        """0부터 빈틈없이 받은 바이트 수 (순차 업로드의 재개 위치)"""
+        if self.ranges and self.ranges[0][0] == 0:
+            return self.ranges[0][1]
+        return 0
+
+    @property
+    def received(self) -> int:
+        """받은 바이트 수 (병렬 업로드 중에는 offset보다 클 수 있음)"""
+        return sum(end - start for start, end in self.ranges)
+
+    def is_complete(self) -> bool:
+        """모든 바이트를 받았는지 확인"""
+        return self.offset == self.size
+
+    def add_range(self, start: int, end: int) -> None:
+        """받은 구간 추가 (겹치거나 맞닿은 구간은 합침)"""
+        if end <= start:
+            return
+        merged: List[List[int]] = []
+        for current in sorted(self.ranges + [[start, end]]):
+            if merged and current[0] <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], current[1])
+            else:
+                merged.append(list(current))
+        self.ranges = merged
+
+
+class ResumableUploadStore:
+    """디스크에 상태를 남기는 재개 가능한 업로드
+
+    세션마다 `<root>/.sessions/<id>.json`(세션 정보와 받은 구간)과 `<id>.part`(최종 크기로
+    미리 만든 파일)를 둡니다. 청크는 지정한 위치에 os.pwrite로 쓰므로 순서와 무관하게 여러
+    청크를 동시에 받을 수 있고, 청크를 디스크에 기록(fdatasync)한 뒤에만 받은 구간으로 남기므로
+    서버가 재시작되어도 이미 받은 구간은 다시 보낼 필요가 없습니다. 완료하면 SHA-256을 계산해
+    UPLOAD_DIR로 원자적으로 옮깁니다. session_ttl 동안 갱신이 없던 세션은 새 세션을 만들 때 지웁니다.
+    세션 정보 갱신은 프로세스 안의 잠금으로 직렬화하므로 서버 프로세스 하나를 전제로 합니다.
+    세션 파일 읽기/쓰기(fsync 포함)는 모두 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, storage: VideoStorage, session_ttl: float = 86400):
+        self.storage = storage
+        self.session_ttl = session_ttl
+        self.sessions_dir = os.path.join(storage.root, SESSIONS_DIR)
+        os.makedirs(self.sessions_dir, exist_ok=True)
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def create(
+        self, filename: str, size: int, sha256: Optional[str] = None
+    ) -> UploadSession:
+        """세션 생성 (파일명/크기는 이 시점에 검증)"""
+        self.storage.path_for(filename)
+        if size < 0:
+            raise InvalidChunk("Size must not be negative")
+        if self.storage.max_upload_size and size > self.storage.max_upload_size:
+            raise UploadTooLarge(self.storage.max_upload_size)
+        for expired_id in await anyio.to_thread.run_sync(self._sweep_expired):
+            self._locks.pop(expired_id, None)
+
+        session = UploadSession(
+            upload_id=uuid.uuid4().hex,
+            filename=filename,
+            size=size,
+            sha256=sha256.lower() if sha256 else None,
+        )
+        await anyio.to_thread.run_sync(self._create_files, session)
+        return session
+
+    async def get(self, upload_id: str) -> UploadSession:
+        """세션 조회"""
+        return await anyio.to_thread.run_sync(self._load, upload_id)
+
+    async def write_chunk(
+        self,
+        upload_id: str,
+        offset: int,
+        chunks: AsyncIterator[bytes],
+        buffer_size: int = 1024 * 1024,
+    ) -> UploadSession:
+        """offset부터 본문 스트림을 기록하고 받은 구간에 추가 (같은 구간을 다시 보내도 안전)"""
+        session = await anyio.to_thread.run_sync(self._load, upload_id)
+        if offset < 0 or offset > session.size:
+            raise InvalidChunk(f"Offset {offset} is outside 0..{session.size}")
+
+        position = offset
+        pending = bytearray()
+        fd = os.open(self._part_path(upload_id), os.O_WRONLY)
+        try:
+            async for data in chunks:
+                if position + len(pending) + len(data) > session.size:
+                    raise InvalidChunk("Chunk extends past the declared upload size")
+                pending += data
+                if len(pending) >= buffer_size:
+                    position += await anyio.to_thread.run_sync(
+                        _pwrite_all, fd, bytes(pending), position
+                    )
+                    pending.clear()
+            if pending:
+                position += await anyio.to_thread.run_sync(
+                    _pwrite_all, fd, bytes(pending), position
+                )
+            await anyio.to_thread.run_sync(os.fdatasync, fd)
+        finally:
+            os.close(fd)
+
+        async with self._lock(upload_id):
+            return await anyio.to_thread.run_sync(self._add_range, upload_id, offset, position)
+
+    async def complete(self, upload_id: str) -> StoredVideo:
+        """모든 구간을 받은 세션을 검증하고 저장 경로로 이동"""
+        async with self._lock(upload_id):
+            session = await anyio.to_thread.run_sync(self._load, upload_id)
+            if not session.is_complete():
+                raise UploadIncomplete(
+                    f"Upload is incomplete: {session.received}/{session.size} bytes received"
+                )
+            part_path = self._part_path(upload_id)
+            digest = await anyio.to_thread.run_sync(_sha256_file, part_path)
+            if session.sha256 and digest != session.sha256:
+                await anyio.to_thread.run_sync(self._remove, upload_id)
+                raise ChecksumMismatch(
+                    f"SHA-256 mismatch: expected {session.sha256}, got {digest}"
+                )
+            path = self.storage.path_for(session.filename)
+            await anyio.to_thread.run_sync(self.storage.install, part_path, path)
+            await anyio.to_thread.run_sync(self._remove, upload_id)
+        self._locks.pop(upload_id, None)
+        return StoredVideo(filename=session.filename, path=path, size=session.size, sha256=digest)
+
+    async def abort(self, upload_id: str) -> None:
+        """세션과 받은 데이터 삭제"""
+        async with self._lock(upload_id):
+            await anyio.to_thread.run_sync(self._load, upload_id)
+            await anyio.to_thread.run_sync(self._remove, upload_id)
+        self._locks.pop(upload_id, None)
+
+    def _lock(self, upload_id: str) -> asyncio.Lock:
+        return self._locks.setdefault(upload_id, asyncio.Lock())
+
+    def _session_path(self, upload_id: str) -> str:
+        return os.path.join(self.sessions_dir, f"{upload_id}.json")
+
+    def _part_path(self, upload_id: str) -> str:
+        return os.path.join(self.sessions_dir, f"{upload_id}.part")
+
+    def _load(self, upload_id: str) -> UploadSession:
+        # 경로로 쓰이므로 발급한 형식(uuid hex)만 허용
+        try:
+            if uuid.UUID(hex=upload_id).hex != upload_id:
+                raise ValueError(upload_id)
+            with open(self._session_path(upload_id)) as f:
+                return UploadSession(**json.load(f))
+        except (ValueError, FileNotFoundError):
+            raise UploadSessionNotFound(f"Upload session '{upload_id}' not found") from None
+
+    def _save(self, session: UploadSession) -> None:
+        """세션 정보를 임시 파일에 쓰고 교체 (중간에 죽어도 이전 상태가 남음)"""
+        path = self._session_path(session.upload_id)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(asdict(session), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def _create_files(self, session: UploadSession) -> None:
+        """최종 크기의 sparse 파일을 미리 만들고(청크를 제자리에 씀) 세션 정보 저장"""
+        with open(self._part_path(session.upload_id), "wb") as part:
+            part.truncate(session.size)
+        self._save(session)
+
+    def _add_range(self, upload_id: str, start: int, end: int) -> UploadSession:
+        """다른 청크가 그 사이에 기록한 구간을 잃지 않도록 최신 상태를 다시 읽어 구간 추가"""
+        session = self._load(upload_id)
+        session.add_range(start, end)
+        self._save(session)
+        return session
+
+    def _remove(self, upload_id: str) -> None:
+        for path in (self._part_path(upload_id), self._session_path(upload_id)):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def _sweep_expired(self) -> List[str]:
+        """session_ttl 동안 갱신되지 않은 세션 삭제 (삭제한 세션 ID 반환)"""
+        cutoff = time.time() - self.session_ttl
+        removed = []
+        for name in os.listdir(self.sessions_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                if os.path.getmtime(os.path.join(self.sessions_dir, name)) < cutoff:
+                    self._remove(name[:-len(".json")])
+                    removed.append(name[:-len(".json")])
+            except FileNotFoundError:
+                pass
+        return removed
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> int:
+    """data 전체를 offset 위치에 기록 (기록한 바이트 수 반환)"""
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+    return len(data)
+
+
+def _sha256_file(path: str, block_size: int = 1024 * 1024) -> str:
+    """파일 전체의 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
@@ -1,22 +1,44 @@
-from fastapi import FastAPI, UploadFile, HTTPException
-from fastapi.responses import StreamingResponse
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict
-import aiofiles
+from pydantic import BaseModel, Field
+from typing import List, Dict, Optional, Union
 import os
 import logging
 
+from file_response import VideoFileResponse
+from grpc_server import GRPC_PORT, GRPC_SHUTDOWN_GRACE, start_grpc_server
+from resumable_upload import (
+    ChecksumMismatch,
+    InvalidChunk,
+    ResumableUploadStore,
+    UploadIncomplete,
+    UploadSession,
+    UploadSessionNotFound,
+)
+from streaming_upload import receive_upload
+from video_storage import InvalidVideoName, UploadTooLarge, VideoStorage
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """같은 이벤트 루프에서 gRPC 서버를 함께 실행 (GRPC_PORT=0이면 REST 서버만 실행)"""
+    grpc_server = await start_grpc_server(storage, f"[::]:{GRPC_PORT}") if GRPC_PORT else None
+    yield
+    if grpc_server is not None:
+        await grpc_server.stop(GRPC_SHUTDOWN_GRACE)
+
 # FastAPI 인스턴스 생성 및 메타데이터 설정
 app = FastAPI(
     title="Video Streaming Server",
     description="REST API server for video streaming with FastAPI",
     version="1.0.0",
     docs_url="/docs",   # Swagger UI endpoint
-    redoc_url="/redoc"  # ReDoc endpoint
+    redoc_url="/redoc",  # ReDoc endpoint
+    lifespan=lifespan
 )
 
 # CORS 미들웨어 추가
@@ -30,7 +52,48 @@ app.add_middleware(
 
 # 비디오 파일을 저장할 디렉토리
 UPLOAD_DIR = "uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+# 업로드 최대 크기 (바이트, 0이면 제한 없음)와 디스크에 한 번에 쓰는 크기
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", str(10 * 1024 ** 3)))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+
+storage = VideoStorage(UPLOAD_DIR, max_upload_size=MAX_UPLOAD_SIZE)
+
+# 재개 가능한 업로드 세션 보관 시간 (초, 마지막 청크 이후 기준)
+UPLOAD_SESSION_TTL = int(os.getenv("UPLOAD_SESSION_TTL", str(24 * 60 * 60)))
+
+resumable_uploads = ResumableUploadStore(storage, session_ttl=UPLOAD_SESSION_TTL)
+
+# 스트리밍 시 한 번에 읽어 보내는 크기 (uvicorn은 zerocopysend 확장이 없어 항상 이 크기로 읽음)
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", str(1024 * 1024)))
+
+# 확장자별 Content-Type
+VIDEO_MEDIA_TYPES = {
+    ".mp4": "video/mp4",
+    ".avi": "video/x-msvideo",
+    ".mkv": "video/x-matroska",
+}
+
+
+class CreateUploadRequest(BaseModel):
+    """재개 가능한 업로드 세션 생성 요청"""
+    filename: str = Field(..., description="Video file name (.mp4, .avi, .mkv)")
+    size: int = Field(..., ge=0, description="Total file size in bytes")
+    sha256: Optional[str] = Field(
+        None, pattern="^[0-9a-fA-F]{64}$", description="Expected SHA-256, checked on completion"
+    )
+
+
+def upload_session_status(session: UploadSession) -> dict:
+    """세션 상태 응답 본문"""
+    return {
+        "upload_id": session.upload_id,
+        "filename": session.filename,
+        "size": session.size,
+        "offset": session.offset,
+        "received": session.received,
+        "ranges": session.ranges,
+    }
 
 @app.get("/", 
          response_model=Dict[str, str],
@@ -43,38 +106,190 @@ async def read_root():
     return {"message": "Video Streaming Server"}
 
 @app.post("/upload",
-          response_model=Dict[str, str],
+          response_model=Dict[str, Union[str, int]],
           summary="Upload a video file",
-          description="Upload a video file to the server")
-async def upload_video(file: UploadFile):
+          description="Upload a video file to the server. The multipart body is streamed to disk "
+                      "in fixed-size chunks, so memory use does not grow with the file size",
+          openapi_extra={
+              "requestBody": {
+                  "required": True,
+                  "content": {
+                      "multipart/form-data": {
+                          "schema": {
+                              "type": "object",
+                              "properties": {"file": {"type": "string", "format": "binary"}},
+                              "required": ["file"],
+                          }
+                      }
+                  },
+              }
+          })
+async def upload_video(request: Request):
     """
     비디오 파일 업로드 엔드포인트
 
     - **file**: 업로드할 비디오 파일 (지원 형식: .mp4, .avi, .mkv)
 
+    본문을 받는 대로 임시 파일에 UPLOAD_CHUNK_SIZE 단위로 쓰면서 SHA-256을 계산하고,
+    다 받으면 UPLOAD_DIR로 옮깁니다. MAX_UPLOAD_SIZE를 넘으면 413으로 중단합니다.
+
     Returns:
         - **filename**: 업로드된 파일명
         - **status**: 업로드 상태
+        - **size**: 저장된 바이트 수
+        - **sha256**: 파일 SHA-256 (16진수)
     """
-    if not file.filename.endswith(('.mp4', '.avi', '.mkv')):
-        raise HTTPException(
-            status_code=400, 
-            detail="Only .mp4, .avi, and .mkv files are supported"
+    try:
+        stored = await receive_upload(request, storage, chunk_size=UPLOAD_CHUNK_SIZE)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error uploading file: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    logger.info(f"Successfully uploaded video: {stored.filename} ({stored.size} bytes)")
+    return {
+        "filename": stored.filename,
+        "status": "uploaded",
+        "size": stored.size,
+        "sha256": stored.sha256,
+    }
+
+@app.post("/uploads",
+          status_code=201,
+          summary="Create a resumable upload",
+          description="Start a resumable upload session. Chunks are then sent with "
+                      "PUT /uploads/{upload_id}?offset=N in any order and in parallel")
+async def create_upload(body: CreateUploadRequest, response: Response):
+    """
+    재개 가능한 업로드 세션 생성
+
+    - **filename**: 저장할 파일명 (지원 형식: .mp4, .avi, .mkv)
+    - **size**: 전체 파일 크기 (바이트)
+    - **sha256**: (선택) 완료 시 확인할 SHA-256
+
+    Returns:
+        - **upload_id**와 세션 상태 (Location 헤더에 세션 URL)
+    """
+    try:
+        session = await resumable_uploads.create(body.filename, body.size, body.sha256)
+    except (InvalidVideoName, InvalidChunk) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    logger.info(f"Created upload session {session.upload_id} for {session.filename}")
+    response.headers["Location"] = f"/uploads/{session.upload_id}"
+    return upload_session_status(session)
+
+@app.put("/uploads/{upload_id}",
+         summary="Upload a chunk",
+         description="Write the raw request body at the given byte offset. Re-sending a chunk "
+                     "is safe, so failed chunks can simply be retried",
+         openapi_extra={
+             "requestBody": {
+                 "required": True,
+                 "content": {
+                     "application/octet-stream": {"schema": {"type": "string", "format": "binary"}}
+                 },
+             }
+         })
+async def upload_chunk(
+    upload_id: str, request: Request, response: Response, offset: int = Query(..., ge=0)
+):
+    """
+    청크 업로드
+
+    - **upload_id**: 세션 ID
+    - **offset**: 요청 본문을 쓸 파일 내 위치 (바이트)
+
+    본문을 받는 대로 UPLOAD_CHUNK_SIZE 단위로 세션 파일의 해당 위치에 쓰고, 디스크에 기록한
+    뒤에 받은 구간으로 남깁니다.
+
+    Returns:
+        - 세션 상태 (Upload-Offset 헤더에 0부터 이어서 받은 바이트 수)
+    """
+    try:
+        session = await resumable_uploads.write_chunk(
+            upload_id, offset, request.stream(), buffer_size=UPLOAD_CHUNK_SIZE
         )
+    except UploadSessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidChunk as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response.headers["Upload-Offset"] = str(session.offset)
+    return upload_session_status(session)
 
+@app.api_route("/uploads/{upload_id}",
+               methods=["GET", "HEAD"],
+               summary="Get upload status",
+               description="Returns the committed offset and the byte ranges already received, "
+                           "so an interrupted upload can resume with only the missing chunks")
+async def get_upload(upload_id: str, response: Response):
+    """
+    업로드 세션 상태 조회
+
+    Returns:
+        - **offset**: 0부터 빈틈없이 받은 바이트 수 (Upload-Offset 헤더와 같음)
+        - **received**: 받은 전체 바이트 수
+        - **ranges**: 받은 구간 목록 ([시작, 끝))
+    """
     try:
-        file_path = os.path.join(UPLOAD_DIR, file.filename)
-        async with aiofiles.open(file_path, 'wb') as out_file:
-            content = await file.read()
-            await out_file.write(content)
-        
-        logger.info(f"Successfully uploaded video: {file.filename}")
-        return {"filename": file.filename, "status": "uploaded"}
-    
+        session = await resumable_uploads.get(upload_id)
+    except UploadSessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    response.headers["Upload-Offset"] = str(session.offset)
+    response.headers["Upload-Length"] = str(session.size)
+    return upload_session_status(session)
+
+@app.post("/uploads/{upload_id}/complete",
+          response_model=Dict[str, Union[str, int]],
+          summary="Finalize a resumable upload",
+          description="Verify that every byte was received (and the SHA-256, if given) and "
+                      "move the file into the video directory")
+async def complete_upload(upload_id: str):
+    """
+    재개 가능한 업로드 완료
+
+    Returns:
+        - /upload와 같은 형식 (**filename**, **status**, **size**, **sha256**)
+    """
+    try:
+        stored = await resumable_uploads.complete(upload_id)
+    except UploadSessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except UploadIncomplete as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ChecksumMismatch as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
-        logger.error(f"Error uploading file: {str(e)}")
+        logger.error(f"Error completing upload: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    logger.info(f"Successfully uploaded video: {stored.filename} ({stored.size} bytes)")
+    return {
+        "filename": stored.filename,
+        "status": "uploaded",
+        "size": stored.size,
+        "sha256": stored.sha256,
+    }
+
+@app.delete("/uploads/{upload_id}",
+            status_code=204,
+            summary="Abort a resumable upload",
+            description="Delete the upload session and the data received so far")
+async def abort_upload(upload_id: str):
+    """
+    재개 가능한 업로드 취소
+    """
+    try:
+        await resumable_uploads.abort(upload_id)
+    except UploadSessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return Response(status_code=204)
+
 @app.get("/videos",
          response_model=Dict[str, List[str]],
          summary="List all videos",
@@ -87,51 +302,54 @@ async def list_videos():
         - **videos**: 사용 가능한 비디오 파일 목록
     """
     try:
-        videos = [f for f in os.listdir(UPLOAD_DIR) if f.endswith(('.mp4', '.avi', '.mkv'))]
-        return {"videos": videos}
+        return {"videos": storage.list_videos()}
     except Exception as e:
         logger.error(f"Error listing videos: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/stream/{video_name}",
-         response_class=StreamingResponse,
-         summary="Stream a video",
-         description="Stream a video file from the server")
-async def stream_video(video_name: str):
+@app.api_route("/stream/{video_name}",
+               methods=["GET", "HEAD"],
+               response_class=VideoFileResponse,
+               summary="Stream a video",
+               description="Stream a video file with HTTP Range (206 Partial Content) "
+                           "and ETag/Last-Modified conditional requests (304)")
+async def stream_video(video_name: str, request: Request):
     """
     비디오 스트리밍 엔드포인트
 
     - **video_name**: 스트리밍할 비디오 파일명
+    - **Range** 헤더: `bytes=0-1023`, `bytes=-500`, `bytes=0-99,200-299` (여러 범위는 multipart/byteranges)
+    - **If-None-Match** / **If-Modified-Since**: 변경되지 않았으면 304
+    - **If-Range**: 파일이 바뀌었으면 범위를 무시하고 전체 전송
 
     Returns:
-        - Video stream in chunks
+        - 200 전체 파일, 206 요청한 범위, 304 변경 없음, 416 범위 오류
     """
-    video_path = os.path.join(UPLOAD_DIR, video_name)
+    try:
+        video_path = storage.path_for(video_name)
+    except InvalidVideoName:
+        video_path = None
     
-    if not os.path.exists(video_path):
+    if video_path is None or not os.path.isfile(video_path):
         raise HTTPException(
             status_code=404, 
             detail=f"Video '{video_name}' not found"
         )
     
     try:
-        return StreamingResponse(
-            video_streamer(video_path),
-            media_type="video/mp4"
+        return VideoFileResponse(
+            video_path,
+            request.headers,
+            media_type=VIDEO_MEDIA_TYPES.get(
+                os.path.splitext(video_path)[1].lower(), "video/mp4"
+            ),
+            chunk_size=STREAM_CHUNK_SIZE,
+            method=request.method,
         )
-    except Exception as e:
+    except OSError as e:
         logger.error(f"Error streaming video: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-async def video_streamer(video_path: str):
-    """비디오 파일을 청크 단위로 스트리밍하는 제너레이터 함수"""
-    async with aiofiles.open(video_path, mode='rb') as file:
-        while True:
-            chunk = await file.read(8192)
-            if not chunk:
-                break
-            yield chunk
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
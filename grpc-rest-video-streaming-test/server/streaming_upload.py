@@ -0,0 +1,117 @@
+from typing import Dict, Optional
+
+import anyio
+import multipart
+from fastapi import HTTPException, Request
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import parse_options_header
+
+from video_storage import InvalidVideoName, StoredVideo, UploadTooLarge, UploadWriter, VideoStorage
+
+
+class _MultipartState:
+    """파서 콜백이 채우는 현재 파트 상태와 아직 디스크에 쓰지 않은 파일 데이터"""
+
+    def __init__(self, storage: VideoStorage, field_name: str):
+        self.storage = storage
+        self.field_name = field_name
+        self.headers: Dict[bytes, bytes] = {}
+        self.header_field = b""
+        self.header_value = b""
+        self.writer: Optional[UploadWriter] = None
+        self.receiving = False
+        self.pending = bytearray()
+
+    def on_part_begin(self) -> None:
+        self.headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self.header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self.headers[self.header_field.lower()] = self.header_value
+        self.header_field = b""
+        self.header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self.headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename")
+        # 첫 번째 파일 필드만 저장하고 나머지 필드는 무시
+        if name == self.field_name and filename is not None and self.writer is None:
+            self.writer = self.storage.open_writer(filename.decode("utf-8", "replace"))
+            self.receiving = True
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self.receiving:
+            self.pending += data[start:end]
+
+    def on_part_end(self) -> None:
+        self.receiving = False
+
+
+async def receive_upload(
+    request: Request, storage: VideoStorage, field_name: str = "file", chunk_size: int = 1 << 20
+) -> StoredVideo:
+    """multipart/form-data 요청 본문을 받는 즉시 파싱해 파일 필드를 저장
+
+    본문 전체나 파일 전체를 메모리/임시 스풀에 올리지 않고, 파일 데이터가 chunk_size만큼
+    모일 때마다 스레드에서 디스크 쓰기와 SHA-256 계산을 합니다. 따라서 요청당 메모리는 업로드
+    크기와 무관하게 chunk_size 정도이며, 최대 크기를 넘으면 받는 도중에 413으로 중단합니다.
+    """
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="Expected multipart/form-data upload")
+    try:
+        content_length = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+    if storage.max_upload_size and content_length > storage.max_upload_size:
+        raise HTTPException(status_code=413, detail=str(UploadTooLarge(storage.max_upload_size)))
+
+    state = _MultipartState(storage, field_name)
+    parser = multipart.MultipartParser(
+        boundary,
+        {
+            "on_part_begin": state.on_part_begin,
+            "on_header_field": state.on_header_field,
+            "on_header_value": state.on_header_value,
+            "on_header_end": state.on_header_end,
+            "on_headers_finished": state.on_headers_finished,
+            "on_part_data": state.on_part_data,
+            "on_part_end": state.on_part_end,
+        },
+    )
+
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if len(state.pending) >= chunk_size:
+                await _flush(state)
+        parser.finalize()
+        if state.writer is None:
+            raise HTTPException(status_code=400, detail=f"Missing file field '{field_name}'")
+        await _flush(state)
+        return await anyio.to_thread.run_sync(state.writer.commit)
+    except MultipartParseError as e:
+        raise HTTPException(status_code=400, detail=f"Malformed multipart body: {e}")
+    except InvalidVideoName as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    finally:
+        if state.writer is not None:
+            state.writer.abort()
+
+
+async def _flush(state: _MultipartState) -> None:
+    """모아 둔 파일 데이터를 스레드에서 디스크에 쓰기"""
+    if not state.pending:
+        return
+    data = bytes(state.pending)
+    state.pending.clear()
+    await anyio.to_thread.run_sync(state.writer.write, data)
@@ -0,0 +1,130 @@
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional
+
+# 지원하는 비디오 확장자
+SUPPORTED_EXTENSIONS = (".mp4", ".avi", ".mkv")
+
+# 업로드 중인 임시 파일 접두사 (목록에 나타나지 않도록 숨김 파일)
+TEMP_PREFIX = ".upload-"
+
+
+class InvalidVideoName(ValueError):
+    """경로가 포함되었거나 지원하지 않는 확장자의 파일명"""
+
+
+class UploadTooLarge(Exception):
+    """업로드 크기가 최대 크기를 넘음"""
+
+    def __init__(self, max_size: int):
+        super().__init__(f"Upload exceeds maximum size of {max_size} bytes")
+        self.max_size = max_size
+
+
+@dataclass
+class StoredVideo:
+    """저장이 끝난 비디오 파일 정보"""
+    filename: str
+    path: str
+    size: int
+    sha256: str
+
+
+class VideoStorage:
+    """비디오 파일 저장소 (REST/gRPC 서버가 같은 디렉토리를 공유)
+
+    업로드는 같은 디렉토리의 숨김 임시 파일에 쓰고, 끝나면 os.replace로 한 번에 바꿔 넣으므로
+    받는 중인 파일이나 중간에 끊긴 파일이 목록/스트리밍에 보이지 않습니다.
+    """
+
+    def __init__(self, root: str, max_upload_size: int = 0):
+        self.root = root
+        self.max_upload_size = max_upload_size
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, filename: str) -> str:
+        """파일명을 저장 경로로 변환 (경로 구분자/지원하지 않는 확장자는 InvalidVideoName)"""
+        if not filename or os.path.basename(filename) != filename or filename.startswith("."):
+            raise InvalidVideoName(f"Invalid video name: {filename!r}")
+        if not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise InvalidVideoName("Only .mp4, .avi, and .mkv files are supported")
+        return os.path.join(self.root, filename)
+
+    def list_videos(self) -> List[str]:
+        """저장된 비디오 파일명 목록"""
+        return [
+            name for name in os.listdir(self.root)
+            if name.lower().endswith(SUPPORTED_EXTENSIONS) and not name.startswith(".")
+        ]
+
+    def open_writer(self, filename: str) -> "UploadWriter":
+        """업로드 파일 쓰기 시작 (파일명은 이 시점에 검증)"""
+        return UploadWriter(self, filename, self.path_for(filename))
+
+    @staticmethod
+    def install(temp_path: str, path: str) -> None:
+        """다 쓴 임시 파일을 저장 경로로 원자적으로 이동 (같은 이름의 파일은 교체)"""
+        # mkstemp는 소유자 전용(0600)으로 만들므로 일반 파일 권한으로 맞춤
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+
+
+class UploadWriter:
+    """임시 파일에 쓰면서 SHA-256을 함께 계산하고, 끝나면 원자적으로 저장 경로에 넣는 쓰기 도구
+
+    write/commit은 블로킹 호출이므로 이벤트 루프에서는 스레드로 넘겨 호출합니다.
+    with 블록을 commit 없이 벗어나면 임시 파일을 지웁니다.
+    """
+
+    def __init__(self, storage: VideoStorage, filename: str, path: str):
+        self._storage = storage
+        self.filename = filename
+        self.path = path
+        self.size = 0
+        self._hash = hashlib.sha256()
+        fd, self._temp_path = tempfile.mkstemp(
+            prefix=TEMP_PREFIX, suffix=".part", dir=storage.root
+        )
+        self._file: Optional[BinaryIO] = os.fdopen(fd, "wb")
+
+    def write(self, data: bytes) -> None:
+        """데이터 추가 (최대 크기를 넘으면 UploadTooLarge)"""
+        max_size = self._storage.max_upload_size
+        if max_size and self.size + len(data) > max_size:
+            raise UploadTooLarge(max_size)
+        self._file.write(data)
+        self._hash.update(data)
+        self.size += len(data)
+
+    def commit(self) -> StoredVideo:
+        """디스크에 기록을 마치고 저장 경로로 이동 (같은 이름의 파일은 교체)"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        try:
+            self._storage.install(self._temp_path, self.path)
+        except OSError:
+            os.unlink(self._temp_path)
+            raise
+        return StoredVideo(
+            filename=self.filename, path=self.path, size=self.size, sha256=self._hash.hexdigest()
+        )
+
+    def abort(self) -> None:
+        """임시 파일 삭제"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            try:
+                os.unlink(self._temp_path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "UploadWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.abort()
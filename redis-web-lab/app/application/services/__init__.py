@@ -1,4 +1,11 @@
 """Application services package"""
-from .push_notification_service import PushNotificationService
+from .push_notification_service import BatchPushResult, PushNotificationService
+from .push_stats_service import PushStatsService
+from .topic_broadcast_service import TopicBroadcastService
 
-__all__ = ["PushNotificationService"]
\ No newline at end of file
+__all__ = [
+    "BatchPushResult",
+    "PushNotificationService",
+    "PushStatsService",
+    "TopicBroadcastService",
+]
@@ -1,15 +1,39 @@
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from app.domain.entities import PushNotification
-from app.domain.repositories import PushNotificationRepository
+from app.domain.entities import PushNotification, PushNotificationPage
+from app.domain.repositories import (
+    PushEventPublisher,
+    PushNotificationRepository,
+    PushStatusPublisher,
+)
+
+
+@dataclass
+class BatchPushResult:
+    """일괄 푸시 생성 항목별 결과"""
+    push_notification: Optional[PushNotification] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """생성 성공 여부"""
+        return self.push_notification is not None
 
 
 class PushNotificationService:
     """푸시 알림 애플리케이션 서비스"""
 
-    def __init__(self, push_repository: PushNotificationRepository):
+    def __init__(
+        self,
+        push_repository: PushNotificationRepository,
+        status_publisher: Optional[PushStatusPublisher] = None,
+        event_publisher: Optional[PushEventPublisher] = None,
+    ):
         self._push_repository = push_repository
+        self._status_publisher = status_publisher
+        self._event_publisher = event_publisher
 
     async def create_push_notification(
         self, 
@@ -21,15 +45,48 @@ class PushNotificationService:
         push_notification = PushNotification.create_new(
             user_id=user_id,
             message=message,
-            topic=topic
+            topic=topic,
+            push_uuid=self._push_repository.next_identity(user_id),
         )
         
         success = await self._push_repository.save(push_notification)
         if not success:
             raise Exception("Failed to save push notification")
-        
+
+        await self._publish_created([push_notification])
         return push_notification
 
+    async def create_push_notifications(
+        self,
+        items: List[Tuple[str, str, Optional[str]]]
+    ) -> List[BatchPushResult]:
+        """(user_id, message, topic) 목록으로 푸시 알림 일괄 생성 (입력 순서대로 결과 반환)"""
+        results: List[BatchPushResult] = []
+        valid: List[PushNotification] = []
+        for user_id, message, topic in items:
+            try:
+                push_notification = PushNotification.create_new(
+                    user_id=user_id,
+                    message=message,
+                    topic=topic,
+                    push_uuid=self._push_repository.next_identity(user_id),
+                )
+            except ValueError as e:
+                results.append(BatchPushResult(error=str(e)))
+                continue
+            valid.append(push_notification)
+            results.append(BatchPushResult(push_notification=push_notification))
+
+        saved = iter(await self._push_repository.save_many(valid))
+        for result in results:
+            if result.push_notification is not None and not next(saved):
+                result.push_notification = None
+                result.error = "Failed to save push notification"
+        await self._publish_created([
+            result.push_notification for result in results if result.push_notification is not None
+        ])
+        return results
+
     async def get_push_notification(self, push_uuid: UUID) -> Optional[PushNotification]:
         """푸시 알림 조회"""
         return await self._push_repository.find_by_id(push_uuid)
@@ -37,22 +94,24 @@ class PushNotificationService:
     async def get_user_push_notifications(
         self, 
         user_id: str, 
-        limit: int = 10
-    ) -> List[PushNotification]:
-        """사용자별 푸시 알림 목록 조회"""
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> PushNotificationPage:
+        """사용자별 푸시 알림 목록 조회 (커서 기반 페이지)"""
         if limit > 100:
             limit = 100
-        return await self._push_repository.find_by_user_id(user_id, limit)
+        return await self._push_repository.find_page_by_user_id(user_id, limit, cursor)
 
     async def get_topic_push_notifications(
         self, 
         topic: str, 
-        limit: int = 10
-    ) -> List[PushNotification]:
-        """토픽별 푸시 알림 목록 조회"""
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> PushNotificationPage:
+        """토픽별 푸시 알림 목록 조회 (커서 기반 페이지)"""
         if limit > 100:
             limit = 100
-        return await self._push_repository.find_by_topic(topic, limit)
+        return await self._push_repository.find_page_by_topic(topic, limit, cursor)
 
     async def delete_push_notification(self, push_uuid: UUID) -> bool:
         """푸시 알림 삭제"""
@@ -63,18 +122,21 @@ class PushNotificationService:
 
     async def mark_push_as_sent(self, push_uuid: UUID) -> bool:
         """푸시 알림을 전송됨으로 표시"""
-        push_notification = await self._push_repository.find_by_id(push_uuid)
-        if not push_notification:
-            return False
-        
-        push_notification.mark_as_sent()
-        return await self._push_repository.save(push_notification)
+        return await self._change_status(push_uuid, "sent")
 
     async def mark_push_as_delivered(self, push_uuid: UUID) -> bool:
         """푸시 알림을 전달됨으로 표시"""
-        push_notification = await self._push_repository.find_by_id(push_uuid)
-        if not push_notification:
+        return await self._change_status(push_uuid, "delivered")
+
+    async def _publish_created(self, push_notifications: List[PushNotification]) -> None:
+        """저장된 푸시를 실시간 스트림으로 발행 (발행자가 있을 때만)"""
+        if self._event_publisher is not None and push_notifications:
+            await self._event_publisher.publish_created(push_notifications)
+
+    async def _change_status(self, push_uuid: UUID, status: str) -> bool:
+        """상태 변경 (발행자가 있으면 이벤트로 발행해 워커가 비동기로 적용)"""
+        if self._status_publisher is None:
+            return await self._push_repository.update_status(push_uuid, status)
+        if not await self._push_repository.exists(push_uuid):
             return False
-        
-        push_notification.mark_as_delivered()
-        return await self._push_repository.save(push_notification)
\ No newline at end of file
+        return await self._status_publisher.publish(push_uuid, status)
@@ -0,0 +1,21 @@
+from typing import List, Optional
+
+from app.domain.entities import TopicPushStats
+from app.domain.repositories import PushStatsRepository
+
+
+class PushStatsService:
+    """토픽별 푸시 통계 애플리케이션 서비스"""
+
+    def __init__(self, stats_repository: PushStatsRepository):
+        self._stats_repository = stats_repository
+
+    async def get_topic_stats(
+        self, hours: int = 24, topic: Optional[str] = None
+    ) -> List[TopicPushStats]:
+        """최근 hours시간의 토픽별 통계 (topic이 없으면 구간 안에 푸시가 있는 모든 토픽)"""
+        if hours < 1:
+            raise ValueError("Hours must be positive")
+        if topic is not None and not topic.strip():
+            raise ValueError("Topic cannot be empty")
+        return await self._stats_repository.find_topic_stats(hours, topic)
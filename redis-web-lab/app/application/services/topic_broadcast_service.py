@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from typing import List, Optional, Set
+from uuid import UUID
+
+from app.domain.entities import BroadcastJob
+from app.domain.repositories import BroadcastJobRepository, TopicSubscriptionRepository
+
+from .push_notification_service import PushNotificationService
+
+logger = logging.getLogger(__name__)
+
+
+class TopicBroadcastService:
+    """토픽 구독 관리와 구독자 전체 일괄 발송 애플리케이션 서비스
+
+    발송은 작업을 만들어 바로 반환하고 이 프로세스의 백그라운드 태스크에서 진행합니다.
+    구독자를 chunk_size명씩 읽어 PushNotificationService.create_push_notifications로 한 번에
+    저장하므로(청크당 파이프라인 왕복 몇 번) 비용은 HTTP 요청 수가 아니라 Redis 처리량이
+    정합니다. 청크마다 진행 수치를 작업에 누적하며, 종료 시 시한 안에 끝나지 못해 중단된
+    작업은 cancelled로 남습니다(이미 만든 푸시는 유지).
+    """
+
+    def __init__(
+        self,
+        push_service: PushNotificationService,
+        subscription_repository: TopicSubscriptionRepository,
+        job_repository: BroadcastJobRepository,
+        chunk_size: int = 1000,
+    ):
+        self._push_service = push_service
+        self._subscription_repository = subscription_repository
+        self._job_repository = job_repository
+        self._chunk_size = chunk_size
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def subscribe(self, topic: str, user_ids: List[str]) -> int:
+        """토픽에 구독자 추가 (새로 추가된 수 반환)"""
+        return await self._subscription_repository.subscribe(topic, self._clean(user_ids))
+
+    async def unsubscribe(self, topic: str, user_ids: List[str]) -> int:
+        """토픽에서 구독자 제거 (실제로 제거된 수 반환)"""
+        return await self._subscription_repository.unsubscribe(topic, self._clean(user_ids))
+
+    async def count_subscribers(self, topic: str) -> int:
+        """토픽 구독자 수"""
+        return await self._subscription_repository.count_subscribers(topic)
+
+    async def start_broadcast(self, topic: str, message: str) -> BroadcastJob:
+        """발송 작업을 만들고 백그라운드에서 시작 (작업 즉시 반환)"""
+        job = BroadcastJob.create_new(topic=topic, message=message)
+        await self._job_repository.save(job)
+
+        task = asyncio.create_task(self.run_broadcast(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def get_broadcast_job(self, job_id: UUID) -> Optional[BroadcastJob]:
+        """발송 작업 조회"""
+        return await self._job_repository.find_by_id(job_id)
+
+    async def run_broadcast(self, job: BroadcastJob) -> None:
+        """구독자를 청크 단위로 읽어 푸시를 만들고 진행 수치를 누적 (시작 단계 오류도 실패 처리)"""
+        total = 0
+        try:
+            total = await self._subscription_repository.count_subscribers(job.topic)
+            await self._job_repository.update_status(job.job_id, "running", total=total)
+            async for user_ids in self._subscription_repository.iter_subscribers(
+                job.topic, self._chunk_size
+            ):
+                results = await self._push_service.create_push_notifications(
+                    [(user_id, job.message, job.topic) for user_id in user_ids]
+                )
+                succeeded = sum(1 for result in results if result.succeeded)
+                await self._job_repository.add_progress(
+                    job.job_id, succeeded, len(results) - succeeded
+                )
+        except asyncio.CancelledError:
+            await self._job_repository.update_status(job.job_id, "cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"토픽 일괄 발송 실패 ({job.topic}, {job.job_id}): {e}")
+            await self._job_repository.update_status(job.job_id, "failed")
+            return
+        await self._job_repository.update_status(job.job_id, "completed")
+        logger.info(f"토픽 일괄 발송 완료: {job.topic} ({job.job_id}, 구독자 {total}명)")
+
+    async def stop(self, timeout: float = 0.0) -> None:
+        """진행 중인 발송 작업을 최대 timeout초까지 기다린 뒤 남은 작업 중단"""
+        tasks = list(self._tasks)
+        if tasks and timeout > 0:
+            await asyncio.wait(tasks, timeout=timeout)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _clean(user_ids: List[str]) -> List[str]:
+        """빈 ID 제외"""
+        return [user_id for user_id in user_ids if user_id.strip()]
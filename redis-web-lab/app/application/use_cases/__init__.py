@@ -2,6 +2,8 @@
 from .push_notification_use_cases import (
     CreatePushNotificationCommand,
     CreatePushNotificationUseCase,
+    CreatePushNotificationsBatchCommand,
+    CreatePushNotificationsBatchUseCase,
     DeletePushNotificationCommand,
     DeletePushNotificationUseCase,
     GetPushNotificationQuery,
@@ -11,10 +13,23 @@ from .push_notification_use_cases import (
     GetUserPushNotificationsQuery,
     GetUserPushNotificationsUseCase,
 )
+from .push_stats_use_cases import GetPushStatsQuery, GetPushStatsUseCase
+from .topic_broadcast_use_cases import (
+    GetBroadcastJobQuery,
+    GetBroadcastJobUseCase,
+    StartTopicBroadcastCommand,
+    StartTopicBroadcastUseCase,
+    SubscribeTopicCommand,
+    SubscribeTopicUseCase,
+    UnsubscribeTopicCommand,
+    UnsubscribeTopicUseCase,
+)
 
 __all__ = [
     "CreatePushNotificationCommand",
     "CreatePushNotificationUseCase", 
+    "CreatePushNotificationsBatchCommand",
+    "CreatePushNotificationsBatchUseCase",
     "DeletePushNotificationCommand",
     "DeletePushNotificationUseCase",
     "GetPushNotificationQuery",
@@ -23,4 +38,14 @@ __all__ = [
     "GetTopicPushNotificationsUseCase",
     "GetUserPushNotificationsQuery", 
     "GetUserPushNotificationsUseCase",
+    "GetPushStatsQuery",
+    "GetPushStatsUseCase",
+    "GetBroadcastJobQuery",
+    "GetBroadcastJobUseCase",
+    "StartTopicBroadcastCommand",
+    "StartTopicBroadcastUseCase",
+    "SubscribeTopicCommand",
+    "SubscribeTopicUseCase",
+    "UnsubscribeTopicCommand",
+    "UnsubscribeTopicUseCase",
 ]
\ No newline at end of file
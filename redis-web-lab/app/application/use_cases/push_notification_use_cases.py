@@ -2,8 +2,8 @@ from dataclasses import dataclass
 from typing import List, Optional
 from uuid import UUID
 
-from app.application.services import PushNotificationService
-from app.domain.entities import PushNotification
+from app.application.services import BatchPushResult, PushNotificationService
+from app.domain.entities import PushNotification, PushNotificationPage
 
 
 @dataclass
@@ -14,6 +14,12 @@ class CreatePushNotificationCommand:
     topic: Optional[str] = None
 
 
+@dataclass
+class CreatePushNotificationsBatchCommand:
+    """푸시 알림 일괄 생성 명령"""
+    items: List[CreatePushNotificationCommand]
+
+
 @dataclass
 class GetPushNotificationQuery:
     """푸시 알림 조회 쿼리"""
@@ -25,6 +31,7 @@ class GetUserPushNotificationsQuery:
     """사용자별 푸시 알림 목록 조회 쿼리"""
     user_id: str
     limit: int = 10
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -32,6 +39,7 @@ class GetTopicPushNotificationsQuery:
     """토픽별 푸시 알림 목록 조회 쿼리"""
     topic: str
     limit: int = 10
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -55,6 +63,19 @@ class CreatePushNotificationUseCase:
         )
 
 
+class CreatePushNotificationsBatchUseCase:
+    """푸시 알림 일괄 생성 유스케이스"""
+
+    def __init__(self, push_service: PushNotificationService):
+        self._push_service = push_service
+
+    async def execute(self, command: CreatePushNotificationsBatchCommand) -> List[BatchPushResult]:
+        """푸시 알림 일괄 생성 실행"""
+        return await self._push_service.create_push_notifications(
+            [(item.user_id, item.message, item.topic) for item in command.items]
+        )
+
+
 class GetPushNotificationUseCase:
     """푸시 알림 조회 유스케이스"""
 
@@ -72,11 +93,12 @@ class GetUserPushNotificationsUseCase:
     def __init__(self, push_service: PushNotificationService):
         self._push_service = push_service
 
-    async def execute(self, query: GetUserPushNotificationsQuery) -> List[PushNotification]:
+    async def execute(self, query: GetUserPushNotificationsQuery) -> PushNotificationPage:
         """사용자별 푸시 알림 목록 조회 실행"""
         return await self._push_service.get_user_push_notifications(
             user_id=query.user_id,
-            limit=query.limit
+            limit=query.limit,
+            cursor=query.cursor
         )
 
 
@@ -86,11 +108,12 @@ class GetTopicPushNotificationsUseCase:
     def __init__(self, push_service: PushNotificationService):
         self._push_service = push_service
 
-    async def execute(self, query: GetTopicPushNotificationsQuery) -> List[PushNotification]:
+    async def execute(self, query: GetTopicPushNotificationsQuery) -> PushNotificationPage:
         """토픽별 푸시 알림 목록 조회 실행"""
         return await self._push_service.get_topic_push_notifications(
             topic=query.topic,
-            limit=query.limit
+            limit=query.limit,
+            cursor=query.cursor
         )
 
 
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.application.services import PushStatsService
+from app.domain.entities import TopicPushStats
+
+
+@dataclass
+class GetPushStatsQuery:
+    """토픽별 푸시 통계 조회 쿼리"""
+    hours: int = 24
+    topic: Optional[str] = None
+
+
+class GetPushStatsUseCase:
+    """토픽별 푸시 통계 조회 유스케이스"""
+
+    def __init__(self, stats_service: PushStatsService):
+        self._stats_service = stats_service
+
+    async def execute(self, query: GetPushStatsQuery) -> List[TopicPushStats]:
+        """토픽별 푸시 통계 조회 실행"""
+        return await self._stats_service.get_topic_stats(hours=query.hours, topic=query.topic)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from uuid import UUID
+
+from app.application.services import TopicBroadcastService
+from app.domain.entities import BroadcastJob
+
+
+@dataclass
+class SubscribeTopicCommand:
+    """토픽 구독 명령"""
+    topic: str
+    user_ids: List[str]
+
+
+@dataclass
+class UnsubscribeTopicCommand:
+    """토픽 구독 해지 명령"""
+    topic: str
+    user_ids: List[str]
+
+
+@dataclass
+class StartTopicBroadcastCommand:
+    """토픽 일괄 발송 명령"""
+    topic: str
+    message: str
+
+
+@dataclass
+class GetBroadcastJobQuery:
+    """일괄 발송 작업 조회 쿼리"""
+    job_id: UUID
+
+
+class SubscribeTopicUseCase:
+    """토픽 구독 유스케이스"""
+
+    def __init__(self, broadcast_service: TopicBroadcastService):
+        self._broadcast_service = broadcast_service
+
+    async def execute(self, command: SubscribeTopicCommand) -> int:
+        """토픽 구독 실행 (새로 추가된 구독자 수 반환)"""
+        return await self._broadcast_service.subscribe(command.topic, command.user_ids)
+
+
+class UnsubscribeTopicUseCase:
+    """토픽 구독 해지 유스케이스"""
+
+    def __init__(self, broadcast_service: TopicBroadcastService):
+        self._broadcast_service = broadcast_service
+
+    async def execute(self, command: UnsubscribeTopicCommand) -> int:
+        """토픽 구독 해지 실행 (제거된 구독자 수 반환)"""
+        return await self._broadcast_service.unsubscribe(command.topic, command.user_ids)
+
+
+class StartTopicBroadcastUseCase:
+    """토픽 일괄 발송 유스케이스"""
+
+    def __init__(self, broadcast_service: TopicBroadcastService):
+        self._broadcast_service = broadcast_service
+
+    async def execute(self, command: StartTopicBroadcastCommand) -> BroadcastJob:
+        """일괄 발송 작업 시작"""
+        return await self._broadcast_service.start_broadcast(command.topic, command.message)
+
+
+class GetBroadcastJobUseCase:
+    """일괄 발송 작업 조회 유스케이스"""
+
+    def __init__(self, broadcast_service: TopicBroadcastService):
+        self._broadcast_service = broadcast_service
+
+    async def execute(self, query: GetBroadcastJobQuery) -> Optional[BroadcastJob]:
+        """일괄 발송 작업 조회 실행"""
+        return await self._broadcast_service.get_broadcast_job(query.job_id)
@@ -1,4 +1,13 @@
 """Domain entities package"""
+from .broadcast_job import BroadcastJob
 from .push_notification import PushNotification
+from .push_notification_page import PushNotificationPage
+from .push_stats import PushStatsBucket, TopicPushStats
 
-__all__ = ["PushNotification"]
\ No newline at end of file
+__all__ = [
+    "BroadcastJob",
+    "PushNotification",
+    "PushNotificationPage",
+    "PushStatsBucket",
+    "TopicPushStats",
+]
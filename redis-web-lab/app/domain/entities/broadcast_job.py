@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import ClassVar, Optional, Tuple
+from uuid import UUID, uuid4
+
+
+@dataclass
+class BroadcastJob:
+    """토픽 구독자 전체에게 같은 메시지를 보내는 일괄 발송 작업"""
+    job_id: UUID
+    topic: str
+    message: str
+    status: str
+    created_at: datetime
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    finished_at: Optional[datetime] = None
+
+    # 더 이상 진행되지 않는 상태
+    FINISHED_STATUSES: ClassVar[Tuple[str, ...]] = ("completed", "failed", "cancelled")
+
+    def __post_init__(self) -> None:
+        """데이터 검증"""
+        if not self.topic.strip():
+            raise ValueError("Topic cannot be empty")
+        if not self.message.strip():
+            raise ValueError("Message cannot be empty")
+
+    @property
+    def processed(self) -> int:
+        """처리한 구독자 수"""
+        return self.succeeded + self.failed
+
+    @property
+    def progress(self) -> float:
+        """진행률 (0~1, 시작 시점 구독자 수 기준)"""
+        if self.status == "completed":
+            return 1.0
+        if self.total <= 0:
+            return 0.0
+        return min(1.0, self.processed / self.total)
+
+    def is_finished(self) -> bool:
+        """종료 여부 확인"""
+        return self.status in self.FINISHED_STATUSES
+
+    @classmethod
+    def create_new(cls, topic: str, message: str) -> "BroadcastJob":
+        """새로운 발송 작업 생성"""
+        return cls(
+            job_id=uuid4(),
+            topic=topic,
+            message=message,
+            status="pending",
+            created_at=datetime.now(),
+        )
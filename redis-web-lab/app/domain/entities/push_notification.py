@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Dict, Optional
 from uuid import UUID
 
 
@@ -15,6 +15,14 @@ class PushNotification:
     api_call_time: datetime
     status: str
 
+    # 상태 진행 단계 (같거나 낮은 단계로의 전이는 무시)
+    STATUS_RANKS: ClassVar[Dict[str, int]] = {
+        "created": 0,
+        "sent": 1,
+        "delivered": 2,
+        "failed": 2,
+    }
+
     def __post_init__(self) -> None:
         """데이터 검증"""
         if not self.user_id.strip():
@@ -28,6 +36,12 @@ class PushNotification:
         """활성 상태 확인"""
         return self.status in ["created", "sent", "delivered"]
 
+    def can_transition_to(self, status: str) -> bool:
+        """현재 상태에서 status로 진행 가능한지 확인"""
+        if status not in self.STATUS_RANKS:
+            raise ValueError(f"Unknown status: {status}")
+        return self.STATUS_RANKS[status] > self.STATUS_RANKS.get(self.status, -1)
+
     def mark_as_sent(self) -> None:
         """전송 완료로 상태 변경"""
         self.status = "sent"
@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .push_notification import PushNotification
+
+
+@dataclass
+class PushNotificationPage:
+    """푸시 알림 목록 페이지 (커서 기반 페이지네이션)"""
+    items: List[PushNotification] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """다음 페이지 존재 여부"""
+        return self.next_cursor is not None
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List
+
+
+@dataclass
+class PushStatsBucket:
+    """한 시간 구간(생성 시각 기준)의 토픽 푸시 통계"""
+    hour: datetime
+    counts: Dict[str, int]
+    unique_users: int
+
+
+@dataclass
+class TopicPushStats:
+    """조회 구간 전체의 토픽 푸시 통계
+
+    counts는 상태별 수(created는 생성 수, 나머지는 그 상태로 바뀐 수)이며, unique_users는
+    구간 전체의 고유 사용자 수 근사값입니다(시간별 값의 합이 아님).
+    """
+    topic: str
+    counts: Dict[str, int]
+    unique_users: int
+    hourly: List[PushStatsBucket] = field(default_factory=list)
+
@@ -1,4 +1,16 @@
 """Domain repositories package"""
+from .broadcast_job_repository import BroadcastJobRepository
+from .push_event_publisher import PushEventPublisher
 from .push_notification_repository import PushNotificationRepository
+from .push_stats_repository import PushStatsRepository
+from .push_status_publisher import PushStatusPublisher
+from .topic_subscription_repository import TopicSubscriptionRepository
 
-__all__ = ["PushNotificationRepository"]
\ No newline at end of file
+__all__ = [
+    "BroadcastJobRepository",
+    "PushEventPublisher",
+    "PushNotificationRepository",
+    "PushStatsRepository",
+    "PushStatusPublisher",
+    "TopicSubscriptionRepository",
+]
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from app.domain.entities import BroadcastJob
+
+
+class BroadcastJobRepository(ABC):
+    """일괄 발송 작업 저장소 인터페이스"""
+
+    @abstractmethod
+    async def save(self, job: BroadcastJob) -> None:
+        """작업 저장"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, job_id: UUID) -> Optional[BroadcastJob]:
+        """ID로 작업 조회"""
+        pass
+
+    @abstractmethod
+    async def update_status(
+        self, job_id: UUID, status: str, total: Optional[int] = None
+    ) -> None:
+        """작업 상태 변경 (total을 주면 대상 구독자 수도 기록, 종료 상태면 종료 시각 기록)"""
+        pass
+
+    @abstractmethod
+    async def add_progress(self, job_id: UUID, succeeded: int, failed: int) -> None:
+        """처리 결과 누적 (여러 워커가 동시에 호출해도 안전)"""
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.domain.entities import PushNotification
+
+
+class PushEventPublisher(ABC):
+    """새 푸시 알림 실시간 전달 이벤트 발행 인터페이스"""
+
+    @abstractmethod
+    async def publish_created(self, push_notifications: List[PushNotification]) -> None:
+        """저장된 푸시 알림을 구독 중인 클라이언트에 발행 (최대 한 번 전달, 실패해도 예외 없음)"""
+        pass
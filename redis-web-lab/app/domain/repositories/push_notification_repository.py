@@ -1,23 +1,43 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from uuid import UUID
+from typing import List, Optional, Tuple
+from uuid import UUID, uuid4
 
-from app.domain.entities import PushNotification
+from app.domain.entities import PushNotification, PushNotificationPage
 
 
 class PushNotificationRepository(ABC):
     """푸시 알림 저장소 인터페이스"""
 
+    def next_identity(self, user_id: str) -> UUID:
+        """새 푸시 알림 ID 발급 (저장 위치에 맞춘 ID가 필요한 구현체는 재정의)"""
+        return uuid4()
+
     @abstractmethod
     async def save(self, push_notification: PushNotification) -> bool:
         """푸시 알림 저장"""
         pass
 
+    @abstractmethod
+    async def save_many(self, push_notifications: List[PushNotification]) -> List[bool]:
+        """푸시 알림 일괄 저장 (입력 순서대로 항목별 성공 여부 반환)"""
+        pass
+
     @abstractmethod
     async def find_by_id(self, push_uuid: UUID) -> Optional[PushNotification]:
         """ID로 푸시 알림 조회"""
         pass
 
+    async def find_by_id_with_ttl(
+        self, push_uuid: UUID
+    ) -> Tuple[Optional[PushNotification], Optional[float]]:
+        """ID로 푸시 알림과 남은 보존 시간(초, 알 수 없으면 None)을 함께 조회"""
+        return await self.find_by_id(push_uuid), None
+
+    @abstractmethod
+    async def find_many(self, push_uuids: List[UUID]) -> List[PushNotification]:
+        """여러 ID로 푸시 알림 일괄 조회 (입력 순서 유지, 없는 항목 제외)"""
+        pass
+
     @abstractmethod
     async def find_by_user_id(self, user_id: str, limit: int = 10) -> List[PushNotification]:
         """사용자 ID로 푸시 알림 목록 조회"""
@@ -28,6 +48,33 @@ class PushNotificationRepository(ABC):
         """토픽으로 푸시 알림 목록 조회"""
         pass
 
+    @abstractmethod
+    async def find_page_by_user_id(
+        self, user_id: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> PushNotificationPage:
+        """사용자 ID로 푸시 알림 페이지 조회 (최신순, 커서 이후부터)"""
+        pass
+
+    @abstractmethod
+    async def find_page_by_topic(
+        self, topic: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> PushNotificationPage:
+        """토픽으로 푸시 알림 페이지 조회 (최신순, 커서 이후부터)"""
+        pass
+
+    async def update_status(self, push_uuid: UUID, status: str) -> bool:
+        """푸시 알림의 상태만 변경 (기록이 있으면 True)"""
+        return (await self.update_statuses([(push_uuid, status)]))[0]
+
+    @abstractmethod
+    async def update_statuses(self, updates: List[Tuple[UUID, str]]) -> List[bool]:
+        """여러 푸시 알림의 상태만 일괄 변경 (입력 순서대로 기록 존재 여부 반환)
+
+        이미 같거나 더 진행된 상태인 기록은 그대로 두므로 같은 변경을 여러 번 적용하거나
+        순서가 뒤바뀌어 도착해도 안전합니다. 저장소 오류는 재처리를 위해 예외로 전달합니다.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, push_uuid: UUID) -> bool:
         """푸시 알림 삭제"""
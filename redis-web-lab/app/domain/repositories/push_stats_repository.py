@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from app.domain.entities import TopicPushStats
+
+
+class PushStatsRepository(ABC):
+    """토픽별 푸시 통계 저장소 인터페이스 (집계는 저장 경로에서 누적)"""
+
+    @abstractmethod
+    async def find_topic_stats(
+        self, hours: int, topic: Optional[str] = None
+    ) -> List[TopicPushStats]:
+        """최근 hours시간(현재 시간 포함)의 토픽별 통계 (topic이 없으면 구간 안의 모든 토픽)"""
+        pass
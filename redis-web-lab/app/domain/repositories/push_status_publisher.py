@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class PushStatusPublisher(ABC):
+    """푸시 알림 상태 변경 이벤트 발행 인터페이스"""
+
+    @abstractmethod
+    async def publish(self, push_uuid: UUID, status: str) -> bool:
+        """상태 변경 이벤트 발행 (발행 성공 여부 반환, 적용은 비동기)"""
+        pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List
+
+
+class TopicSubscriptionRepository(ABC):
+    """토픽 구독자 저장소 인터페이스"""
+
+    @abstractmethod
+    async def subscribe(self, topic: str, user_ids: List[str]) -> int:
+        """토픽에 구독자 추가 (새로 추가된 수 반환)"""
+        pass
+
+    @abstractmethod
+    async def unsubscribe(self, topic: str, user_ids: List[str]) -> int:
+        """토픽에서 구독자 제거 (실제로 제거된 수 반환)"""
+        pass
+
+    @abstractmethod
+    async def count_subscribers(self, topic: str) -> int:
+        """토픽 구독자 수"""
+        pass
+
+    @abstractmethod
+    def iter_subscribers(self, topic: str, chunk_size: int) -> AsyncIterator[List[str]]:
+        """토픽 구독자를 최대 chunk_size명씩 나눠 순회 (순회 중 구독자가 바뀌면 중복될 수 있음)"""
+        pass
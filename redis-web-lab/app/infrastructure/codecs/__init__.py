@@ -0,0 +1,16 @@
+"""Infrastructure codecs package"""
+from .push_record_codec import (
+    HashPushRecordCodec,
+    MsgpackPushRecordCodec,
+    PushRecordCodec,
+    StatusTransition,
+    get_push_record_codec,
+)
+
+__all__ = [
+    "HashPushRecordCodec",
+    "MsgpackPushRecordCodec",
+    "PushRecordCodec",
+    "StatusTransition",
+    "get_push_record_codec",
+]
@@ -0,0 +1,274 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import msgpack
+from redis.asyncio.client import Pipeline
+from redis.client import NEVER_DECODE
+
+from app.domain.entities import PushNotification
+from app.infrastructure.database import RedisClient, eval_per_key
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# 기록이 있을 때만, 더 진행된 상태로만 status 필드 하나를 갱신 (TTL 유지)
+# 반환: 기록이 없으면 0, 상태가 그대로면 1, 바뀌었으면 {topic, created_at}
+_HASH_STATUS_SCRIPT = """
+local ranks = {%s}
+local current = redis.call('HMGET', KEYS[1], 'status', 'topic', 'created_at')
+if not current[1] then
+    return 0
+end
+if ranks[ARGV[1]] > (ranks[current[1]] or -1) then
+    redis.call('HSET', KEYS[1], 'status', ARGV[1])
+    return {current[2], current[3]}
+end
+return 1
+""" % ", ".join(
+    f'["{status}"] = {rank}' for status, rank in PushNotification.STATUS_RANKS.items()
+)
+
+# 읽었던 값이 그대로일 때만 새 값으로 교체 (TTL 유지): 없으면 0, 바뀌었으면 -1
+_COMPARE_AND_SET_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 0
+end
+if current ~= ARGV[1] then
+    return -1
+end
+redis.call('SET', KEYS[1], ARGV[2], 'KEEPTTL')
+return 1
+"""
+
+
+@dataclass(frozen=True)
+class StatusTransition:
+    """실제로 적용된 상태 변경 (통계 집계용)"""
+    topic: str
+    created_at: datetime
+    status: str
+
+
+class PushRecordCodec(ABC):
+    """푸시 기록의 Redis 저장 형식
+
+    쓰기/읽기 명령을 파이프라인에 적재하는 방식과, 읽은 값을 엔티티로 변환하는 방식을
+    함께 정의합니다. 같은 배포 안의 모든 워커는 같은 코덱을 사용해야 합니다.
+    """
+
+    name: str
+
+    @abstractmethod
+    def queue_write(
+        self, pipe: Pipeline, key: str, push_notification: PushNotification, ttl_seconds: int
+    ) -> None:
+        """기록 저장(TTL 포함) 명령 적재"""
+        pass
+
+    @abstractmethod
+    def queue_read(self, pipe: Pipeline, key: str) -> None:
+        """기록 조회 명령 적재"""
+        pass
+
+    @abstractmethod
+    def decode(self, raw: Any) -> Optional[PushNotification]:
+        """조회 결과를 엔티티로 변환 (키가 없으면 None, 손상되었으면 ValueError/KeyError)"""
+        pass
+
+    @abstractmethod
+    async def update_statuses(
+        self,
+        client: RedisClient,
+        updates: List[Tuple[str, str]],
+        transitions: Optional[List[StatusTransition]] = None,
+    ) -> List[bool]:
+        """(키, 상태) 목록의 상태만 진행 방향으로 갱신 (입력 순서대로 기록 존재 여부 반환)
+
+        transitions를 넘기면 실제로 상태가 바뀐 기록의 변경 내용을 채워 줍니다.
+        """
+        pass
+
+
+class HashPushRecordCodec(PushRecordCodec):
+    """필드별 문자열 Hash 형식 (기본값, RedisInsight/Webdis에서 바로 읽을 수 있음)"""
+
+    name = "hash"
+
+    def queue_write(
+        self, pipe: Pipeline, key: str, push_notification: PushNotification, ttl_seconds: int
+    ) -> None:
+        pipe.hset(key, mapping=self.to_record(push_notification))
+        pipe.expire(key, ttl_seconds)
+
+    def queue_read(self, pipe: Pipeline, key: str) -> None:
+        pipe.hgetall(key)
+
+    async def update_statuses(
+        self,
+        client: RedisClient,
+        updates: List[Tuple[str, str]],
+        transitions: Optional[List[StatusTransition]] = None,
+    ) -> List[bool]:
+        # 키마다 스크립트 한 번, 전체는 파이프라인 한 번의 왕복
+        results = await eval_per_key(
+            client, _HASH_STATUS_SCRIPT, [(key, [status]) for key, status in updates]
+        )
+        if transitions is not None:
+            for (_, status), result in zip(updates, results, strict=True):
+                if isinstance(result, list):
+                    topic, created_at = result
+                    transitions.append(
+                        StatusTransition(topic, datetime.fromisoformat(created_at), status)
+                    )
+        return [bool(result) for result in results]
+
+    def decode(self, raw: Any) -> Optional[PushNotification]:
+        if not raw:
+            return None
+        return PushNotification(
+            push_uuid=UUID(raw["push_uuid"]),
+            user_id=raw["user_id"],
+            message=raw["message"],
+            topic=raw["topic"],
+            created_at=datetime.fromisoformat(raw["created_at"]),
+            api_call_time=datetime.fromisoformat(raw["api_call_time"]),
+            status=raw["status"],
+        )
+
+    @staticmethod
+    def to_record(push_notification: PushNotification) -> Dict[str, str]:
+        """Entity를 Redis Hash 데이터로 변환"""
+        return {
+            "push_uuid": str(push_notification.push_uuid),
+            "user_id": push_notification.user_id,
+            "message": push_notification.message,
+            "topic": push_notification.topic,
+            "created_at": push_notification.created_at.isoformat(),
+            "api_call_time": push_notification.api_call_time.isoformat(),
+            "status": push_notification.status,
+        }
+
+
+class MsgpackPushRecordCodec(PushRecordCodec):
+    """msgpack 배열 하나를 문자열 값으로 저장하는 압축 형식
+
+    UUID는 16바이트, 시각은 epoch 기준 마이크로초 정수로 저장해 키당 메모리와
+    역직렬화 비용을 줄입니다. 엔티티의 시각은 naive 로컬 시각이므로 벽시계 값을
+    그대로 저장하며, timezone 정보가 있는 시각은 UTC로 변환해 저장합니다.
+    """
+
+    name = "msgpack"
+    _VERSION = 1
+
+    def queue_write(
+        self, pipe: Pipeline, key: str, push_notification: PushNotification, ttl_seconds: int
+    ) -> None:
+        pipe.set(key, self.encode(push_notification), ex=ttl_seconds)
+
+    def queue_read(self, pipe: Pipeline, key: str) -> None:
+        # 클라이언트가 decode_responses=True이므로 이 명령만 바이트 그대로 읽음
+        pipe.execute_command("GET", key, **{NEVER_DECODE: True})
+
+    def decode(self, raw: Any) -> Optional[PushNotification]:
+        if raw is None:
+            return None
+        try:
+            version, push_uuid, user_id, message, topic, created_us, api_call_us, status = (
+                msgpack.unpackb(raw, raw=False)
+            )
+        except (msgpack.ExtraData, msgpack.FormatError, msgpack.StackError, TypeError) as e:
+            raise ValueError(f"Invalid msgpack record: {e}") from e
+        if version != self._VERSION:
+            raise ValueError(f"Unsupported record version: {version}")
+        return PushNotification(
+            push_uuid=UUID(bytes=push_uuid),
+            user_id=user_id,
+            message=message,
+            topic=topic,
+            created_at=_EPOCH + created_us * _MICROSECOND,
+            api_call_time=_EPOCH + api_call_us * _MICROSECOND,
+            status=status,
+        )
+
+    async def update_statuses(
+        self,
+        client: RedisClient,
+        updates: List[Tuple[str, str]],
+        transitions: Optional[List[StatusTransition]] = None,
+    ) -> List[bool]:
+        # 값 전체를 다시 써야 하므로 읽은 값과 비교 후 교체(compare-and-set)하며,
+        # 읽기와 교체를 각각 파이프라인 한 번으로 처리하고 그 사이 값이 바뀐 항목만 재시도
+        results: List[bool] = [False] * len(updates)
+        pending = list(range(len(updates)))
+        while pending:
+            async with client.pipeline(transaction=False) as pipe:
+                for i in pending:
+                    self.queue_read(pipe, updates[i][0])
+                raws = await pipe.execute()
+
+            writes: List[Tuple[int, bytes, PushNotification]] = []
+            for i, raw in zip(pending, raws, strict=True):
+                entity = self.decode(raw)
+                if entity is None:
+                    continue
+                results[i] = True
+                if entity.can_transition_to(updates[i][1]):
+                    entity.status = updates[i][1]
+                    writes.append((i, raw, entity))
+
+            outcomes = await eval_per_key(
+                client,
+                _COMPARE_AND_SET_SCRIPT,
+                [(updates[i][0], [raw, self.encode(entity)]) for i, raw, entity in writes],
+            )
+            pending = []
+            for (i, _, entity), outcome in zip(writes, outcomes, strict=True):
+                if outcome == -1:
+                    pending.append(i)
+                    continue
+                results[i] = bool(outcome)
+                if outcome == 1 and transitions is not None:
+                    transitions.append(
+                        StatusTransition(entity.topic, entity.created_at, entity.status)
+                    )
+        return results
+
+    def encode(self, push_notification: PushNotification) -> bytes:
+        """Entity를 msgpack 바이트로 변환"""
+        packed: bytes = msgpack.packb(
+            [
+                self._VERSION,
+                push_notification.push_uuid.bytes,
+                push_notification.user_id,
+                push_notification.message,
+                push_notification.topic,
+                self._to_micros(push_notification.created_at),
+                self._to_micros(push_notification.api_call_time),
+                push_notification.status,
+            ],
+            use_bin_type=True,
+        )
+        return packed
+
+    @staticmethod
+    def _to_micros(value: datetime) -> int:
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // _MICROSECOND
+
+
+_CODECS = {codec.name: codec for codec in (HashPushRecordCodec(), MsgpackPushRecordCodec())}
+
+
+def get_push_record_codec(name: str) -> PushRecordCodec:
+    """이름으로 코덱 조회 (PUSH_STORAGE_CODEC 값)"""
+    try:
+        return _CODECS[name.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown push storage codec: {name!r} (available: {', '.join(_CODECS)})"
+        ) from None
@@ -1,4 +1,14 @@
 """Infrastructure database package"""
-from .redis_connection import RedisConnection
+from .redis_connection import RedisClient, RedisConnection
+from .redis_pool import RedisPoolSettings, RedisPoolStats
+from .redis_scripts import eval_many, eval_per_key, eval_script
 
-__all__ = ["RedisConnection"]
\ No newline at end of file
+__all__ = [
+    "RedisClient",
+    "RedisConnection",
+    "RedisPoolSettings",
+    "RedisPoolStats",
+    "eval_many",
+    "eval_per_key",
+    "eval_script",
+]
@@ -0,0 +1,87 @@
+from time import perf_counter
+from typing import Any, List, Optional
+
+from redis.asyncio import Redis, RedisCluster
+from redis.asyncio.client import Pipeline
+from redis.asyncio.cluster import ClusterPipeline
+from redis.exceptions import RedisClusterException
+
+from app.infrastructure.monitoring.request_timing import record_redis_call
+
+
+class InstrumentedPipeline(Pipeline):
+    """실행 시 명령 수와 왕복 시간을 현재 요청에 기록하는 파이프라인"""
+
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        commands = len(self.command_stack)
+        started = perf_counter()
+        try:
+            results: List[Any] = await super().execute(raise_on_error)
+            return results
+        finally:
+            if commands:
+                record_redis_call(commands, perf_counter() - started)
+
+    async def immediate_execute_command(self, *args: Any, **options: Any) -> Any:
+        # WATCH 이후 MULTI 전까지 즉시 실행되는 명령
+        started = perf_counter()
+        try:
+            return await super().immediate_execute_command(*args, **options)
+        finally:
+            record_redis_call(1, perf_counter() - started)
+
+
+class InstrumentedRedis(Redis):
+    """명령 수와 왕복 시간을 현재 요청에 기록하는 Redis 클라이언트"""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        started = perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            record_redis_call(1, perf_counter() - started)
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> InstrumentedPipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+class InstrumentedClusterPipeline(ClusterPipeline):
+    """실행 시 명령 수와 왕복 시간을 현재 요청에 기록하는 클러스터 파이프라인
+
+    노드별로 나뉘어 병렬 전송되지만 호출자 입장에서는 한 번의 왕복으로 기록합니다.
+    """
+
+    async def execute(
+        self, raise_on_error: bool = True, allow_redirections: bool = True
+    ) -> List[Any]:
+        commands = len(self._command_stack)  # type: ignore[attr-defined]
+        started = perf_counter()
+        try:
+            return await super().execute(raise_on_error, allow_redirections)
+        finally:
+            if commands:
+                record_redis_call(commands, perf_counter() - started)
+
+
+class InstrumentedRedisCluster(RedisCluster):
+    """명령 수와 왕복 시간을 현재 요청에 기록하는 Redis Cluster 클라이언트"""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        started = perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            record_redis_call(1, perf_counter() - started)
+
+    def pipeline(
+        self, transaction: Optional[Any] = None, shard_hint: Optional[Any] = None
+    ) -> InstrumentedClusterPipeline:
+        if transaction or shard_hint:
+            raise RedisClusterException(
+                "클러스터 파이프라인은 transaction/shard_hint를 지원하지 않음"
+            )
+        return InstrumentedClusterPipeline(self)
@@ -1,27 +1,63 @@
 import logging
-from typing import Optional
+from typing import Dict, Optional, cast
 
-import redis.asyncio as redis
-from redis.asyncio import Redis
+from redis.asyncio import ConnectionPool, Redis
+
+from .instrumented_redis import InstrumentedRedis, InstrumentedRedisCluster
+from .redis_pool import RedisPoolSettings, RedisPoolStats
 
 logger = logging.getLogger(__name__)
 
+# 단일 노드/클러스터 클라이언트 공통 타입: 저장소가 쓰는 명령/파이프라인 API는 RedisCluster도
+# 같으므로 Redis 타입으로 다룸 (노드 지정 같은 클러스터 전용 기능은 쓰지 않음)
+RedisClient = Redis
+
 
 class RedisConnection:
-    """Redis 연결 관리 클래스"""
+    """Redis 연결 관리 클래스
+
+    cluster=True이면 redis_url의 노드에서 슬롯 배치를 읽어 Redis Cluster 클라이언트로
+    연결합니다. 클러스터 파이프라인은 MULTI/EXEC를 지원하지 않으므로 저장소는
+    `supports_transactions`를 보고 트랜잭션 사용 여부를 정합니다.
+    """
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        pool_settings: Optional[RedisPoolSettings] = None,
+        cluster: bool = False,
+    ):
         self.redis_url = redis_url
-        self._redis: Optional[Redis] = None
+        self.pool_settings = pool_settings or RedisPoolSettings()
+        self.cluster = cluster
+        self._pool: Optional[ConnectionPool] = None
+        self._redis: Optional[RedisClient] = None
+
+    @property
+    def supports_transactions(self) -> bool:
+        """MULTI/EXEC 파이프라인 사용 가능 여부 (클러스터 모드에서는 False)"""
+        return not self.cluster
 
     async def connect(self) -> None:
         """Redis에 연결"""
         try:
-            self._redis = redis.from_url(
-                self.redis_url, 
-                encoding="utf-8", 
-                decode_responses=True
-            )
+            if self.cluster:
+                # 노드마다 커넥션을 따로 관리하므로 공유 풀 대신 노드별 최대 커넥션 수만 지정
+                self._redis = cast(RedisClient, InstrumentedRedisCluster.from_url(
+                    self.redis_url,
+                    encoding="utf-8",
+                    decode_responses=True,
+                    **self.pool_settings.connection_kwargs(),
+                ))
+            else:
+                self._pool = self.pool_settings.pool_class.from_url(
+                    self.redis_url,
+                    encoding="utf-8",
+                    decode_responses=True,
+                    **self.pool_settings.pool_kwargs(),
+                )
+                # 요청별 Redis 명령 수/시간을 기록하는 클라이언트
+                self._redis = InstrumentedRedis(connection_pool=self._pool)
             await self._redis.ping()
             logger.info("Redis 연결 성공")
         except Exception as e:
@@ -29,10 +65,16 @@ class RedisConnection:
             raise
 
     async def disconnect(self) -> None:
-        """Redis 연결 종료"""
-        if self._redis:
-            await self._redis.close()
-            logger.info("Redis 연결 종료")
+        """Redis 연결 종료 (다시 connect하기 전까지 client는 사용할 수 없음)"""
+        if self._redis is None and self._pool is None:
+            return
+        if self._redis is not None:
+            await self._redis.aclose()  # type: ignore[attr-defined]  # types-redis 스텁에 없음
+        if self._pool is not None:
+            await self._pool.disconnect()
+        self._redis = None
+        self._pool = None
+        logger.info("Redis 연결 종료")
 
     async def is_connected(self) -> bool:
         """Redis 연결 상태 확인"""
@@ -44,8 +86,14 @@ class RedisConnection:
             logger.error(f"Redis 연결 확인 실패: {e}")
         return False
 
+    def pool_stats(self) -> Dict[str, RedisPoolStats]:
+        """풀 이름별 커넥션 풀 통계 반환 (클러스터 모드에서는 빈 dict)"""
+        if self._pool is None:
+            return {}
+        return {"default": self._pool.stats()}  # type: ignore[attr-defined]
+
     @property
-    def client(self) -> Redis:
+    def client(self) -> RedisClient:
         """Redis 클라이언트 반환"""
         if not self._redis:
             raise Exception("Redis가 연결되지 않음")
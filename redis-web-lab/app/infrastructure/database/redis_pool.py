@@ -0,0 +1,147 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Type
+
+from redis.asyncio import BlockingConnectionPool, ConnectionPool
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """불리언 환경 변수 읽기"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_float(name: str, default: Optional[float]) -> Optional[float]:
+    """실수 환경 변수 읽기 (빈 값이면 None)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return float(value) if value.strip() else None
+
+
+@dataclass(frozen=True)
+class RedisPoolSettings:
+    """Redis 커넥션 풀 설정"""
+    max_connections: int = 50
+    socket_timeout: Optional[float] = 5.0
+    socket_connect_timeout: Optional[float] = 5.0
+    socket_keepalive: bool = True
+    health_check_interval: int = 30
+    blocking: bool = True
+    pool_timeout: Optional[float] = 5.0
+
+    @classmethod
+    def from_env(cls) -> "RedisPoolSettings":
+        """환경 변수에서 풀 설정 생성"""
+        defaults = cls()
+        return cls(
+            max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", defaults.max_connections)),
+            socket_timeout=_env_float("REDIS_SOCKET_TIMEOUT", defaults.socket_timeout),
+            socket_connect_timeout=_env_float(
+                "REDIS_SOCKET_CONNECT_TIMEOUT", defaults.socket_connect_timeout
+            ),
+            socket_keepalive=_env_bool("REDIS_SOCKET_KEEPALIVE", defaults.socket_keepalive),
+            health_check_interval=int(
+                os.getenv("REDIS_HEALTH_CHECK_INTERVAL", defaults.health_check_interval)
+            ),
+            blocking=_env_bool("REDIS_POOL_BLOCKING", defaults.blocking),
+            pool_timeout=_env_float("REDIS_POOL_TIMEOUT", defaults.pool_timeout),
+        )
+
+    def connection_kwargs(self) -> Dict[str, Any]:
+        """커넥션 수/소켓 관련 인자 (RedisCluster.from_url에서는 노드별 값으로 사용)"""
+        return {
+            "max_connections": self.max_connections,
+            "socket_timeout": self.socket_timeout,
+            "socket_connect_timeout": self.socket_connect_timeout,
+            "socket_keepalive": self.socket_keepalive,
+            "health_check_interval": self.health_check_interval,
+        }
+
+    def pool_kwargs(self) -> Dict[str, Any]:
+        """ConnectionPool.from_url에 넘길 인자"""
+        kwargs = self.connection_kwargs()
+        if self.blocking:
+            kwargs["timeout"] = self.pool_timeout
+        return kwargs
+
+    @property
+    def pool_class(self) -> Type[ConnectionPool]:
+        """설정에 맞는 풀 클래스"""
+        return InstrumentedBlockingConnectionPool if self.blocking else InstrumentedConnectionPool
+
+
+@dataclass
+class RedisPoolStats:
+    """커넥션 풀 통계"""
+    max_connections: int
+    in_use: int
+    idle: int
+    acquisitions: int
+    waits: int
+    wait_seconds: float
+    timeouts: int
+
+
+class _PoolStatsMixin:
+    """커넥션 획득 횟수/대기 횟수/대기 시간을 기록하는 풀 믹스인"""
+
+    max_connections: int
+    _available_connections: list
+    _in_use_connections: Any
+
+    def _reset_stats(self) -> None:
+        self._acquisitions = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._timeouts = 0
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        """커넥션 획득 (유휴 커넥션도 여유 슬롯도 없으면 대기로 기록)"""
+        must_wait = not self._available_connections and (
+            len(self._in_use_connections) >= self.max_connections
+        )
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)  # type: ignore[misc]
+        except Exception:
+            if must_wait:
+                self._timeouts += 1
+            raise
+        finally:
+            if must_wait:
+                self._waits += 1
+                self._wait_seconds += time.perf_counter() - started
+        self._acquisitions += 1
+        return connection
+
+    def stats(self) -> RedisPoolStats:
+        """현재 풀 통계 반환"""
+        return RedisPoolStats(
+            max_connections=self.max_connections,
+            in_use=len(self._in_use_connections),
+            idle=len(self._available_connections),
+            acquisitions=self._acquisitions,
+            waits=self._waits,
+            wait_seconds=self._wait_seconds,
+            timeouts=self._timeouts,
+        )
+
+
+class InstrumentedConnectionPool(_PoolStatsMixin, ConnectionPool):
+    """통계를 기록하는 커넥션 풀 (한도 초과 시 즉시 에러)"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._reset_stats()
+
+
+class InstrumentedBlockingConnectionPool(_PoolStatsMixin, BlockingConnectionPool):
+    """통계를 기록하는 블로킹 커넥션 풀 (한도 초과 시 timeout까지 대기)"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._reset_stats()
@@ -0,0 +1,61 @@
+import hashlib
+from typing import Any, List, Sequence, Tuple
+
+from redis.exceptions import NoScriptError
+
+from .redis_connection import RedisClient
+
+
+async def eval_script(
+    client: RedisClient, script: str, keys: Sequence[str], args: Sequence[Any]
+) -> Any:
+    """스크립트를 EVALSHA 한 번으로 실행 (스크립트가 적재되지 않았으면 SCRIPT LOAD 후 재실행)"""
+    sha = hashlib.sha1(script.encode()).hexdigest()
+    try:
+        return await client.execute_command("EVALSHA", sha, len(keys), *keys, *args)
+    except NoScriptError:
+        await client.script_load(script)
+        return await client.execute_command("EVALSHA", sha, len(keys), *keys, *args)
+
+
+async def eval_per_key(
+    client: RedisClient, script: str, calls: Sequence[Tuple[str, Sequence[Any]]]
+) -> List[Any]:
+    """(키, 인자) 목록마다 스크립트를 실행하되 전체를 파이프라인 한 번으로 처리
+
+    클러스터에서도 항목마다 키가 하나라 슬롯이 섞이지 않습니다. 자세한 동작은 eval_many 참고.
+    """
+    return await eval_many(client, script, [([key], args) for key, args in calls])
+
+
+async def eval_many(
+    client: RedisClient, script: str, calls: Sequence[Tuple[Sequence[str], Sequence[Any]]]
+) -> List[Any]:
+    """(키 목록, 인자) 목록마다 스크립트를 실행하되 전체를 파이프라인 한 번으로 처리
+
+    EVALSHA로 실행하고 스크립트가 적재되지 않은 노드가 있으면(NOSCRIPT) SCRIPT LOAD 후
+    해당 항목만 다시 실행합니다. 클러스터에서는 SCRIPT LOAD가 모든 마스터에 전달됩니다.
+    항목은 파이프라인 순서대로 실행되므로 같은 키를 쓰는 항목끼리는 결과가 순서를 따릅니다.
+    """
+    sha = hashlib.sha1(script.encode()).hexdigest()
+
+    async def run(batch: Sequence[Tuple[Sequence[str], Sequence[Any]]]) -> List[Any]:
+        async with client.pipeline(transaction=False) as pipe:
+            for keys, args in batch:
+                # 클러스터 파이프라인은 evalsha 메서드를 막아 두어 명령을 직접 적재
+                pipe.execute_command("EVALSHA", sha, len(keys), *keys, *args)
+            results: List[Any] = await pipe.execute(raise_on_error=False)
+            return results
+
+    if not calls:
+        return []
+    results = await run(calls)
+    retry = [i for i, result in enumerate(results) if isinstance(result, NoScriptError)]
+    if retry:
+        await client.script_load(script)
+        for i, result in zip(retry, await run([calls[i] for i in retry]), strict=True):
+            results[i] = result
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
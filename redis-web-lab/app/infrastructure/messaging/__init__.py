@@ -0,0 +1,11 @@
+"""Infrastructure messaging package"""
+from .redis_push_events import PushEventHub, RedisPushEventPublisher, push_event_channel
+from .redis_push_status_stream import PushStatusStreamConsumer, RedisPushStatusPublisher
+
+__all__ = [
+    "PushEventHub",
+    "PushStatusStreamConsumer",
+    "RedisPushEventPublisher",
+    "RedisPushStatusPublisher",
+    "push_event_channel",
+]
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, cast
+
+import orjson
+from prometheus_client import Counter, Gauge
+from redis.asyncio import RedisCluster
+from redis.asyncio.connection import AbstractConnection, Connection
+
+from app.domain.entities import PushNotification
+from app.domain.repositories import PushEventPublisher
+from app.infrastructure.database import RedisConnection
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "push_events"
+
+PUSH_EVENT_LISTENERS = Gauge(
+    "push_event_listeners", "이 워커에서 새 푸시를 기다리는 실시간 스트림 수"
+)
+PUSH_EVENT_CHANNELS = Gauge(
+    "push_event_channels", "이 워커가 구독 중인 사용자 채널 수"
+)
+PUSH_EVENTS_DISPATCHED = Counter(
+    "push_events_dispatched", "실시간 스트림으로 나눠 준 새 푸시 이벤트 수", ["result"]
+)
+
+
+def push_event_channel(user_id: str, prefix: str = CHANNEL_PREFIX) -> str:
+    """사용자별 새 푸시 이벤트 채널"""
+    return f"{prefix}:{user_id}"
+
+
+class RedisPushEventPublisher(PushEventPublisher):
+    """저장된 푸시를 사용자별 Redis Pub/Sub 채널로 발행
+
+    메시지는 푸시 알림 응답과 같은 모양의 JSON이며, 여러 건은 파이프라인 한 번으로
+    보냅니다. 클러스터에서도 PUBLISH는 모든 노드로 전파되므로 어느 노드에 보내도 됩니다.
+    """
+
+    def __init__(self, redis_connection: RedisConnection, channel_prefix: str = CHANNEL_PREFIX):
+        self._redis_connection = redis_connection
+        self._channel_prefix = channel_prefix
+
+    async def publish_created(self, push_notifications: List[PushNotification]) -> None:
+        """새 푸시 발행 (실패는 로그만 남김)"""
+        if not push_notifications:
+            return
+        try:
+            async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+                for push_notification in push_notifications:
+                    # 클러스터 파이프라인은 publish 메서드를 막으므로 명령으로 직접 보냄
+                    pipe.execute_command(
+                        "PUBLISH",
+                        push_event_channel(push_notification.user_id, self._channel_prefix),
+                        orjson.dumps(push_notification),
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"새 푸시 이벤트 발행 실패 ({len(push_notifications)}건): {e}")
+
+
+class PushEventHub:
+    """워커마다 Pub/Sub 전용 커넥션 하나로 여러 실시간 스트림에 새 푸시를 나눠 주는 허브
+
+    사용자 채널은 그 사용자의 첫 스트림이 열릴 때 SUBSCRIBE, 마지막 스트림이 닫힐 때
+    UNSUBSCRIBE하므로 스트림이 수천 개여도 Redis 커넥션은 워커당 하나입니다. 스트림마다
+    queue_size개까지 쌓아 두고 넘치면 버립니다(느린 클라이언트가 다른 스트림을 막지 않음).
+    Pub/Sub은 최대 한 번 전달이라 재연결 중 발행된 푸시는 전달되지 않으므로, 클라이언트는
+    스트림을 다시 열 때 목록 조회로 빠진 항목을 확인합니다. close_streams()는 모든 큐에
+    None을 넣어 스트림이 스스로 끝나게 합니다(종료 드레인).
+    """
+
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        channel_prefix: str = CHANNEL_PREFIX,
+        queue_size: int = 100,
+        reconnect_delay_seconds: float = 1.0,
+    ):
+        self._redis_connection = redis_connection
+        self._channel_prefix = channel_prefix
+        self._queue_size = queue_size
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._listeners: Dict[str, Set[asyncio.Queue]] = {}
+        self._confirmed: Dict[str, asyncio.Event] = {}
+        self._lock = asyncio.Lock()
+        self._connection: Optional[AbstractConnection] = None
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """구독 커넥션 연결 (연결될 때까지 대기)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            await asyncio.wait_for(self._ready.wait(), timeout=5)
+
+    async def stop(self) -> None:
+        """구독 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_connection()
+
+    def close_streams(self) -> None:
+        """열려 있는 모든 스트림에 종료(None) 전달 (가득 찬 큐는 가장 오래된 이벤트를 버림)"""
+        for listeners in self._listeners.values():
+            for queue in listeners:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    @asynccontextmanager
+    async def listen(self, user_id: str) -> AsyncIterator[asyncio.Queue]:
+        """사용자의 새 푸시 JSON을 받는 큐 (채널 구독이 확인된 뒤 반환, None이면 종료)"""
+        channel = push_event_channel(user_id, self._channel_prefix)
+        queue: asyncio.Queue = asyncio.Queue(self._queue_size)
+        async with self._lock:
+            listeners = self._listeners.setdefault(channel, set())
+            if not listeners:
+                self._confirmed[channel] = asyncio.Event()
+                PUSH_EVENT_CHANNELS.inc()
+                await self._send("SUBSCRIBE", channel)
+            listeners.add(queue)
+            confirmed = self._confirmed[channel]
+        PUSH_EVENT_LISTENERS.inc()
+        try:
+            await asyncio.wait_for(confirmed.wait(), timeout=5)
+            yield queue
+        finally:
+            PUSH_EVENT_LISTENERS.dec()
+            async with self._lock:
+                listeners.discard(queue)
+                if not listeners:
+                    del self._listeners[channel]
+                    del self._confirmed[channel]
+                    PUSH_EVENT_CHANNELS.dec()
+                    try:
+                        await self._send("UNSUBSCRIBE", channel)
+                    except Exception as e:
+                        logger.warning(f"새 푸시 채널 구독 해제 실패 ({channel}): {e}")
+
+    async def _send(self, *args: str) -> None:
+        """구독 커넥션으로 명령 전송 (끊겨 있으면 재연결 시 현재 채널 전체를 다시 구독)"""
+        if self._connection is not None:
+            await self._connection.send_command(*args)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"새 푸시 이벤트 구독 오류, 재연결합니다: {e}")
+            await self._close_connection()
+            await asyncio.sleep(self._reconnect_delay_seconds)
+
+    async def _listen(self) -> None:
+        connection = await self._open_connection()
+        async with self._lock:
+            self._connection = connection
+            if self._listeners:
+                await connection.send_command("SUBSCRIBE", *self._listeners)
+        self._ready.set()
+        logger.info(f"새 푸시 이벤트 구독 시작 (채널 {len(self._listeners)}개)")
+
+        while True:
+            message: Any = await connection.read_response(timeout=None)
+            if not isinstance(message, list) or len(message) < 3:
+                continue
+            kind, channel = message[0], message[1]
+            if kind == "message":
+                self._dispatch(channel, message[2])
+            elif kind == "subscribe" and channel in self._confirmed:
+                self._confirmed[channel].set()
+
+    def _dispatch(self, channel: str, data: str) -> None:
+        """채널의 모든 스트림 큐에 이벤트 전달 (가득 찬 큐는 건너뜀)"""
+        delivered = dropped = 0
+        for queue in self._listeners.get(channel, ()):
+            try:
+                queue.put_nowait(data)
+                delivered += 1
+            except asyncio.QueueFull:
+                dropped += 1
+        if delivered:
+            PUSH_EVENTS_DISPATCHED.labels(result="delivered").inc(delivered)
+        if dropped:
+            PUSH_EVENTS_DISPATCHED.labels(result="dropped").inc(dropped)
+
+    async def _open_connection(self) -> AbstractConnection:
+        """풀 밖의 전용 커넥션 생성 (클러스터에서는 기본 노드에 연결, 읽기 타임아웃 없음)"""
+        client = self._redis_connection.client
+        if self._redis_connection.cluster:
+            node = cast(RedisCluster, client).get_default_node()
+            connection: AbstractConnection = Connection(
+                host=node.host, port=node.port, encoding="utf-8", decode_responses=True
+            )
+        else:
+            pool = client.connection_pool
+            connection = pool.connection_class(
+                **{**pool.connection_kwargs, "health_check_interval": 0, "socket_timeout": None}
+            )
+        await connection.connect()
+        return connection
+
+    async def _close_connection(self) -> None:
+        async with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.disconnect()
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import os
+import socket
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from prometheus_client import Counter
+from redis.exceptions import ResponseError
+
+from app.domain.entities import PushNotification
+from app.domain.repositories import PushNotificationRepository, PushStatusPublisher
+from app.infrastructure.database import RedisConnection
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = "push_status_events"
+GROUP_NAME = "push_status_workers"
+
+STATUS_EVENTS = Counter(
+    "push_status_events", "처리된 푸시 상태 변경 이벤트 수", ["result"]
+)
+STATUS_EVENTS_RECLAIMED = Counter(
+    "push_status_events_reclaimed", "유휴 상태로 남아 다시 가져온 대기 이벤트 수"
+)
+
+StreamEntry = Tuple[str, dict]
+
+
+class RedisPushStatusPublisher(PushStatusPublisher):
+    """Redis Stream으로 푸시 상태 변경 이벤트를 발행"""
+
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        stream_key: str = STREAM_KEY,
+        max_length: int = 100000,
+    ):
+        self._redis_connection = redis_connection
+        self._stream_key = stream_key
+        self._max_length = max_length
+
+    async def publish(self, push_uuid: UUID, status: str) -> bool:
+        """상태 변경 이벤트 발행 (스트림 길이는 근사 MAXLEN으로 제한)"""
+        try:
+            await self._redis_connection.client.xadd(
+                self._stream_key,
+                {"push_uuid": str(push_uuid), "status": status},
+                maxlen=self._max_length,
+                approximate=True,
+            )
+            return True
+        except Exception as e:
+            logger.error(f"푸시 상태 이벤트 발행 실패: {e}")
+            return False
+
+
+class PushStatusStreamConsumer:
+    """컨슈머 그룹으로 상태 변경 이벤트를 읽어 저장소에 일괄 적용하는 워커
+
+    프로세스마다 workers개의 컨슈머를 띄우며, 각 컨슈머는 XREADGROUP COUNT로 가져온
+    이벤트를 한 번에 적용한 뒤 XACK합니다. 적용 중 오류가 나면 ACK하지 않으므로
+    min_idle_ms가 지난 대기 이벤트를 XAUTOCLAIM으로 다른 컨슈머가 다시 가져갑니다.
+    상태 갱신은 진행 방향으로만 일어나므로 중복/역순 적용에도 결과가 같습니다.
+    """
+
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        push_repository: PushNotificationRepository,
+        stream_key: str = STREAM_KEY,
+        group_name: str = GROUP_NAME,
+        workers: int = 1,
+        batch_size: int = 100,
+        block_ms: int = 1000,
+        min_idle_ms: int = 30000,
+        consumer_prefix: Optional[str] = None,
+    ):
+        self._redis_connection = redis_connection
+        self._push_repository = push_repository
+        self._stream_key = stream_key
+        self._group_name = group_name
+        self._workers = workers
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._min_idle_ms = min_idle_ms
+        self._consumer_prefix = consumer_prefix or f"{socket.gethostname()}-{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+
+    async def start(self) -> None:
+        """컨슈머 그룹 생성 후 워커 시작"""
+        try:
+            await self._redis_connection.client.xgroup_create(
+                self._stream_key, self._group_name, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._stopping = False
+        self._tasks = [
+            asyncio.create_task(self._consume(f"{self._consumer_prefix}-{index}"))
+            for index in range(self._workers)
+        ]
+        logger.info(f"푸시 상태 워커 시작: {self._workers}개")
+
+    async def stop(self, timeout: float = 0.0) -> None:
+        """워커 종료 (최대 timeout초까지 처리 중인 묶음을 적용/ACK하고 멈추기를 기다림)
+
+        시한 안에 끝나지 못해 중단된 이벤트는 ACK 전이므로 대기 목록에 남아 재처리됩니다.
+        """
+        self._stopping = True
+        if self._tasks and timeout > 0:
+            await asyncio.wait(self._tasks, timeout=timeout)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _consume(self, consumer: str) -> None:
+        loop = asyncio.get_running_loop()
+        next_reclaim_at = 0.0
+        while not self._stopping:
+            try:
+                if loop.time() >= next_reclaim_at:
+                    await self._reclaim(consumer)
+                    next_reclaim_at = loop.time() + self._min_idle_ms / 1000
+                await self.process_once(consumer)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"푸시 상태 워커 오류 ({consumer}): {e}")
+                await asyncio.sleep(1)
+
+    async def process_once(self, consumer: str, block_ms: Optional[int] = None) -> int:
+        """새 이벤트를 최대 batch_size개 읽어 적용 (처리한 이벤트 수 반환)"""
+        response = await self._redis_connection.client.xreadgroup(
+            self._group_name,
+            consumer,
+            {self._stream_key: ">"},
+            count=self._batch_size,
+            block=self._block_ms if block_ms is None else block_ms,
+        )
+        entries = [entry for _, stream_entries in response for entry in stream_entries]
+        await self._apply(entries)
+        return len(entries)
+
+    async def _reclaim(self, consumer: str) -> None:
+        """다른(또는 종료된) 컨슈머가 오래 ACK하지 않은 이벤트를 가져와 적용"""
+        start_id = "0-0"
+        while True:
+            start_id, entries, *_ = await self._redis_connection.client.xautoclaim(
+                self._stream_key,
+                self._group_name,
+                consumer,
+                min_idle_time=self._min_idle_ms,
+                start_id=start_id,
+                count=self._batch_size,
+            )
+            # 트리밍으로 본문이 사라진 대기 항목은 (id, None)으로 돌아옴
+            if entries:
+                STATUS_EVENTS_RECLAIMED.inc(len(entries))
+                await self._apply(entries)
+            if start_id == "0-0":
+                return
+
+    async def _apply(self, entries: List[StreamEntry]) -> None:
+        """이벤트 묶음을 저장소에 일괄 적용한 뒤 한 번에 ACK"""
+        if not entries:
+            return
+        entry_ids: List[str] = []
+        updates: List[Tuple[UUID, str]] = []
+        invalid = 0
+        for entry_id, fields in entries:
+            entry_ids.append(entry_id)
+            update = self._parse(fields)
+            if update is None:
+                invalid += 1
+            else:
+                updates.append(update)
+
+        found = await self._push_repository.update_statuses(updates)
+        await self._redis_connection.client.xack(self._stream_key, self._group_name, *entry_ids)
+
+        applied = sum(found)
+        STATUS_EVENTS.labels(result="applied").inc(applied)
+        STATUS_EVENTS.labels(result="missing").inc(len(found) - applied)
+        if invalid:
+            STATUS_EVENTS.labels(result="invalid").inc(invalid)
+            logger.warning(f"잘못된 푸시 상태 이벤트 {invalid}건 건너뜀")
+
+    @staticmethod
+    def _parse(fields: Optional[dict]) -> Optional[Tuple[UUID, str]]:
+        """이벤트 필드를 (push_uuid, status)로 변환 (잘못된 이벤트는 None)"""
+        if not fields:
+            return None
+        try:
+            push_uuid = UUID(fields["push_uuid"])
+            status = fields["status"]
+        except (KeyError, ValueError):
+            return None
+        if status not in PushNotification.STATUS_RANKS:
+            return None
+        return push_uuid, status
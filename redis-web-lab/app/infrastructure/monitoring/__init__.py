@@ -0,0 +1,18 @@
+"""Infrastructure monitoring package"""
+from .redis_pool_collector import RedisPoolCollector
+from .request_timing import (
+    RequestTiming,
+    begin_request_timing,
+    end_request_timing,
+    record_redis_call,
+    timing_span,
+)
+
+__all__ = [
+    "RedisPoolCollector",
+    "RequestTiming",
+    "begin_request_timing",
+    "end_request_timing",
+    "record_redis_call",
+    "timing_span",
+]
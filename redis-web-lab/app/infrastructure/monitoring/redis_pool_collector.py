@@ -0,0 +1,51 @@
+from typing import TYPE_CHECKING, Iterable
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+if TYPE_CHECKING:
+    # database 패키지가 요청 시간 측정을 위해 monitoring을 import하므로 순환 import 방지
+    from app.infrastructure.database import RedisConnection
+
+
+class RedisPoolCollector(Collector):
+    """Redis 커넥션 풀 통계를 Prometheus 메트릭으로 노출하는 수집기"""
+
+    def __init__(self, redis_connection: "RedisConnection"):
+        self._redis_connection = redis_connection
+
+    def describe(self) -> Iterable[Metric]:
+        """등록 시 collect 호출을 피하기 위해 빈 설명 반환"""
+        return []
+
+    def collect(self) -> Iterable[Metric]:
+        """스크레이프 시점의 풀 통계 수집"""
+        connections = GaugeMetricFamily(
+            "redis_pool_connections", "Redis 풀 커넥션 수", labels=["pool", "state"]
+        )
+        max_connections = GaugeMetricFamily(
+            "redis_pool_max_connections", "Redis 풀 최대 커넥션 수", labels=["pool"]
+        )
+        acquisitions = CounterMetricFamily(
+            "redis_pool_acquisitions", "Redis 풀 커넥션 획득 횟수", labels=["pool"]
+        )
+        waits = CounterMetricFamily(
+            "redis_pool_waits", "유휴 커넥션이 없어 대기한 획득 횟수", labels=["pool"]
+        )
+        wait_seconds = CounterMetricFamily(
+            "redis_pool_wait_seconds", "커넥션 획득 대기 누적 시간(초)", labels=["pool"]
+        )
+        timeouts = CounterMetricFamily(
+            "redis_pool_timeouts", "대기 중 타임아웃/한도 초과로 실패한 획득 횟수", labels=["pool"]
+        )
+
+        for pool, stats in self._redis_connection.pool_stats().items():
+            connections.add_metric([pool, "in_use"], stats.in_use)
+            connections.add_metric([pool, "idle"], stats.idle)
+            max_connections.add_metric([pool], stats.max_connections)
+            acquisitions.add_metric([pool], stats.acquisitions)
+            waits.add_metric([pool], stats.waits)
+            wait_seconds.add_metric([pool], stats.wait_seconds)
+            timeouts.add_metric([pool], stats.timeouts)
+
+        return [connections, max_connections, acquisitions, waits, wait_seconds, timeouts]
@@ -0,0 +1,66 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+
+@dataclass
+class RequestTiming:
+    """요청 하나 동안 누적되는 시간 측정값"""
+    redis_commands: int = 0
+    redis_round_trips: int = 0
+    redis_seconds: float = 0.0
+    spans: Dict[str, float] = field(default_factory=dict)
+    _active_spans: Set[str] = field(default_factory=set)
+
+    def server_timing(self, total_seconds: float) -> str:
+        """Server-Timing 헤더 값 (밀리초)"""
+        parts = [
+            f"total;dur={total_seconds * 1000:.2f}",
+            f'redis;dur={self.redis_seconds * 1000:.2f};'
+            f'desc="{self.redis_commands} cmds/{self.redis_round_trips} rtt"',
+        ]
+        parts.extend(f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.spans.items())
+        return ", ".join(parts)
+
+
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar(
+    "request_timing", default=None
+)
+
+
+def begin_request_timing() -> Tuple[RequestTiming, Token]:
+    """현재 컨텍스트에서 요청 시간 측정 시작"""
+    timing = RequestTiming()
+    return timing, _current_timing.set(timing)
+
+
+def end_request_timing(token: Token) -> None:
+    """요청 시간 측정 종료"""
+    _current_timing.reset(token)
+
+
+def record_redis_call(commands: int, seconds: float) -> None:
+    """Redis 왕복 한 번 기록 (요청 밖에서 호출되면 무시)"""
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.redis_commands += commands
+        timing.redis_round_trips += 1
+        timing.redis_seconds += seconds
+
+
+@contextmanager
+def timing_span(name: str) -> Iterator[None]:
+    """이름별 구간 시간 누적 (같은 이름의 중첩 구간은 바깥 구간만 측정)"""
+    timing = _current_timing.get()
+    if timing is None or name in timing._active_spans:
+        yield
+        return
+    timing._active_spans.add(name)
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        timing.spans[name] = timing.spans.get(name, 0.0) + perf_counter() - started
+        timing._active_spans.discard(name)
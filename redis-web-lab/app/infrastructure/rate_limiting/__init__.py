@@ -0,0 +1,4 @@
+"""Infrastructure rate limiting package"""
+from .redis_rate_limiter import PushRateLimiter, RateLimit, RateLimitDecision
+
+__all__ = ["PushRateLimiter", "RateLimit", "RateLimitDecision"]
@@ -0,0 +1,196 @@
+import logging
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from prometheus_client import Counter
+
+from app.infrastructure.database import RedisConnection, eval_many
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_DECISIONS = Counter(
+    "push_rate_limit_decisions", "푸시 생성 요청 제한 판정 수", ["scope", "result"]
+)
+
+# KEYS의 토큰 버킷을 모두 충전한 뒤, 모든 버킷에 cost만큼 남아 있을 때만 함께 차감
+# (시각은 Redis 서버 기준이라 워커 간 시계 차이와 무관)
+# ARGV: cost, 키마다 (초당 충전량, 최대 토큰)
+# 반환: {허용 여부, 재시도까지 남은 시간(µs), 가장 오래 기다려야 하는 버킷 번호(1부터, 허용 시 0)}
+_TOKEN_BUCKET_SCRIPT = """
+local cost = tonumber(ARGV[1])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local tokens = {}
+local retry_us = 0
+local denied = 0
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2])
+    local burst = tonumber(ARGV[i * 2 + 1])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local last = tonumber(state[2]) or now
+    local refill = math.max(0, now - last) * rate / 1000000
+    tokens[i] = math.min(burst, (tonumber(state[1]) or burst) + refill)
+    if tokens[i] < cost then
+        local wait = math.ceil((cost - tokens[i]) * 1000000 / rate)
+        if wait > retry_us then
+            retry_us = wait
+            denied = i
+        end
+    end
+end
+for i, key in ipairs(KEYS) do
+    if denied == 0 then
+        tokens[i] = tokens[i] - cost
+    end
+    -- 비어 있던 버킷이 가득 찰 때까지 걸리는 시간 + 1초 후 만료 (가득 찬 버킷은 키가 없어도 같음)
+    local ttl_ms = math.ceil(tonumber(ARGV[i * 2 + 1]) * 1000 / tonumber(ARGV[i * 2])) + 1000
+    redis.call('HSET', key, 'tokens', tokens[i], 'ts', now)
+    redis.call('PEXPIRE', key, ttl_ms)
+end
+if denied == 0 then
+    return {1, 0, 0}
+end
+return {0, retry_us, denied}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """토큰 버킷 한도 (초당 rate개 충전, 최대 burst개까지 한 번에 허용)"""
+    rate: float
+    burst: int
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError(f"Invalid rate limit: {self.rate}/{self.burst}")
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> Optional["RateLimit"]:
+        """`초당 개수[/최대 개수]` 형식 해석 (빈 값이면 None, 최대 개수 기본값은 초당 개수 올림)"""
+        if not value or not value.strip():
+            return None
+        rate, _, burst = value.strip().partition("/")
+        return cls(
+            rate=float(rate), burst=int(burst) if burst else max(1, math.ceil(float(rate)))
+        )
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """요청 제한 판정 결과"""
+    allowed: bool
+    retry_after: float = 0.0
+    scope: Optional[str] = None
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After 헤더 값 (정수 초, 올림)"""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class PushRateLimiter:
+    """사용자/토픽별 푸시 생성 요청 제한
+
+    사용자/토픽 버킷을 Redis Lua 토큰 버킷 스크립트 한 번(EVALSHA, 한 번의 왕복)으로 확인하고
+    모든 버킷에 여유가 있을 때만 함께 차감합니다. 클러스터에서는 두 버킷이 다른 슬롯에 있어
+    버킷마다 스크립트를 실행하되 파이프라인 한 번으로 보내며, 이때는 버킷별로 따로 차감되어
+    한쪽에서 거절된 요청도 다른 버킷의 토큰은 사용합니다.
+    판정 중 Redis 오류가 나면 요청을 허용합니다(fail-open).
+    """
+
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        user_limit: Optional[RateLimit] = None,
+        topic_limit: Optional[RateLimit] = None,
+        key_prefix: str = "rate_limit:push",
+    ):
+        self._redis_connection = redis_connection
+        self._user_limit = user_limit
+        self._topic_limit = topic_limit
+        self._key_prefix = key_prefix
+
+    async def check(
+        self, user_id: Optional[str], topic: Optional[str] = None
+    ) -> RateLimitDecision:
+        """푸시 하나 생성 가능 여부 확인 (topic/user_id가 없으면 해당 한도는 확인하지 않음)"""
+        return (await self.check_many([(user_id, topic)]))[0]
+
+    async def check_many(
+        self, requests: Sequence[Tuple[Optional[str], Optional[str]]]
+    ) -> List[RateLimitDecision]:
+        """(user_id, topic) 목록의 푸시를 순서대로 하나씩 판정 (전체를 파이프라인 한 번으로 확인)
+
+        일괄 생성처럼 요청 하나에 푸시가 여럿이면 푸시마다 토큰을 차감하므로, 앞 항목이 버킷을
+        비우면 같은 사용자/토픽의 뒤 항목은 거절됩니다.
+        """
+        bucket_sets = [self._buckets(user_id, topic) for user_id, topic in requests]
+        if not any(bucket_sets):
+            return [RateLimitDecision(allowed=True) for _ in requests]
+
+        try:
+            outcomes = await self._run(bucket_sets)
+        except Exception as e:
+            logger.warning(f"요청 제한 확인 실패, 요청을 허용합니다: {e}")
+            RATE_LIMIT_DECISIONS.labels(scope="all", result="error").inc()
+            return [RateLimitDecision(allowed=True) for _ in requests]
+
+        decisions: List[RateLimitDecision] = []
+        for buckets, (allowed, retry_us, denied) in zip(bucket_sets, outcomes, strict=True):
+            if allowed:
+                for scope, _, _ in buckets:
+                    RATE_LIMIT_DECISIONS.labels(scope=scope, result="allowed").inc()
+                decisions.append(RateLimitDecision(allowed=True))
+                continue
+            scope = buckets[denied - 1][0]
+            RATE_LIMIT_DECISIONS.labels(scope=scope, result="denied").inc()
+            decisions.append(
+                RateLimitDecision(allowed=False, retry_after=retry_us / 1_000_000, scope=scope)
+            )
+        return decisions
+
+    def _buckets(
+        self, user_id: Optional[str], topic: Optional[str]
+    ) -> List[Tuple[str, str, RateLimit]]:
+        """푸시 하나가 차감할 (범위, 키, 한도) 목록"""
+        buckets: List[Tuple[str, str, RateLimit]] = []
+        if self._user_limit is not None and user_id is not None:
+            buckets.append(("user", f"{self._key_prefix}:user:{user_id}", self._user_limit))
+        if self._topic_limit is not None and topic is not None:
+            buckets.append(("topic", f"{self._key_prefix}:topic:{topic}", self._topic_limit))
+        return buckets
+
+    async def _run(
+        self, bucket_sets: List[List[Tuple[str, str, RateLimit]]]
+    ) -> List[Tuple[int, int, int]]:
+        """푸시별 버킷 확인 스크립트 실행 → [(허용 여부, 재시도 대기 µs, 거절한 버킷 번호)]"""
+        calls: List[Tuple[List[str], List[float]]] = []
+        for buckets in bucket_sets:
+            if not buckets:
+                continue
+            if not self._redis_connection.cluster:
+                args: List[float] = [1]
+                for _, _, limit in buckets:
+                    args.extend((limit.rate, limit.burst))
+                calls.append(([key for _, key, _ in buckets], args))
+            else:
+                # 버킷이 다른 슬롯에 있을 수 있어 버킷마다 따로 실행
+                calls.extend(([key], [1, limit.rate, limit.burst]) for _, key, limit in buckets)
+        results = iter(await eval_many(self._redis_connection.client, _TOKEN_BUCKET_SCRIPT, calls))
+
+        outcomes: List[Tuple[int, int, int]] = []
+        for buckets in bucket_sets:
+            if not buckets:
+                outcomes.append((1, 0, 0))
+            elif not self._redis_connection.cluster:
+                allowed, retry_us, denied = next(results)
+                outcomes.append((allowed, retry_us, denied))
+            else:
+                retry_us, denied = 0, 0
+                for number in range(1, len(buckets) + 1):
+                    allowed, bucket_retry_us, _ = next(results)
+                    if not allowed and bucket_retry_us > retry_us:
+                        retry_us, denied = bucket_retry_us, number
+                outcomes.append((int(denied == 0), retry_us, denied))
+        return outcomes
@@ -1,4 +1,18 @@
 """Infrastructure repositories package"""
+from .cached_push_notification_repository import (
+    CachedPushNotificationRepository,
+    RedisTrackingInvalidator,
+)
+from .redis_broadcast_job_repository import RedisBroadcastJobRepository
 from .redis_push_notification_repository import RedisPushNotificationRepository
+from .redis_push_stats_repository import RedisPushStatsRepository
+from .redis_topic_subscription_repository import RedisTopicSubscriptionRepository
 
-__all__ = ["RedisPushNotificationRepository"]
\ No newline at end of file
+__all__ = [
+    "CachedPushNotificationRepository",
+    "RedisBroadcastJobRepository",
+    "RedisPushNotificationRepository",
+    "RedisPushStatsRepository",
+    "RedisTopicSubscriptionRepository",
+    "RedisTrackingInvalidator",
+]
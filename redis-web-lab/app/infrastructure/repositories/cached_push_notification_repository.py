@@ -0,0 +1,295 @@
+import asyncio
+import dataclasses
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from prometheus_client import Counter, Gauge
+from redis.asyncio.connection import AbstractConnection
+
+from app.domain.entities import PushNotification, PushNotificationPage
+from app.domain.repositories import PushNotificationRepository
+from app.infrastructure.database import RedisConnection
+
+logger = logging.getLogger(__name__)
+
+CACHE_REQUESTS = Counter(
+    "push_cache_requests", "푸시 조회 캐시 요청 수", ["result"]
+)
+CACHE_EVICTIONS = Counter(
+    "push_cache_evictions", "용량 초과로 제거된 캐시 항목 수"
+)
+CACHE_INVALIDATIONS = Counter(
+    "push_cache_invalidations", "무효화된 캐시 항목 수", ["source"]
+)
+CACHE_SIZE = Gauge("push_cache_entries", "현재 캐시 항목 수")
+
+
+class CachedPushNotificationRepository(PushNotificationRepository):
+    """프로세스 내 LRU/TTL 캐시를 얹은 푸시 알림 저장소 데코레이터
+
+    ID 단건 조회만 캐시하며, 항목의 만료 시각은 max_age와 Redis 키의 남은 TTL 중
+    이른 쪽으로 정해 Redis에서 사라진 기록을 돌려주지 않습니다. 이 저장소를 통한
+    저장/삭제는 해당 항목을 즉시 무효화합니다.
+    """
+
+    def __init__(
+        self,
+        inner: PushNotificationRepository,
+        max_entries: int = 10000,
+        max_age_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._inner = inner
+        self._max_entries = max_entries
+        self._max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[UUID, Tuple[PushNotification, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def next_identity(self, user_id: str) -> UUID:
+        return self._inner.next_identity(user_id)
+
+    async def save(self, push_notification: PushNotification) -> bool:
+        """푸시 알림 저장 (캐시 무효화)"""
+        self.invalidate(push_notification.push_uuid)
+        return await self._inner.save(push_notification)
+
+    async def save_many(self, push_notifications: List[PushNotification]) -> List[bool]:
+        """푸시 알림 일괄 저장 (캐시 무효화)"""
+        for push_notification in push_notifications:
+            self.invalidate(push_notification.push_uuid)
+        return await self._inner.save_many(push_notifications)
+
+    async def find_by_id(self, push_uuid: UUID) -> Optional[PushNotification]:
+        """ID로 푸시 알림 조회 (캐시 우선)"""
+        entity, _ = await self.find_by_id_with_ttl(push_uuid)
+        return entity
+
+    async def find_by_id_with_ttl(
+        self, push_uuid: UUID
+    ) -> Tuple[Optional[PushNotification], Optional[float]]:
+        """ID로 푸시 알림과 남은 보존 시간 조회 (캐시 우선)"""
+        cached = self._get(push_uuid)
+        if cached is not None:
+            entity, expires_at = cached
+            return entity, expires_at - self._clock()
+
+        found, ttl = await self._inner.find_by_id_with_ttl(push_uuid)
+        if found is None:
+            return None, ttl
+        self._put(found, ttl)
+        return self._copy(found), ttl
+
+    async def find_many(self, push_uuids: List[UUID]) -> List[PushNotification]:
+        """여러 ID로 푸시 알림 일괄 조회 (캐시에 없는 항목만 저장소에서 조회)"""
+        found: Dict[UUID, PushNotification] = {}
+        missing: List[UUID] = []
+        for push_uuid in push_uuids:
+            cached = self._get(push_uuid)
+            if cached is not None:
+                found[push_uuid] = cached[0]
+            else:
+                missing.append(push_uuid)
+
+        if missing:
+            for entity in await self._inner.find_many(missing):
+                found[entity.push_uuid] = entity
+        return [found[push_uuid] for push_uuid in push_uuids if push_uuid in found]
+
+    async def find_by_user_id(self, user_id: str, limit: int = 10) -> List[PushNotification]:
+        """사용자 ID로 푸시 알림 목록 조회"""
+        return await self._inner.find_by_user_id(user_id, limit)
+
+    async def find_by_topic(self, topic: str, limit: int = 10) -> List[PushNotification]:
+        """토픽으로 푸시 알림 목록 조회"""
+        return await self._inner.find_by_topic(topic, limit)
+
+    async def find_page_by_user_id(
+        self, user_id: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> PushNotificationPage:
+        """사용자 ID로 푸시 알림 페이지 조회"""
+        return await self._inner.find_page_by_user_id(user_id, limit, cursor)
+
+    async def find_page_by_topic(
+        self, topic: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> PushNotificationPage:
+        """토픽으로 푸시 알림 페이지 조회"""
+        return await self._inner.find_page_by_topic(topic, limit, cursor)
+
+    async def update_status(self, push_uuid: UUID, status: str) -> bool:
+        """푸시 알림 상태 변경 (캐시 무효화)"""
+        self.invalidate(push_uuid)
+        return await self._inner.update_status(push_uuid, status)
+
+    async def update_statuses(self, updates: List[Tuple[UUID, str]]) -> List[bool]:
+        """푸시 알림 상태 일괄 변경 (캐시 무효화)"""
+        for push_uuid, _ in updates:
+            self.invalidate(push_uuid)
+        return await self._inner.update_statuses(updates)
+
+    async def delete(self, push_uuid: UUID) -> bool:
+        """푸시 알림 삭제 (캐시 무효화)"""
+        self.invalidate(push_uuid)
+        return await self._inner.delete(push_uuid)
+
+    async def exists(self, push_uuid: UUID) -> bool:
+        """푸시 알림 존재 여부 확인 (캐시 우선)"""
+        if self._get(push_uuid) is not None:
+            return True
+        return await self._inner.exists(push_uuid)
+
+    def invalidate(self, push_uuid: UUID, source: str = "local") -> None:
+        """캐시 항목 무효화"""
+        if self._entries.pop(push_uuid, None) is not None:
+            CACHE_INVALIDATIONS.labels(source=source).inc()
+            CACHE_SIZE.set(len(self._entries))
+
+    def clear(self, source: str = "local") -> None:
+        """캐시 전체 무효화"""
+        if self._entries:
+            CACHE_INVALIDATIONS.labels(source=source).inc(len(self._entries))
+        self._entries.clear()
+        CACHE_SIZE.set(0)
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계 반환"""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def _get(self, push_uuid: UUID) -> Optional[Tuple[PushNotification, float]]:
+        """만료되지 않은 캐시 항목 조회 (호출자에게는 복사본 반환)"""
+        cached = self._entries.get(push_uuid)
+        if cached is not None and cached[1] > self._clock():
+            self._entries.move_to_end(push_uuid)
+            self.hits += 1
+            CACHE_REQUESTS.labels(result="hit").inc()
+            return self._copy(cached[0]), cached[1]
+
+        if cached is not None:
+            del self._entries[push_uuid]
+            CACHE_SIZE.set(len(self._entries))
+        self.misses += 1
+        CACHE_REQUESTS.labels(result="miss").inc()
+        return None
+
+    def _put(self, entity: PushNotification, ttl: Optional[float]) -> None:
+        """캐시 항목 저장 (max_age와 Redis TTL 중 짧은 쪽으로 만료)"""
+        max_age = self._max_age_seconds if ttl is None else min(self._max_age_seconds, ttl)
+        if max_age <= 0:
+            return
+        self._entries[entity.push_uuid] = (self._copy(entity), self._clock() + max_age)
+        self._entries.move_to_end(entity.push_uuid)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            CACHE_EVICTIONS.inc()
+        CACHE_SIZE.set(len(self._entries))
+
+    @staticmethod
+    def _copy(entity: PushNotification) -> PushNotification:
+        """엔티티는 변경 가능하므로 캐시 내부 객체를 공유하지 않도록 복사"""
+        return dataclasses.replace(entity)
+
+
+class RedisTrackingInvalidator:
+    """Redis CLIENT TRACKING(BCAST) 무효화 메시지로 워커 간 캐시를 무효화
+
+    RESP2에서 동작하도록 무효화 메시지를 `__redis__:invalidate` 채널을 구독한
+    전용 커넥션으로 REDIRECT 받습니다. 구독이 끊기면 놓친 무효화가 있을 수 있으므로
+    캐시를 비운 뒤 재연결합니다.
+    """
+
+    _CHANNEL = "__redis__:invalidate"
+
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        cache: CachedPushNotificationRepository,
+        prefix: str = "push:",
+        reconnect_delay_seconds: float = 1.0,
+    ):
+        self._redis_connection = redis_connection
+        self._cache = cache
+        self._prefix = prefix
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._connections: List[AbstractConnection] = []
+        self._ready = asyncio.Event()
+
+    async def start(self) -> None:
+        """무효화 수신 시작 (구독 완료까지 대기)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            await asyncio.wait_for(self._ready.wait(), timeout=5)
+
+    async def stop(self) -> None:
+        """무효화 수신 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_connections()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"캐시 무효화 구독 오류, 재연결합니다: {e}")
+            self._cache.clear(source="tracking_reset")
+            await self._close_connections()
+            await asyncio.sleep(self._reconnect_delay_seconds)
+
+    async def _listen(self) -> None:
+        subscriber = await self._open_connection()
+        await subscriber.send_command("CLIENT", "ID")
+        subscriber_id = await subscriber.read_response()
+        await subscriber.send_command("SUBSCRIBE", self._CHANNEL)
+        await subscriber.read_response()
+
+        # BCAST 모드는 읽은 키와 무관하게 prefix에 해당하는 모든 변경을 알려줌
+        tracker = await self._open_connection()
+        await tracker.send_command(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", subscriber_id, "BCAST", "PREFIX", self._prefix
+        )
+        await tracker.read_response()
+        self._ready.set()
+        logger.info("캐시 무효화 구독 시작 (CLIENT TRACKING BCAST)")
+
+        while True:
+            message: Any = await subscriber.read_response(timeout=None)
+            if not isinstance(message, list) or len(message) < 3 or message[0] != "message":
+                continue
+            keys = message[2]
+            if keys is None:
+                # FLUSHDB/FLUSHALL
+                self._cache.clear(source="tracking")
+                continue
+            for key in keys:
+                try:
+                    # `push:<uuid>`, 해시 태그 사용 시 `push:{tag}:<uuid>`
+                    self._cache.invalidate(UUID(key.rsplit(":", 1)[-1]), source="tracking")
+                except ValueError:
+                    continue
+
+    async def _open_connection(self) -> AbstractConnection:
+        """풀 밖의 전용 커넥션 생성 (헬스체크/읽기 타임아웃 없음)"""
+        pool = self._redis_connection.client.connection_pool
+        connection: AbstractConnection = pool.connection_class(
+            **{**pool.connection_kwargs, "health_check_interval": 0, "socket_timeout": None}
+        )
+        await connection.connect()
+        self._connections.append(connection)
+        return connection
+
+    async def _close_connections(self) -> None:
+        for connection in self._connections:
+            await connection.disconnect()
+        self._connections.clear()
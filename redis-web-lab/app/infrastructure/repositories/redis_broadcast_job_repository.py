@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import Dict, Optional, Union
+from uuid import UUID
+
+from app.domain.entities import BroadcastJob
+from app.domain.repositories import BroadcastJobRepository
+from app.infrastructure.database import RedisConnection
+
+
+class RedisBroadcastJobRepository(BroadcastJobRepository):
+    """Redis Hash 기반 일괄 발송 작업 저장소
+
+    작업은 `broadcast_job:<job_id>` Hash 하나에 저장하고 ttl_seconds 뒤 만료됩니다.
+    진행 수치는 HINCRBY로 누적하므로 여러 워커가 같은 작업을 나눠 처리해도 안전합니다.
+    Redis 오류는 그대로 전달합니다.
+    """
+
+    def __init__(self, redis_connection: RedisConnection, ttl_seconds: int = 86400):
+        self._redis_connection = redis_connection
+        self._ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def job_key(job_id: UUID) -> str:
+        """작업 Hash 키"""
+        return f"broadcast_job:{job_id}"
+
+    async def save(self, job: BroadcastJob) -> None:
+        """작업 저장 (TTL 설정)"""
+        mapping: Dict[Union[str, bytes], Union[str, int]] = {
+            "job_id": str(job.job_id),
+            "topic": job.topic,
+            "message": job.message,
+            "status": job.status,
+            "created_at": job.created_at.isoformat(),
+            "total": job.total,
+            "succeeded": job.succeeded,
+            "failed": job.failed,
+        }
+        if job.finished_at is not None:
+            mapping["finished_at"] = job.finished_at.isoformat()
+        key = self.job_key(job.job_id)
+        async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self._ttl_seconds)
+            await pipe.execute()
+
+    async def find_by_id(self, job_id: UUID) -> Optional[BroadcastJob]:
+        """ID로 작업 조회"""
+        data = await self._redis_connection.client.hgetall(self.job_key(job_id))
+        if not data:
+            return None
+        return BroadcastJob(
+            job_id=UUID(data["job_id"]),
+            topic=data["topic"],
+            message=data["message"],
+            status=data["status"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            total=int(data.get("total", 0)),
+            succeeded=int(data.get("succeeded", 0)),
+            failed=int(data.get("failed", 0)),
+            finished_at=(
+                datetime.fromisoformat(data["finished_at"]) if "finished_at" in data else None
+            ),
+        )
+
+    async def update_status(
+        self, job_id: UUID, status: str, total: Optional[int] = None
+    ) -> None:
+        """작업 상태 변경 (total을 주면 대상 구독자 수도 기록, 종료 상태면 종료 시각 기록)"""
+        mapping: Dict[Union[str, bytes], Union[str, int]] = {"status": status}
+        if total is not None:
+            mapping["total"] = total
+        if status in BroadcastJob.FINISHED_STATUSES:
+            mapping["finished_at"] = datetime.now().isoformat()
+        await self._redis_connection.client.hset(self.job_key(job_id), mapping=mapping)
+
+    async def add_progress(self, job_id: UUID, succeeded: int, failed: int) -> None:
+        """처리 결과를 HINCRBY로 누적 (파이프라인 한 번)"""
+        key = self.job_key(job_id)
+        async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+            pipe.hincrby(key, "succeeded", succeeded)
+            pipe.hincrby(key, "failed", failed)
+            await pipe.execute()
@@ -1,91 +1,100 @@
+import base64
+import binascii
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from app.domain.entities import PushNotification
+from app.domain.entities import PushNotification, PushNotificationPage
 from app.domain.repositories import PushNotificationRepository
+from app.infrastructure.codecs import PushRecordCodec
 from app.infrastructure.database import RedisConnection
+from app.infrastructure.storage import IndexPosition, RedisPushRecordStore, RedisPushStatsStore
 
 logger = logging.getLogger(__name__)
 
 
 class RedisPushNotificationRepository(PushNotificationRepository):
-    """Redis 기반 푸시 알림 저장소 구현체"""
+    """Redis 기반 푸시 알림 저장소 구현체
 
-    _TTL_SECONDS = 60
+    키 구조와 Redis 접근은 RedisPushRecordStore가 담당하며, 이 클래스는 도메인 인터페이스와
+    오류 처리 정책(로그 후 실패 값 반환), 커서 인코딩만 맡습니다. store를 주면 나머지 저장
+    설정 인자는 무시하고 그 엔진을 그대로 사용합니다 (PushStoreSettings.create_store 참고).
+    """
 
-    def __init__(self, redis_connection: RedisConnection):
-        self._redis_connection = redis_connection
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        codec: Optional[PushRecordCodec] = None,
+        ttl_seconds: int = 60,
+        topic_shard_seconds: int = 0,
+        stats: Optional[RedisPushStatsStore] = None,
+        store: Optional[RedisPushRecordStore] = None,
+    ):
+        self._store = store or RedisPushRecordStore(
+            redis_connection,
+            codec=codec,
+            ttl_seconds=ttl_seconds,
+            topic_shard_seconds=topic_shard_seconds,
+            stats=stats,
+        )
+
+    @property
+    def store(self) -> RedisPushRecordStore:
+        """저장 엔진 (키 구조를 공유해야 하는 백그라운드 작업용)"""
+        return self._store
+
+    def next_identity(self, user_id: str) -> UUID:
+        """새 푸시 uuid 발급 (클러스터에서는 사용자 인덱스와 같은 슬롯에 놓이는 uuid)"""
+        return self._store.next_identity(user_id)
 
     async def save(self, push_notification: PushNotification) -> bool:
         """푸시 알림 저장"""
         try:
-            redis_client = self._redis_connection.client
-            
-            # 메인 데이터를 Hash로 저장
-            key = f"push:{push_notification.push_uuid}"
-            data = {
-                "push_uuid": str(push_notification.push_uuid),
-                "user_id": push_notification.user_id,
-                "message": push_notification.message,
-                "topic": push_notification.topic,
-                "created_at": push_notification.created_at.isoformat(),
-                "api_call_time": push_notification.api_call_time.isoformat(),
-                "status": push_notification.status,
-            }
-            
-            await redis_client.hset(key, mapping=data)
-            
-            # TTL 설정 (1분)
-            await redis_client.expire(key, self._TTL_SECONDS)
-            
-            # 사용자별 인덱스 추가
-            user_key = f"user_pushes:{push_notification.user_id}"
-            await redis_client.sadd(user_key, str(push_notification.push_uuid))
-            await redis_client.expire(user_key, self._TTL_SECONDS)
-            
-            # 토픽별 인덱스 추가
-            topic_key = f"topic_pushes:{push_notification.topic}"
-            await redis_client.sadd(topic_key, str(push_notification.push_uuid))
-            await redis_client.expire(topic_key, self._TTL_SECONDS)
-            
+            await self._store.save(push_notification)
             logger.info(f"푸시 기록 저장 성공: {push_notification.push_uuid}")
             return True
         except Exception as e:
             logger.error(f"푸시 기록 저장 실패: {e}")
             return False
 
+    async def save_many(self, push_notifications: List[PushNotification]) -> List[bool]:
+        """푸시 알림 일괄 저장 (입력 순서대로 항목별 성공 여부 반환)"""
+        results = await self._store.save_many(push_notifications)
+        if push_notifications:
+            logger.info(f"푸시 기록 일괄 저장: {sum(results)}/{len(results)}건 성공")
+        return results
+
     async def find_by_id(self, push_uuid: UUID) -> Optional[PushNotification]:
         """ID로 푸시 알림 조회"""
         try:
-            redis_client = self._redis_connection.client
-            key = f"push:{push_uuid}"
-            record_data = await redis_client.hgetall(key)
-            
-            if not record_data:
-                return None
-            
-            return self._to_entity(record_data)
+            return await self._store.get(push_uuid)
         except Exception as e:
             logger.error(f"푸시 기록 조회 실패: {e}")
             return None
 
+    async def find_by_id_with_ttl(
+        self, push_uuid: UUID
+    ) -> Tuple[Optional[PushNotification], Optional[float]]:
+        """ID로 푸시 알림과 남은 TTL(초)을 한 번의 왕복으로 조회"""
+        try:
+            return await self._store.get_with_ttl(push_uuid)
+        except Exception as e:
+            logger.error(f"푸시 기록 조회 실패: {e}")
+            return None, None
+
+    async def find_many(self, push_uuids: List[UUID]) -> List[PushNotification]:
+        """여러 ID로 푸시 알림 일괄 조회 (입력 순서 유지, 없는 항목 제외)"""
+        try:
+            return await self._store.get_many(push_uuids)
+        except Exception as e:
+            logger.error(f"푸시 기록 일괄 조회 실패: {e}")
+            return []
+
     async def find_by_user_id(self, user_id: str, limit: int = 10) -> List[PushNotification]:
         """사용자 ID로 푸시 알림 목록 조회"""
         try:
-            redis_client = self._redis_connection.client
-            user_key = f"user_pushes:{user_id}"
-            push_uuids = await redis_client.smembers(user_key)
-            
-            entities = []
-            for push_uuid in list(push_uuids)[:limit]:
-                entity = await self.find_by_id(UUID(push_uuid))
-                if entity:
-                    entities.append(entity)
-            
-            # 생성시간 기준 내림차순 정렬
-            entities.sort(key=lambda x: x.created_at, reverse=True)
-            return entities
+            items, _ = await self._store.find_user_page(user_id, limit)
+            return items
         except Exception as e:
             logger.error(f"사용자 푸시 기록 조회 실패: {e}")
             return []
@@ -93,46 +102,53 @@ class RedisPushNotificationRepository(PushNotificationRepository):
     async def find_by_topic(self, topic: str, limit: int = 10) -> List[PushNotification]:
         """토픽으로 푸시 알림 목록 조회"""
         try:
-            redis_client = self._redis_connection.client
-            topic_key = f"topic_pushes:{topic}"
-            push_uuids = await redis_client.smembers(topic_key)
-            
-            entities = []
-            for push_uuid in list(push_uuids)[:limit]:
-                entity = await self.find_by_id(UUID(push_uuid))
-                if entity:
-                    entities.append(entity)
-            
-            # 생성시간 기준 내림차순 정렬
-            entities.sort(key=lambda x: x.created_at, reverse=True)
-            return entities
+            items, _ = await self._store.find_topic_page(topic, limit)
+            return items
         except Exception as e:
             logger.error(f"토픽 푸시 기록 조회 실패: {e}")
             return []
 
+    async def find_page_by_user_id(
+        self, user_id: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> PushNotificationPage:
+        """사용자 ID로 푸시 알림 페이지 조회 (최신순, 커서 이후부터)"""
+        position = self._decode_cursor(cursor) if cursor else None
+        try:
+            return self._to_page(*await self._store.find_user_page(user_id, limit, position))
+        except Exception as e:
+            logger.error(f"사용자 푸시 페이지 조회 실패: {e}")
+            return PushNotificationPage()
+
+    async def find_page_by_topic(
+        self, topic: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> PushNotificationPage:
+        """토픽으로 푸시 알림 페이지 조회 (최신순, 커서 이후부터)"""
+        position = self._decode_cursor(cursor) if cursor else None
+        try:
+            return self._to_page(*await self._store.find_topic_page(topic, limit, position))
+        except Exception as e:
+            logger.error(f"토픽 푸시 페이지 조회 실패: {e}")
+            return PushNotificationPage()
+
+    async def update_status(self, push_uuid: UUID, status: str) -> bool:
+        """푸시 알림의 상태 필드만 변경 (TTL 유지)"""
+        try:
+            return (await self._store.update_statuses([(push_uuid, status)]))[0]
+        except Exception as e:
+            logger.error(f"푸시 상태 변경 실패: {e}")
+            return False
+
+    async def update_statuses(self, updates: List[Tuple[UUID, str]]) -> List[bool]:
+        """여러 푸시 알림의 상태 필드만 일괄 변경 (Redis 오류는 예외로 전달)"""
+        return await self._store.update_statuses(updates)
+
     async def delete(self, push_uuid: UUID) -> bool:
         """푸시 알림 삭제"""
         try:
-            # 먼저 기록을 조회해서 사용자와 토픽 정보를 얻음
-            entity = await self.find_by_id(push_uuid)
-            if not entity:
-                return False
-
-            redis_client = self._redis_connection.client
-            
-            # 메인 기록 삭제
-            key = f"push:{push_uuid}"
-            await redis_client.delete(key)
-            
-            # 인덱스에서도 제거
-            user_key = f"user_pushes:{entity.user_id}"
-            await redis_client.srem(user_key, str(push_uuid))
-            
-            topic_key = f"topic_pushes:{entity.topic}"
-            await redis_client.srem(topic_key, str(push_uuid))
-            
-            logger.info(f"푸시 기록 삭제 성공: {push_uuid}")
-            return True
+            deleted = await self._store.delete(push_uuid)
+            if deleted:
+                logger.info(f"푸시 기록 삭제 성공: {push_uuid}")
+            return deleted
         except Exception as e:
             logger.error(f"푸시 기록 삭제 실패: {e}")
             return False
@@ -140,23 +156,30 @@ class RedisPushNotificationRepository(PushNotificationRepository):
     async def exists(self, push_uuid: UUID) -> bool:
         """푸시 알림 존재 여부 확인"""
         try:
-            redis_client = self._redis_connection.client
-            key = f"push:{push_uuid}"
-            return await redis_client.exists(key) > 0
+            return await self._store.exists(push_uuid)
         except Exception as e:
             logger.error(f"푸시 기록 존재 확인 실패: {e}")
             return False
 
-    def _to_entity(self, record_data: dict) -> PushNotification:
-        """Redis 데이터를 Entity로 변환"""
-        from datetime import datetime
-        
-        return PushNotification(
-            push_uuid=UUID(record_data["push_uuid"]),
-            user_id=record_data["user_id"],
-            message=record_data["message"],
-            topic=record_data["topic"],
-            created_at=datetime.fromisoformat(record_data["created_at"]),
-            api_call_time=datetime.fromisoformat(record_data["api_call_time"]),
-            status=record_data["status"],
-        )
+    def _to_page(
+        self, items: List[PushNotification], next_position: Optional[IndexPosition]
+    ) -> PushNotificationPage:
+        """저장 엔진의 페이지 조회 결과를 커서가 담긴 페이지로 변환"""
+        next_cursor = self._encode_cursor(*next_position) if next_position else None
+        return PushNotificationPage(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _encode_cursor(score: float, push_uuid: str) -> str:
+        """(score, uuid)를 불투명한 커서 문자열로 인코딩"""
+        raw = f"{score!r}:{push_uuid}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> IndexPosition:
+        """커서 문자열을 (score, uuid)로 디코딩"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            score, push_uuid = base64.urlsafe_b64decode(padded).decode().split(":", 1)
+            return float(score), str(UUID(push_uuid))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
@@ -0,0 +1,23 @@
+from typing import List, Optional
+
+from app.domain.entities import TopicPushStats
+from app.domain.repositories import PushStatsRepository
+from app.infrastructure.storage import RedisPushStatsStore
+
+
+class RedisPushStatsRepository(PushStatsRepository):
+    """Redis 카운터/HyperLogLog 기반 토픽별 푸시 통계 저장소
+
+    통계는 푸시 저장소가 기록을 저장할 때 같은 RedisPushStatsStore로 누적하며, 이 클래스는
+    조회만 맡습니다. 조회 구간은 저장소가 보존 시간을 넘지 않게 줄이고, Redis 오류는 그대로
+    전달합니다.
+    """
+
+    def __init__(self, stats_store: RedisPushStatsStore):
+        self._stats_store = stats_store
+
+    async def find_topic_stats(
+        self, hours: int, topic: Optional[str] = None
+    ) -> List[TopicPushStats]:
+        """최근 hours시간(현재 시간 포함)의 토픽별 통계"""
+        return await self._stats_store.read(hours, topic)
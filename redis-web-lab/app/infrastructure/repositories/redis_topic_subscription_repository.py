@@ -0,0 +1,68 @@
+from typing import AsyncIterator, List
+
+from app.domain.repositories import TopicSubscriptionRepository
+from app.infrastructure.database import RedisConnection
+
+
+class RedisTopicSubscriptionRepository(TopicSubscriptionRepository):
+    """Redis Set 기반 토픽 구독자 저장소
+
+    토픽마다 `topic_subscribers:<topic>` Set 하나에 사용자 ID를 저장합니다. 추가/제거는
+    chunk_size명씩 나눈 SADD/SREM을 파이프라인 한 번으로 보내고, 순회는 SSCAN으로 커서를
+    이어가므로 구독자가 많아도 한 번에 큰 응답을 만들지 않습니다. 순회 중 추가/제거된
+    구독자는 포함될 수도 있고 빠질 수도 있습니다. Redis 오류는 그대로 전달합니다.
+    """
+
+    def __init__(self, redis_connection: RedisConnection, chunk_size: int = 1000):
+        self._redis_connection = redis_connection
+        self._chunk_size = chunk_size
+
+    @staticmethod
+    def subscribers_key(topic: str) -> str:
+        """토픽 구독자 Set 키"""
+        return f"topic_subscribers:{topic}"
+
+    async def subscribe(self, topic: str, user_ids: List[str]) -> int:
+        """토픽에 구독자 추가 (새로 추가된 수 반환)"""
+        return await self._apply("sadd", topic, user_ids)
+
+    async def unsubscribe(self, topic: str, user_ids: List[str]) -> int:
+        """토픽에서 구독자 제거 (실제로 제거된 수 반환)"""
+        return await self._apply("srem", topic, user_ids)
+
+    async def count_subscribers(self, topic: str) -> int:
+        """토픽 구독자 수"""
+        return await self._redis_connection.client.scard(self.subscribers_key(topic))
+
+    async def iter_subscribers(self, topic: str, chunk_size: int) -> AsyncIterator[List[str]]:
+        """SSCAN으로 구독자를 최대 chunk_size명씩 순회
+
+        메모리를 구독자 수와 무관하게 chunk_size 정도로 유지하려고 이미 돌려준 구독자를 기억하지
+        않습니다. SSCAN은 순회 중 구독자 추가/제거로 Set이 재해시되면 같은 멤버를 다시 돌려줄 수
+        있으므로, 그 경우에만 같은 구독자가 두 번 나올 수 있습니다. COUNT는 힌트일 뿐이라 응답을
+        모아 chunk_size명씩 잘라 줍니다.
+        """
+        client = self._redis_connection.client
+        key = self.subscribers_key(topic)
+        pending: List[str] = []
+        cursor = 0
+        while True:
+            cursor, members = await client.sscan(key, cursor=cursor, count=chunk_size)
+            pending.extend(members)
+            while len(pending) >= chunk_size:
+                yield pending[:chunk_size]
+                pending = pending[chunk_size:]
+            if cursor == 0:
+                break
+        if pending:
+            yield pending
+
+    async def _apply(self, command: str, topic: str, user_ids: List[str]) -> int:
+        """SADD/SREM을 chunk_size명씩 파이프라인 한 번으로 실행 (변경된 수 합계 반환)"""
+        if not user_ids:
+            return 0
+        key = self.subscribers_key(topic)
+        async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(user_ids), self._chunk_size):
+                getattr(pipe, command)(key, *user_ids[start:start + self._chunk_size])
+            return sum(await pipe.execute())
@@ -0,0 +1,13 @@
+"""Infrastructure storage package"""
+from .push_index_sweeper import PushIndexSweeper
+from .push_record_store import IndexPosition, RedisPushRecordStore
+from .push_stats_store import RedisPushStatsStore
+from .push_store_settings import PushStoreSettings
+
+__all__ = [
+    "IndexPosition",
+    "PushIndexSweeper",
+    "PushStoreSettings",
+    "RedisPushRecordStore",
+    "RedisPushStatsStore",
+]
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Callable, List, Optional, Sequence
+
+from prometheus_client import Counter, Gauge
+
+from app.infrastructure.database import RedisConnection
+
+logger = logging.getLogger(__name__)
+
+INDEX_MEMBERS_PRUNED = Counter(
+    "push_index_members_pruned", "인덱스에서 제거된 만료 푸시 멤버 수", ["source"]
+)
+LAST_SWEEP_PRUNED = Gauge(
+    "push_index_last_sweep_pruned", "마지막 인덱스 정리에서 제거된 멤버 수"
+)
+LAST_SWEEP_KEYS = Gauge(
+    "push_index_last_sweep_keys", "마지막 인덱스 정리에서 검사한 인덱스 키 수"
+)
+LAST_SWEEP_SECONDS = Gauge(
+    "push_index_last_sweep_seconds", "마지막 인덱스 정리 소요 시간(초)"
+)
+
+
+class PushIndexSweeper:
+    """만료된 푸시를 가리키는 인덱스 멤버를 주기적으로 제거하는 백그라운드 작업
+
+    인덱스 키는 저장할 때마다 TTL이 갱신되어 활성 사용자/토픽의 인덱스는 만료되지 않지만,
+    멤버가 가리키는 기록은 TTL이 지나면 사라집니다. SCAN으로 인덱스 키를,
+    ZSCAN으로 멤버를 batch_size씩 순회하며 EXISTS로 확인해 남은 멤버를 ZREM합니다.
+    여러 워커가 떠 있어도 주기마다 락을 잡은 한 워커만 정리합니다.
+    record_key는 멤버(uuid)의 기록 키로, 저장 엔진과 같은 키 구조를 넘겨야 합니다.
+    """
+
+    _LOCK_KEY = "push_index_sweep:lock"
+
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        interval_seconds: float = 60.0,
+        batch_size: int = 500,
+        patterns: Sequence[str] = ("user_pushes:*", "topic_pushes:*"),
+        record_key: Callable[[str], str] = "push:{}".format,
+    ):
+        self._redis_connection = redis_connection
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._patterns = patterns
+        self._record_key = record_key
+        self._owner = f"{socket.gethostname()}-{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._sweeping = False
+
+    async def start(self) -> None:
+        """주기적 정리 시작"""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 0.0) -> None:
+        """주기적 정리 종료 (정리 중이면 최대 timeout초까지 마치기를 기다림)"""
+        if self._task is not None:
+            self._stopping = True
+            if self._sweeping and timeout > 0:
+                await asyncio.wait([self._task], timeout=timeout)
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                # 락은 주기만큼 유지해 같은 주기에 다른 워커가 중복 정리하지 않도록 함
+                acquired = await self._redis_connection.client.set(
+                    self._LOCK_KEY, self._owner, nx=True, ex=max(1, int(self._interval_seconds))
+                )
+                if acquired and not self._stopping:
+                    self._sweeping = True
+                    try:
+                        await self.sweep_once()
+                    finally:
+                        self._sweeping = False
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"푸시 인덱스 정리 실패: {e}")
+            if not self._stopping:
+                await asyncio.sleep(self._interval_seconds)
+
+    async def sweep_once(self) -> int:
+        """모든 인덱스를 한 번 정리 (제거한 멤버 수 반환)"""
+        started = time.perf_counter()
+        client = self._redis_connection.client
+        keys = 0
+        pruned = 0
+        for pattern in self._patterns:
+            async for index_key in client.scan_iter(
+                match=pattern, count=self._batch_size, _type="zset"
+            ):
+                keys += 1
+                pruned += await self._sweep_index(index_key)
+
+        elapsed = time.perf_counter() - started
+        LAST_SWEEP_PRUNED.set(pruned)
+        LAST_SWEEP_KEYS.set(keys)
+        LAST_SWEEP_SECONDS.set(elapsed)
+        logger.info(f"푸시 인덱스 정리: 키 {keys}개, 멤버 {pruned}개 제거 ({elapsed:.3f}s)")
+        return pruned
+
+    async def _sweep_index(self, index_key: str) -> int:
+        """인덱스 하나를 ZSCAN으로 batch_size씩 순회하며 정리"""
+        client = self._redis_connection.client
+        pruned = 0
+        cursor = 0
+        while True:
+            cursor, members = await client.zscan(index_key, cursor, count=self._batch_size)
+            pruned += await self._prune_batch(index_key, [member for member, _ in members])
+            if cursor == 0:
+                return pruned
+
+    async def _prune_batch(self, index_key: str, push_uuids: List[str]) -> int:
+        """기록이 없는 멤버를 파이프라인 EXISTS로 찾아 제거"""
+        if not push_uuids:
+            return 0
+        client = self._redis_connection.client
+        async with client.pipeline(transaction=False) as pipe:
+            for push_uuid in push_uuids:
+                pipe.exists(self._record_key(push_uuid))
+            exists = await pipe.execute()
+
+        dead = [push_uuid for push_uuid, found in zip(push_uuids, exists, strict=True) if not found]
+        if not dead:
+            return 0
+        removed = await client.zrem(index_key, *dead)
+        INDEX_MEMBERS_PRUNED.labels(source="sweep").inc(removed)
+        return removed
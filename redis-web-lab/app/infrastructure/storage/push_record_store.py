@@ -0,0 +1,404 @@
+import logging
+import time
+from binascii import crc_hqx
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+from uuid import UUID, uuid4
+
+from redis.asyncio.client import Pipeline
+
+from app.domain.entities import PushNotification
+from app.infrastructure.codecs import HashPushRecordCodec, PushRecordCodec, StatusTransition
+from app.infrastructure.database import RedisConnection
+
+from .push_index_sweeper import INDEX_MEMBERS_PRUNED
+from .push_stats_store import RedisPushStatsStore
+
+logger = logging.getLogger(__name__)
+
+# (score, uuid): 인덱스 안의 위치, 페이지 경계로 사용
+IndexPosition = Tuple[float, str]
+
+
+class RedisPushRecordStore:
+    """푸시 기록의 Redis 키 구조와 읽기/쓰기 경로를 한곳에서 담당하는 저장 엔진
+
+    키 구조:
+    - `push:<uuid>`: 코덱 형식의 기록 (TTL ttl_seconds)
+    - `user_pushes:<user_id>`, `topic_pushes:<topic>`: 생성시간 epoch를 score로 하는 zset 인덱스
+
+    hash_tags=True(클러스터 연결의 기본값)이면 기록은 `push:{tag}:<uuid>`, 사용자 인덱스는
+    `user_pushes:{tag}:<user_id>`로 저장합니다. tag는 사용자 ID의 CRC16이고 next_identity가
+    발급하는 uuid의 앞 4자리에도 같은 값을 넣으므로, 한 사용자의 기록과 인덱스는 같은 슬롯에
+    놓여 저장과 사용자별 조회가 노드 하나로 끝납니다.
+
+    topic_shard_seconds > 0이면 토픽 인덱스를 `topic_pushes:<topic>:<bucket>`(생성시각을
+    topic_shard_seconds로 나눈 구간)으로 나눠, 요청이 몰리는 토픽도 키 하나가 한 노드와
+    하나의 큰 zset에 몰리지 않게 합니다. 기록이 들어간 구간 번호는 저장 파이프라인에서
+    `topic_push_buckets:<topic>` zset에 함께 기록하고, 조회는 이 목록의 구간만 최신 구간부터
+    필요한 만큼 읽으므로 드문드문 쓰이는 토픽도 TTL / 구간 길이만큼의 키를 훑지 않습니다.
+
+    쓰기는 MULTI/EXEC 파이프라인(클러스터에서는 일반 파이프라인), 여러 건 읽기는 파이프라인
+    한 번으로 처리합니다. Redis 오류는 그대로 전달하므로 실패를 어떻게 다룰지는 호출자가 정합니다.
+
+    stats를 주면 토픽별 통계 카운터/HyperLogLog 갱신도 같은 저장 파이프라인에 적재합니다.
+    """
+
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        codec: Optional[PushRecordCodec] = None,
+        ttl_seconds: int = 60,
+        save_chunk_size: int = 500,
+        hash_tags: Optional[bool] = None,
+        topic_shard_seconds: int = 0,
+        stats: Optional[RedisPushStatsStore] = None,
+    ):
+        self._redis_connection = redis_connection
+        self._codec = codec or HashPushRecordCodec()
+        self._ttl_seconds = ttl_seconds
+        self._save_chunk_size = save_chunk_size
+        self._hash_tags = redis_connection.cluster if hash_tags is None else hash_tags
+        self._topic_shard_seconds = topic_shard_seconds
+        self._stats = stats
+        # 클러스터 파이프라인은 MULTI/EXEC를 지원하지 않음 (항목별 원자성 없이 전송)
+        self._transaction = redis_connection.supports_transactions
+
+    @property
+    def stats(self) -> Optional[RedisPushStatsStore]:
+        """토픽별 통계 저장소 (통계를 끈 경우 None)"""
+        return self._stats
+
+    @property
+    def ttl_seconds(self) -> int:
+        """기록/인덱스 TTL(초)"""
+        return self._ttl_seconds
+
+    def record_key(self, push_uuid: Union[UUID, str]) -> str:
+        """기록 키"""
+        push_uuid = str(push_uuid)
+        if self._hash_tags:
+            return f"push:{{{push_uuid[:4]}}}:{push_uuid}"
+        return f"push:{push_uuid}"
+
+    def user_index_key(self, user_id: str) -> str:
+        """사용자별 인덱스 키"""
+        if self._hash_tags:
+            return f"user_pushes:{{{self._user_tag(user_id)}}}:{user_id}"
+        return f"user_pushes:{user_id}"
+
+    @staticmethod
+    def topic_index_key(topic: str) -> str:
+        """토픽별 인덱스 키 (구간 분할 시 구간 키의 접두사)"""
+        return f"topic_pushes:{topic}"
+
+    def topic_shard_key(self, topic: str, bucket: int) -> str:
+        """토픽 인덱스의 구간 키"""
+        return f"{self.topic_index_key(topic)}:{bucket}"
+
+    @staticmethod
+    def topic_bucket_key(topic: str) -> str:
+        """토픽 인덱스 중 기록이 들어간 구간 번호 목록 키 (구간 분할 시)"""
+        return f"topic_push_buckets:{topic}"
+
+    def next_identity(self, user_id: str) -> UUID:
+        """새 푸시 uuid 발급 (hash_tags이면 앞 4자리를 사용자 tag로 맞춰 같은 슬롯에 저장)"""
+        push_uuid = uuid4()
+        if not self._hash_tags:
+            return push_uuid
+        # uuid4의 앞 16비트는 무작위 값이므로 바꿔도 버전/변형 비트는 그대로 유지됨
+        return UUID(self._user_tag(user_id) + push_uuid.hex[4:])
+
+    async def save(self, push_notification: PushNotification) -> None:
+        """기록, 인덱스, TTL을 MULTI/EXEC 트랜잭션 한 번의 왕복으로 저장"""
+        async with self._redis_connection.client.pipeline(transaction=self._transaction) as pipe:
+            self._queue_save(pipe, push_notification)
+            await pipe.execute()
+
+    async def save_many(self, push_notifications: List[PushNotification]) -> List[bool]:
+        """여러 건 저장 (입력 순서대로 항목별 성공 여부 반환)
+
+        청크 단위로 MULTI/EXEC 파이프라인 하나에 적재하므로 청크당 한 번의 왕복이며,
+        청크 안의 항목은 함께 성공하거나 함께 실패합니다.
+        """
+        results: List[bool] = []
+        for start in range(0, len(push_notifications), self._save_chunk_size):
+            chunk = push_notifications[start:start + self._save_chunk_size]
+            try:
+                async with self._redis_connection.client.pipeline(
+                    transaction=self._transaction
+                ) as pipe:
+                    self._queue_save_many(pipe, chunk)
+                    await pipe.execute()
+                results.extend([True] * len(chunk))
+            except Exception as e:
+                logger.error(f"푸시 기록 일괄 저장 실패 ({len(chunk)}건): {e}")
+                results.extend([False] * len(chunk))
+        return results
+
+    async def get(self, push_uuid: Union[UUID, str]) -> Optional[PushNotification]:
+        """기록 하나 조회"""
+        async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+            self._codec.queue_read(pipe, self.record_key(push_uuid))
+            (raw,) = await pipe.execute()
+        return self._codec.decode(raw)
+
+    async def get_with_ttl(
+        self, push_uuid: Union[UUID, str]
+    ) -> Tuple[Optional[PushNotification], Optional[float]]:
+        """기록과 남은 TTL(초)을 한 번의 왕복으로 조회"""
+        key = self.record_key(push_uuid)
+        async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+            self._codec.queue_read(pipe, key)
+            pipe.pttl(key)
+            raw, ttl_ms = await pipe.execute()
+
+        entity = self._codec.decode(raw)
+        if entity is None:
+            return None, None
+        return entity, (ttl_ms / 1000 if ttl_ms >= 0 else None)
+
+    async def get_many(
+        self, push_uuids: Sequence[Union[UUID, str]], missing: Optional[List[str]] = None
+    ) -> List[PushNotification]:
+        """여러 기록을 파이프라인 한 번으로 조회 (순서 유지, 만료/손상된 항목 제외)
+
+        missing을 넘기면 기록이 없는(만료/삭제된) uuid를 채워 줍니다.
+        """
+        if not push_uuids:
+            return []
+        keys = [str(push_uuid) for push_uuid in push_uuids]
+        async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+            for push_uuid in keys:
+                self._codec.queue_read(pipe, self.record_key(push_uuid))
+            records = await pipe.execute()
+        return self._to_entities(keys, records, missing)
+
+    async def find_user_page(
+        self, user_id: str, limit: int, position: Optional[IndexPosition] = None
+    ) -> Tuple[List[PushNotification], Optional[IndexPosition]]:
+        """사용자 인덱스에서 최신순으로 position 이후 limit개 조회"""
+        return await self._find_page([self.user_index_key(user_id)], limit, position)
+
+    async def find_topic_page(
+        self, topic: str, limit: int, position: Optional[IndexPosition] = None
+    ) -> Tuple[List[PushNotification], Optional[IndexPosition]]:
+        """토픽 인덱스(구간 분할 시 최신 구간부터)에서 position 이후 limit개 조회"""
+        if self._topic_shard_seconds <= 0:
+            return await self._find_page([self.topic_index_key(topic)], limit, position)
+
+        # 기록이 들어간 구간 중 TTL 범위 안의 것만 최신순으로 읽고, 지난 구간 번호는 함께 정리
+        bucket_key = self.topic_bucket_key(topic)
+        newest: Union[int, str] = self._bucket(position[0]) if position else "+inf"
+        oldest = self._bucket(time.time() - self._ttl_seconds) - 1
+        async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(bucket_key, "-inf", f"({oldest}")
+            pipe.zrevrangebyscore(bucket_key, newest, oldest)
+            _, buckets = await pipe.execute()
+        index_keys = [self.topic_shard_key(topic, int(bucket)) for bucket in buckets]
+        return await self._find_page(index_keys, limit, position)
+
+    async def _find_page(
+        self, index_keys: Sequence[str], limit: int, position: Optional[IndexPosition] = None
+    ) -> Tuple[List[PushNotification], Optional[IndexPosition]]:
+        """최신순으로 나열된 인덱스 키들에서 position 이후 limit개를 읽고 기록을 한 번에 조회
+
+        정렬 기준은 (score 내림차순, uuid 내림차순)이며 ZREVRANGE의 순서와 같습니다.
+        인덱스 키는 앞쪽부터 1, 2, 4, ...개씩 파이프라인으로 읽다가 limit + 1개가 모이면
+        멈춥니다(키가 하나면 왕복 한 번). limit + 1개를 읽는 것은 다음 페이지 여부를 알기
+        위함이며, 다음 페이지가 있으면 마지막 항목의 위치를 함께 반환합니다.
+        기록이 사라진 멤버는 발견 즉시 인덱스에서 제거합니다.
+        """
+        if limit <= 0:
+            return [], None
+
+        # (uuid, score, 인덱스 키)
+        members: List[Tuple[str, float, str]] = []
+        start, batch = 0, 1
+        while start < len(index_keys) and len(members) <= limit:
+            keys = index_keys[start:start + batch]
+            start, batch = start + len(keys), batch * 2
+            async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+                for index_key in keys:
+                    self._queue_index_read(pipe, index_key, limit + 1, position)
+                results = await pipe.execute()
+            if position is not None:
+                # 같은 score 안에서 커서 uuid보다 뒤에 있는 멤버 + 더 오래된 멤버
+                _, last_uuid = position
+                results = [
+                    [(m, s) for m, s in tied if m < last_uuid] + older
+                    for tied, older in zip(results[::2], results[1::2], strict=True)
+                ]
+            for index_key, found in zip(keys, results, strict=True):
+                members.extend((member, score, index_key) for member, score in found)
+
+        page_members = members[:limit]
+        missing: List[str] = []
+        items = await self.get_many([push_uuid for push_uuid, _, _ in page_members], missing)
+        if missing:
+            missing_set = set(missing)
+            by_index: Dict[str, List[str]] = defaultdict(list)
+            for push_uuid, _, index_key in page_members:
+                if push_uuid in missing_set:
+                    by_index[index_key].append(push_uuid)
+            for index_key, push_uuids in by_index.items():
+                await self._prune_index(index_key, push_uuids)
+        next_position = None
+        if len(members) > limit:
+            last_member, last_score, _ = page_members[-1]
+            next_position = (last_score, last_member)
+        return items, next_position
+
+    async def update_statuses(self, updates: List[Tuple[UUID, str]]) -> List[bool]:
+        """여러 기록의 상태만 진행 방향으로 갱신 (입력 순서대로 기록 존재 여부 반환)
+
+        통계를 켠 경우 실제로 상태가 바뀐 기록만 상태별 카운터에 더하며, 이 반영이 실패해도
+        상태 변경 결과는 그대로 반환합니다(재시도로 같은 변경이 두 번 집계되지 않도록).
+        """
+        for _, status in updates:
+            if status not in PushNotification.STATUS_RANKS:
+                raise ValueError(f"Unknown status: {status}")
+        if not updates:
+            return []
+        transitions: Optional[List[StatusTransition]] = [] if self._stats is not None else None
+        results = await self._codec.update_statuses(
+            self._redis_connection.client,
+            [(self.record_key(push_uuid), status) for push_uuid, status in updates],
+            transitions,
+        )
+        if transitions and self._stats is not None:
+            try:
+                await self._stats.record_transitions(transitions)
+            except Exception as e:
+                logger.warning(f"상태 통계 반영 실패 ({len(transitions)}건): {e}")
+        return results
+
+    async def delete(self, push_uuid: Union[UUID, str]) -> bool:
+        """기록과 인덱스 멤버 삭제 (기록이 없으면 False)"""
+        # 인덱스 키를 알기 위해 먼저 기록을 조회
+        entity = await self.get(push_uuid)
+        if entity is None:
+            return False
+
+        member = str(push_uuid)
+        async with self._redis_connection.client.pipeline(transaction=self._transaction) as pipe:
+            pipe.delete(self.record_key(member))
+            pipe.zrem(self.user_index_key(entity.user_id), member)
+            pipe.zrem(self._topic_key_for(entity), member)
+            await pipe.execute()
+        return True
+
+    async def exists(self, push_uuid: Union[UUID, str]) -> bool:
+        """기록 존재 여부"""
+        return await self._redis_connection.client.exists(self.record_key(push_uuid)) > 0
+
+    def _queue_save(self, pipe: Pipeline, push_notification: PushNotification) -> None:
+        """저장에 필요한 명령을 파이프라인에 적재"""
+        push_uuid = str(push_notification.push_uuid)
+        score = push_notification.created_at.timestamp()
+
+        # 메인 데이터를 코덱 형식으로 저장
+        self._codec.queue_write(
+            pipe, self.record_key(push_uuid), push_notification, self._ttl_seconds
+        )
+
+        # 사용자별/토픽별 인덱스 추가 (생성시간 epoch를 score로 하는 Sorted Set)
+        for index_key in (
+            self.user_index_key(push_notification.user_id),
+            self._topic_key_for(push_notification),
+        ):
+            pipe.zadd(index_key, {push_uuid: score})
+            pipe.expire(index_key, self._ttl_seconds)
+        if self._topic_shard_seconds > 0:
+            self._queue_topic_buckets(pipe, {push_notification.topic: {self._bucket(score)}})
+
+        if self._stats:
+            self._stats.queue_created(pipe, [push_notification])
+
+    def _queue_save_many(self, pipe: Pipeline, push_notifications: List[PushNotification]) -> None:
+        """여러 건 저장 명령을 적재 (같은 인덱스 키의 ZADD/EXPIRE는 한 번으로 합침)"""
+        index_members: Dict[str, Dict[str, float]] = defaultdict(dict)
+        topic_buckets: Dict[str, Set[int]] = defaultdict(set)
+        for push_notification in push_notifications:
+            push_uuid = str(push_notification.push_uuid)
+            score = push_notification.created_at.timestamp()
+
+            self._codec.queue_write(
+                pipe, self.record_key(push_uuid), push_notification, self._ttl_seconds
+            )
+
+            index_members[self.user_index_key(push_notification.user_id)][push_uuid] = score
+            index_members[self._topic_key_for(push_notification)][push_uuid] = score
+            if self._topic_shard_seconds > 0:
+                topic_buckets[push_notification.topic].add(self._bucket(score))
+
+        for index_key, members in index_members.items():
+            pipe.zadd(index_key, members)
+            pipe.expire(index_key, self._ttl_seconds)
+        self._queue_topic_buckets(pipe, topic_buckets)
+
+        if self._stats:
+            self._stats.queue_created(pipe, push_notifications)
+
+    def _queue_topic_buckets(self, pipe: Pipeline, topic_buckets: Dict[str, Set[int]]) -> None:
+        """토픽별로 기록이 들어간 구간 번호를 구간 목록에 적재 (구간 키와 같은 TTL로 갱신)"""
+        for topic, buckets in topic_buckets.items():
+            bucket_key = self.topic_bucket_key(topic)
+            pipe.zadd(bucket_key, {str(bucket): bucket for bucket in buckets})
+            pipe.expire(bucket_key, self._ttl_seconds)
+
+    @staticmethod
+    def _queue_index_read(
+        pipe: Pipeline, index_key: str, count: int, position: Optional[IndexPosition]
+    ) -> None:
+        """인덱스에서 최신순 count개 조회 적재 (position 이후는 같은 score 멤버 + 더 오래된 멤버)"""
+        if position is None:
+            pipe.zrevrange(index_key, 0, count - 1, withscores=True)
+            return
+        score, _ = position
+        pipe.zrevrangebyscore(index_key, score, score, withscores=True)
+        pipe.zrevrangebyscore(
+            index_key, f"({score!r}", "-inf", start=0, num=count, withscores=True
+        )
+
+    def _topic_key_for(self, push_notification: PushNotification) -> str:
+        """기록이 들어갈 토픽 인덱스 키 (구간 분할 시 생성시각의 구간 키)"""
+        if self._topic_shard_seconds <= 0:
+            return self.topic_index_key(push_notification.topic)
+        return self.topic_shard_key(
+            push_notification.topic, self._bucket(push_notification.created_at.timestamp())
+        )
+
+    def _bucket(self, score: float) -> int:
+        """epoch 초가 속하는 토픽 인덱스 구간 번호"""
+        return int(score // self._topic_shard_seconds)
+
+    @staticmethod
+    def _user_tag(user_id: str) -> str:
+        """사용자 ID의 hash tag (CRC16 4자리 16진수, uuid 앞자리와 같은 형식)"""
+        return f"{crc_hqx(user_id.encode(), 0):04x}"
+
+    async def _prune_index(self, index_key: str, push_uuids: List[str]) -> None:
+        """조회 중 발견한 만료 기록의 인덱스 멤버 제거 (실패해도 조회는 계속)"""
+        try:
+            removed = await self._redis_connection.client.zrem(index_key, *push_uuids)
+            INDEX_MEMBERS_PRUNED.labels(source="read").inc(removed)
+        except Exception as e:
+            logger.warning(f"인덱스 정리 실패: {index_key} ({e})")
+
+    def _to_entities(
+        self, push_uuids: List[str], records: List[Any], missing: Optional[List[str]] = None
+    ) -> List[PushNotification]:
+        """Redis 데이터 목록을 Entity 목록으로 일괄 변환 (비어 있거나 손상된 항목 제외)"""
+        entities = []
+        for push_uuid, raw in zip(push_uuids, records, strict=True):
+            try:
+                entity = self._codec.decode(raw)
+            except (KeyError, ValueError) as e:
+                logger.warning(f"손상된 푸시 기록 건너뜀: {push_uuid} ({e})")
+                continue
+            if entity is not None:
+                entities.append(entity)
+            elif missing is not None:
+                missing.append(push_uuid)
+        return entities
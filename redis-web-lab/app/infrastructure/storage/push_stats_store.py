@@ -0,0 +1,204 @@
+from binascii import crc_hqx
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from redis.asyncio.client import Pipeline
+
+from app.domain.entities import PushNotification, PushStatsBucket, TopicPushStats
+from app.infrastructure.codecs import StatusTransition
+from app.infrastructure.database import RedisConnection
+
+_HOUR = timedelta(hours=1)
+
+
+class RedisPushStatsStore:
+    """토픽별 푸시 통계의 Redis 키 구조와 읽기/쓰기 경로
+
+    키 구조 (시간 구간은 푸시 생성 시각 기준 1시간, `YYYYMMDDHH`):
+    - `push_stats:<topic>:<hour>`: Hash, 필드 `<status>` = 그 시간에 생성된 해당 토픽 푸시 중
+      그 상태인 수 (created는 생성 수, 나머지는 그 상태로 바뀐 수)
+    - `push_stats_users:<topic>:<hour>`: HyperLogLog, 그 시간에 푸시를 받은 사용자
+    - `push_stats_topics:<hour>:<shard>`: Set, 그 시간에 푸시가 생성된 토픽 (토픽 CRC16을
+      topic_shards로 나눈 나머지로 분산, 토픽을 지정하지 않은 조회용)
+
+    카운터와 사용자 키를 토픽별로 나누므로 쓰기가 시간 구간마다 키 하나에 몰리지 않습니다.
+    hash_tags=True(클러스터 연결의 기본값)이면 토픽 키를 `push_stats:{<topic>}:<hour>`,
+    `push_stats_users:{<topic>}:<hour>`로 저장해 한 토픽의 시간별 키를 같은 슬롯에 두므로,
+    여러 시간의 고유 사용자 수도 PFCOUNT 한 번으로 합칩니다.
+
+    쓰기 명령은 RedisPushRecordStore가 기록 저장 파이프라인에 함께 적재하므로 추가 왕복이
+    없고, 상태 변경은 실제로 바뀐 기록만 파이프라인 한 번으로 더합니다. 모든 키는 구간이
+    끝난 뒤 retention_hours시간이 지나면 만료되며, 조회는 데이터 양과 무관하게 구간 수만큼의
+    명령을 파이프라인 한두 번으로 보냅니다. 조회 구간은 retention_hours를 넘지 않게 줄입니다.
+    """
+
+    def __init__(
+        self,
+        redis_connection: RedisConnection,
+        retention_hours: int = 168,
+        hash_tags: Optional[bool] = None,
+        topic_shards: int = 16,
+    ):
+        self._redis_connection = redis_connection
+        self._retention_hours = retention_hours
+        self._hash_tags = redis_connection.cluster if hash_tags is None else hash_tags
+        self._topic_shards = topic_shards
+
+    @property
+    def retention_hours(self) -> int:
+        """통계 보존 시간"""
+        return self._retention_hours
+
+    def counters_key(self, topic: str, hour: datetime) -> str:
+        """시간 구간의 토픽 상태별 카운터 Hash 키"""
+        if self._hash_tags:
+            return f"push_stats:{{{topic}}}:{hour:%Y%m%d%H}"
+        return f"push_stats:{topic}:{hour:%Y%m%d%H}"
+
+    def users_key(self, topic: str, hour: datetime) -> str:
+        """시간 구간의 토픽 고유 사용자 HyperLogLog 키"""
+        if self._hash_tags:
+            return f"push_stats_users:{{{topic}}}:{hour:%Y%m%d%H}"
+        return f"push_stats_users:{topic}:{hour:%Y%m%d%H}"
+
+    def topics_key(self, hour: datetime, shard: int) -> str:
+        """시간 구간에 푸시가 생성된 토픽 Set 키 (shard번째 조각)"""
+        return f"push_stats_topics:{hour:%Y%m%d%H}:{shard}"
+
+    def queue_created(
+        self, pipe: Pipeline, push_notifications: Iterable[PushNotification]
+    ) -> None:
+        """생성 수/고유 사용자 갱신 명령 적재 (같은 구간/토픽은 HINCRBY/PFADD 한 번으로 합침)"""
+        counts: Dict[Tuple[datetime, str], int] = defaultdict(int)
+        users: Dict[Tuple[datetime, str], Set[str]] = defaultdict(set)
+        for push_notification in push_notifications:
+            bucket = (self._hour_of(push_notification.created_at), push_notification.topic)
+            counts[bucket] += 1
+            users[bucket].add(push_notification.user_id)
+
+        self._queue_counts(
+            pipe, {(hour, "created", topic): n for (hour, topic), n in counts.items()}
+        )
+        for (hour, topic), user_ids in users.items():
+            key = self.users_key(topic, hour)
+            pipe.pfadd(key, *user_ids)
+            pipe.expireat(key, self._expire_at(hour))
+            topics_key = self.topics_key(hour, self._topic_shard(topic))
+            pipe.sadd(topics_key, topic)
+            pipe.expireat(topics_key, self._expire_at(hour))
+
+    def queue_transitions(self, pipe: Pipeline, transitions: Iterable[StatusTransition]) -> None:
+        """상태 변경 수 갱신 명령 적재 (푸시가 생성된 구간에 더함)"""
+        counts: Dict[Tuple[datetime, str, str], int] = defaultdict(int)
+        for transition in transitions:
+            hour = self._hour_of(transition.created_at)
+            counts[(hour, transition.status, transition.topic)] += 1
+        self._queue_counts(pipe, counts)
+
+    async def record_transitions(self, transitions: List[StatusTransition]) -> None:
+        """상태 변경 수를 파이프라인 한 번으로 반영"""
+        if not transitions:
+            return
+        async with self._redis_connection.client.pipeline(transaction=False) as pipe:
+            self.queue_transitions(pipe, transitions)
+            await pipe.execute()
+
+    async def read(
+        self, hours: int, topic: Optional[str] = None, now: Optional[datetime] = None
+    ) -> List[TopicPushStats]:
+        """최근 hours개 구간(현재 구간 포함)의 토픽별 통계 (토픽 이름순, 구간은 최신순)
+
+        topic을 주면 카운터와 고유 사용자 수를 파이프라인 한 번으로, 주지 않으면 구간별 토픽
+        Set으로 토픽 목록을 구한 뒤 토픽별 카운터와 고유 사용자 수를 한 번 더 읽습니다.
+        """
+        newest = self._hour_of(now or datetime.now())
+        hours = max(1, min(hours, self._retention_hours))
+        hour_list = [newest - _HOUR * i for i in range(hours)]
+        statuses = list(PushNotification.STATUS_RANKS)
+
+        client = self._redis_connection.client
+        if topic is None:
+            async with client.pipeline(transaction=False) as pipe:
+                for hour in hour_list:
+                    for shard in range(self._topic_shards):
+                        pipe.smembers(self.topics_key(hour, shard))
+                topics = sorted(set().union(*await pipe.execute()))
+        else:
+            topics = [topic]
+
+        async with client.pipeline(transaction=False) as pipe:
+            for stats_topic in topics:
+                for hour in hour_list:
+                    pipe.hmget(self.counters_key(stats_topic, hour), statuses)
+                self._queue_user_counts(pipe, stats_topic, hour_list)
+            results = await pipe.execute()
+
+        # (topic, 구간 번호) → 상태별 수, 토픽마다 [구간별 카운터..., 구간별 사용자 수..., 합계]
+        per_topic = 2 * len(hour_list) + 1
+        counts: Dict[Tuple[str, int], Dict[str, int]] = defaultdict(dict)
+        user_counts: Dict[str, List[int]] = {}
+        for n, stats_topic in enumerate(topics):
+            topic_results = results[n * per_topic:(n + 1) * per_topic]
+            for i, values in enumerate(topic_results[:len(hour_list)]):
+                counts[(stats_topic, i)] = {
+                    status: int(value)
+                    for status, value in zip(statuses, values, strict=True)
+                    if value
+                }
+            user_counts[stats_topic] = topic_results[len(hour_list):]
+        topics = [t for t in topics if any(counts[(t, i)] for i in range(len(hour_list)))]
+
+        stats: List[TopicPushStats] = []
+        for stats_topic in topics:
+            topic_users = user_counts[stats_topic]
+            hourly = [
+                PushStatsBucket(
+                    hour=hour,
+                    counts={s: counts[(stats_topic, i)].get(s, 0) for s in statuses},
+                    unique_users=topic_users[i],
+                )
+                for i, hour in enumerate(hour_list)
+            ]
+            stats.append(
+                TopicPushStats(
+                    topic=stats_topic,
+                    counts={s: sum(bucket.counts[s] for bucket in hourly) for s in statuses},
+                    unique_users=topic_users[-1],
+                    hourly=hourly,
+                )
+            )
+        return stats
+
+    def _queue_user_counts(self, pipe: Pipeline, topic: str, hour_list: List[datetime]) -> None:
+        """구간별 고유 사용자 수 + 전체 구간을 합친 고유 사용자 수 조회 적재"""
+        # 클러스터 파이프라인은 pfcount 메서드를 막아 두므로 명령을 직접 적재
+        keys = [self.users_key(topic, hour) for hour in hour_list]
+        for key in keys:
+            pipe.execute_command("PFCOUNT", key)
+        pipe.execute_command("PFCOUNT", *keys)
+
+    def _queue_counts(
+        self, pipe: Pipeline, counts: Dict[Tuple[datetime, str, str], int]
+    ) -> None:
+        """(구간, 상태, 토픽)별 HINCRBY와 토픽 구간 키 만료 시각 적재"""
+        keys: Dict[str, datetime] = {}
+        for (hour, status, topic), n in counts.items():
+            key = self.counters_key(topic, hour)
+            pipe.hincrby(key, status, n)
+            keys[key] = hour
+        for key, hour in keys.items():
+            pipe.expireat(key, self._expire_at(hour))
+
+    def _expire_at(self, hour: datetime) -> int:
+        """구간 키 만료 시각 (구간이 끝난 뒤 retention_hours시간, epoch 초)"""
+        return int((hour + _HOUR * (self._retention_hours + 1)).timestamp())
+
+    def _topic_shard(self, topic: str) -> int:
+        """토픽 Set 조각 번호"""
+        return crc_hqx(topic.encode(), 0) % self._topic_shards
+
+    @staticmethod
+    def _hour_of(value: datetime) -> datetime:
+        """시각이 속하는 1시간 구간의 시작 시각"""
+        return value.replace(minute=0, second=0, microsecond=0)
@@ -0,0 +1,65 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from app.infrastructure.codecs import get_push_record_codec
+from app.infrastructure.database import RedisConnection, RedisPoolSettings
+
+from .push_record_store import RedisPushRecordStore
+from .push_stats_store import RedisPushStatsStore
+
+
+@dataclass(frozen=True)
+class PushStoreSettings:
+    """푸시 기록 저장 엔진 설정
+
+    저장 형식과 키 구조(코덱, 토픽 구간 분할, 클러스터 해시 태그)와 통계 갱신 여부를 한곳에 모아,
+    같은 키를 읽고 쓰는 RedisPushNotificationRepository와 RedisService가 서로 다른 설정으로
+    엔진을 만들지 않게 합니다. 해시 태그는 연결의 cluster 값을 따르므로 연결도 cluster로 만듭니다.
+    """
+    cluster: bool = False
+    codec: str = "hash"
+    ttl_seconds: int = 60
+    topic_shard_seconds: int = 0
+    stats_enabled: bool = False
+    stats_retention_hours: int = 168
+
+    @classmethod
+    def from_env(cls) -> "PushStoreSettings":
+        """환경 변수에서 저장 엔진 설정 생성"""
+        defaults = cls()
+        return cls(
+            cluster=os.getenv("REDIS_CLUSTER", "false").lower() == "true",
+            codec=os.getenv("PUSH_STORAGE_CODEC", defaults.codec),
+            ttl_seconds=int(os.getenv("PUSH_TTL_SECONDS", defaults.ttl_seconds)),
+            topic_shard_seconds=int(
+                os.getenv("PUSH_TOPIC_SHARD_SECONDS", defaults.topic_shard_seconds)
+            ),
+            stats_enabled=os.getenv("PUSH_STATS_ENABLED", "false").lower() == "true",
+            stats_retention_hours=int(
+                os.getenv("PUSH_STATS_RETENTION_HOURS", defaults.stats_retention_hours)
+            ),
+        )
+
+    def create_connection(
+        self, redis_url: str, pool_settings: Optional[RedisPoolSettings] = None
+    ) -> RedisConnection:
+        """cluster 설정대로 Redis 연결 생성 (저장 엔진의 해시 태그가 이 값을 따름)"""
+        return RedisConnection(
+            redis_url=redis_url, pool_settings=pool_settings, cluster=self.cluster
+        )
+
+    def create_store(self, redis_connection: RedisConnection) -> RedisPushRecordStore:
+        """설정대로 저장 엔진 생성 (통계를 켜면 같은 연결의 통계 저장소도 함께 연결)"""
+        stats = None
+        if self.stats_enabled:
+            stats = RedisPushStatsStore(
+                redis_connection, retention_hours=self.stats_retention_hours
+            )
+        return RedisPushRecordStore(
+            redis_connection,
+            codec=get_push_record_codec(self.codec),
+            ttl_seconds=self.ttl_seconds,
+            topic_shard_seconds=self.topic_shard_seconds,
+            stats=stats,
+        )
@@ -1,18 +1,59 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import REGISTRY
 
 from app import __version__
-from app.application.services import PushNotificationService
-from app.infrastructure.database import RedisConnection
-from app.infrastructure.repositories import RedisPushNotificationRepository
+from app.application.services import (
+    PushNotificationService,
+    PushStatsService,
+    TopicBroadcastService,
+)
+from app.domain.repositories import (
+    PushEventPublisher,
+    PushNotificationRepository,
+    PushStatusPublisher,
+)
+from app.infrastructure.database import RedisConnection, RedisPoolSettings
+from app.infrastructure.messaging import (
+    PushEventHub,
+    PushStatusStreamConsumer,
+    RedisPushEventPublisher,
+    RedisPushStatusPublisher,
+)
+from app.infrastructure.monitoring import RedisPoolCollector
+from app.infrastructure.rate_limiting import PushRateLimiter, RateLimit
+from app.infrastructure.repositories import (
+    CachedPushNotificationRepository,
+    RedisBroadcastJobRepository,
+    RedisPushNotificationRepository,
+    RedisPushStatsRepository,
+    RedisTopicSubscriptionRepository,
+    RedisTrackingInvalidator,
+)
+from app.infrastructure.storage import PushIndexSweeper, PushStoreSettings
+from app.presentation.api import broadcast_router as broadcast_api_router
 from app.presentation.api import health_router as health_api_router
+from app.presentation.api import metrics_router as metrics_api_router
 from app.presentation.api import push_router as push_api_router
+from app.presentation.api import stats_router as stats_api_router
+from app.presentation.api.broadcast_router import get_topic_broadcast_service
 from app.presentation.api.health_router import get_redis_connection
-from app.presentation.api.push_router import get_push_notification_service
+from app.presentation.api.push_router import (
+    BatchPushLimits,
+    get_batch_push_limits,
+    get_fast_serialization,
+    get_push_event_hub,
+    get_push_notification_service,
+    get_push_rate_limiter,
+)
+from app.presentation.api.stats_router import get_push_stats_service
+from app.presentation.middleware import DrainController, DrainMiddleware, RequestTimingMiddleware
 
 # 로깅 설정
 logging.basicConfig(
@@ -21,12 +62,135 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 푸시 기록 저장 엔진: 클러스터/코덱/TTL/토픽 구간 분할과 토픽별 통계(선택, 저장 파이프라인에서
+# 시간별 카운터/HyperLogLog를 함께 갱신)를 PushStoreSettings 하나로 설정
+push_store_settings = PushStoreSettings.from_env()
+
 # 전역 의존성
-redis_connection = RedisConnection(
-    redis_url=os.getenv("REDIS_URL", "redis://localhost:6379")
+redis_connection = push_store_settings.create_connection(
+    os.getenv("REDIS_URL", "redis://localhost:6379"),
+    pool_settings=RedisPoolSettings.from_env(),
+)
+redis_repository = RedisPushNotificationRepository(
+    redis_connection, store=push_store_settings.create_store(redis_connection)
+)
+push_stats_store = redis_repository.store.stats
+push_repository: PushNotificationRepository = redis_repository
+cache_invalidator: Optional[RedisTrackingInvalidator] = None
+
+# 단건 조회 캐시 (선택)
+if os.getenv("PUSH_CACHE_ENABLED", "false").lower() == "true":
+    cached_repository = CachedPushNotificationRepository(
+        push_repository,
+        max_entries=int(os.getenv("PUSH_CACHE_MAX_ENTRIES", "10000")),
+        max_age_seconds=float(os.getenv("PUSH_CACHE_MAX_AGE_SECONDS", "5")),
+    )
+    if os.getenv("PUSH_CACHE_CLIENT_TRACKING", "false").lower() == "true":
+        if redis_connection.cluster:
+            # 무효화 구독이 단일 노드 기준이라 클러스터에서는 최대 보존 시간으로만 갱신
+            logger.warning("클러스터 모드에서는 CLIENT TRACKING 캐시 무효화를 사용하지 않습니다")
+        else:
+            cache_invalidator = RedisTrackingInvalidator(redis_connection, cached_repository)
+    push_repository = cached_repository
+
+# 상태 변경 스트림 (선택): 전송/전달 표시를 이벤트로 발행하고 워커가 일괄 적용
+status_publisher: Optional[PushStatusPublisher] = None
+status_consumer: Optional[PushStatusStreamConsumer] = None
+if os.getenv("PUSH_STATUS_STREAM_ENABLED", "false").lower() == "true":
+    status_publisher = RedisPushStatusPublisher(redis_connection)
+    status_consumer = PushStatusStreamConsumer(
+        redis_connection,
+        push_repository,
+        workers=int(os.getenv("PUSH_STATUS_WORKERS", "2")),
+        batch_size=int(os.getenv("PUSH_STATUS_BATCH_SIZE", "100")),
+        min_idle_ms=int(os.getenv("PUSH_STATUS_MIN_IDLE_MS", "30000")),
+    )
+
+# 만료된 푸시를 가리키는 인덱스 멤버 정리 (0이면 끔, 조회 중 정리는 항상 동작)
+index_sweep_interval = float(os.getenv("PUSH_INDEX_SWEEP_INTERVAL_SECONDS", "60"))
+index_sweeper: Optional[PushIndexSweeper] = None
+if index_sweep_interval > 0:
+    index_sweeper = PushIndexSweeper(
+        redis_connection,
+        interval_seconds=index_sweep_interval,
+        record_key=redis_repository.store.record_key,
+    )
+
+# 새 푸시 실시간 전달 (선택): 저장 후 사용자 채널로 발행하고, 워커마다 구독 커넥션 하나로
+# SSE 스트림에 전달
+event_publisher: Optional[PushEventPublisher] = None
+event_hub: Optional[PushEventHub] = None
+if os.getenv("PUSH_REALTIME_ENABLED", "false").lower() == "true":
+    event_publisher = RedisPushEventPublisher(redis_connection)
+    event_hub = PushEventHub(
+        redis_connection, queue_size=int(os.getenv("PUSH_STREAM_QUEUE_SIZE", "100"))
+    )
+
+push_service = PushNotificationService(push_repository, status_publisher, event_publisher)
+stats_service: Optional[PushStatsService] = None
+if push_stats_store:
+    stats_service = PushStatsService(RedisPushStatsRepository(push_stats_store))
+
+# 토픽 구독자 전체 일괄 발송 (구독자를 청크 단위로 읽어 한 번에 저장)
+broadcast_service = TopicBroadcastService(
+    push_service,
+    RedisTopicSubscriptionRepository(redis_connection),
+    RedisBroadcastJobRepository(redis_connection),
+    chunk_size=int(os.getenv("PUSH_BROADCAST_CHUNK_SIZE", "1000")),
+)
+
+# 일괄 생성 요청 하나의 항목 수/본문 크기 상한 (응답에 항목별 결과를 모두 담으므로 메모리 상한)
+batch_push_limits = BatchPushLimits(
+    max_items=int(os.getenv("PUSH_BATCH_MAX_ITEMS", "10000")),
+    max_bytes=int(os.getenv("PUSH_BATCH_MAX_BYTES", str(10 * 1024 * 1024))),
 )
-push_repository = RedisPushNotificationRepository(redis_connection)
-push_service = PushNotificationService(push_repository)
+
+# 목록 응답을 응답 모델 검증 없이 orjson으로 바로 직렬화 (선택)
+fast_serialization = os.getenv("PUSH_FAST_SERIALIZATION", "false").lower() == "true"
+
+# 사용자/토픽별 푸시 생성 요청 제한 (선택, `초당 개수/최대 개수`)
+user_rate_limit = RateLimit.parse(os.getenv("PUSH_RATE_LIMIT_USER"))
+topic_rate_limit = RateLimit.parse(os.getenv("PUSH_RATE_LIMIT_TOPIC"))
+push_rate_limiter: Optional[PushRateLimiter] = None
+if user_rate_limit or topic_rate_limit:
+    push_rate_limiter = PushRateLimiter(
+        redis_connection, user_limit=user_rate_limit, topic_limit=topic_rate_limit
+    )
+
+# 종료 드레인: 새 요청 거절 → 처리 중인 요청/백그라운드 작업 마무리 → 연결 종료 (전체 시한)
+drain_timeout = float(os.getenv("PUSH_DRAIN_TIMEOUT_SECONDS", "20"))
+drain_controller = DrainController()
+if event_hub:
+    drain_controller.on_drain(event_hub.close_streams)
+
+# 커넥션 풀 메트릭 등록 (/metrics)
+REGISTRY.register(RedisPoolCollector(redis_connection))
+
+
+async def drain(timeout: float) -> None:
+    """처리 중인 요청과 백그라운드 작업을 최대 timeout초 안에서 마무리
+
+    실행 중인 발송 작업은 끝까지 저장하고, 상태 워커는 읽은 묶음을 적용/ACK한 뒤,
+    인덱스 정리는 진행 중인 정리를 마친 뒤 멈춥니다. 시한을 넘기면 남은 작업은 중단합니다.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    def remaining() -> float:
+        return max(0.0, deadline - loop.time())
+
+    drain_controller.begin()
+    if not await drain_controller.wait_idle(remaining()):
+        logger.warning(f"드레인 시한 초과: 처리 중인 요청 {drain_controller.in_flight}개")
+    await broadcast_service.stop(remaining())
+    if status_consumer:
+        await status_consumer.stop(remaining())
+    if index_sweeper:
+        await index_sweeper.stop(remaining())
+    if event_hub:
+        await event_hub.stop()
+    if cache_invalidator:
+        await cache_invalidator.stop()
 
 
 @asynccontextmanager
@@ -35,6 +199,14 @@ async def lifespan(app: FastAPI):
     # 시작 시
     try:
         await redis_connection.connect()
+        if cache_invalidator:
+            await cache_invalidator.start()
+        if status_consumer:
+            await status_consumer.start()
+        if index_sweeper:
+            await index_sweeper.start()
+        if event_hub:
+            await event_hub.start()
         logger.info("애플리케이션 시작 완료")
     except Exception as e:
         logger.error(f"애플리케이션 시작 실패: {e}")
@@ -43,6 +215,7 @@ async def lifespan(app: FastAPI):
     
     # 종료 시
     try:
+        await drain(drain_timeout)
         await redis_connection.disconnect()
         logger.info("애플리케이션 종료 완료")
     except Exception as e:
@@ -66,6 +239,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 드레인 중 새 요청 거절, 처리 중인 요청 집계
+app.add_middleware(DrainMiddleware, controller=drain_controller)
+
+# 요청별 처리 시간/Redis 명령 측정 (가장 바깥에서 감싸도록 마지막에 추가)
+app.add_middleware(
+    RequestTimingMiddleware,
+    server_timing_header=os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true",
+)
+
 # 의존성 오버라이드
 def override_redis_connection() -> RedisConnection:
     return redis_connection
@@ -73,13 +255,41 @@ def override_redis_connection() -> RedisConnection:
 def override_push_service() -> PushNotificationService:
     return push_service
 
+def override_broadcast_service() -> TopicBroadcastService:
+    return broadcast_service
+
+def override_push_stats_service() -> Optional[PushStatsService]:
+    return stats_service
+
+def override_push_event_hub() -> Optional[PushEventHub]:
+    return event_hub
+
+def override_batch_push_limits() -> BatchPushLimits:
+    return batch_push_limits
+
+def override_fast_serialization() -> bool:
+    return fast_serialization
+
+def override_push_rate_limiter() -> Optional[PushRateLimiter]:
+    return push_rate_limiter
+
 # 의존성 주입 설정
 app.dependency_overrides[get_redis_connection] = override_redis_connection
 app.dependency_overrides[get_push_notification_service] = override_push_service
+app.dependency_overrides[get_topic_broadcast_service] = override_broadcast_service
+app.dependency_overrides[get_push_stats_service] = override_push_stats_service
+app.dependency_overrides[get_push_event_hub] = override_push_event_hub
+app.dependency_overrides[get_batch_push_limits] = override_batch_push_limits
+app.dependency_overrides[get_fast_serialization] = override_fast_serialization
+app.dependency_overrides[get_push_rate_limiter] = override_push_rate_limiter
 
 # 라우터 등록
 app.include_router(health_api_router)
+app.include_router(metrics_api_router)
+# `/push/stats`가 `/push/{push_uuid}`에 잡히지 않도록 푸시 라우터보다 먼저 등록
+app.include_router(stats_api_router)
 app.include_router(push_api_router)
+app.include_router(broadcast_api_router)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,14 @@
 """Presentation API package"""
+from .broadcast_router import router as broadcast_router
 from .health_router import router as health_router
+from .metrics_router import router as metrics_router
 from .push_router import router as push_router
+from .stats_router import router as stats_router
 
-__all__ = ["health_router", "push_router"]
\ No newline at end of file
+__all__ = [
+    "broadcast_router",
+    "health_router",
+    "metrics_router",
+    "push_router",
+    "stats_router",
+]
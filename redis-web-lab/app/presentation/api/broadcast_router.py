@@ -0,0 +1,172 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.application.services import TopicBroadcastService
+from app.application.use_cases import (
+    GetBroadcastJobQuery,
+    GetBroadcastJobUseCase,
+    StartTopicBroadcastCommand,
+    StartTopicBroadcastUseCase,
+    SubscribeTopicCommand,
+    SubscribeTopicUseCase,
+    UnsubscribeTopicCommand,
+    UnsubscribeTopicUseCase,
+)
+from app.domain.entities import BroadcastJob
+from app.infrastructure.rate_limiting import PushRateLimiter
+from app.presentation.api.push_router import enforce_push_rate_limit, get_push_rate_limiter
+from app.presentation.schemas import (
+    BroadcastJobResponse,
+    TopicBroadcastRequest,
+    TopicSubscribersRequest,
+    TopicSubscribersResponse,
+)
+
+router = APIRouter(prefix="/push", tags=["Topic Broadcast"])
+
+
+def get_topic_broadcast_service() -> TopicBroadcastService:
+    """토픽 일괄 발송 서비스 의존성 주입"""
+    # 이는 main.py에서 오버라이드됩니다
+    raise NotImplementedError
+
+
+def _to_job_response(job: BroadcastJob) -> BroadcastJobResponse:
+    """작업 엔티티를 응답 스키마로 변환"""
+    return BroadcastJobResponse(
+        job_id=job.job_id,
+        topic=job.topic,
+        status=job.status,
+        total=job.total,
+        succeeded=job.succeeded,
+        failed=job.failed,
+        progress=job.progress,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+    )
+
+
+@router.post("/topic/{topic}/subscribers", response_model=TopicSubscribersResponse)
+async def subscribe_topic(
+    topic: str,
+    request: TopicSubscribersRequest,
+    broadcast_service: TopicBroadcastService = Depends(get_topic_broadcast_service),
+):
+    """토픽 구독자 추가"""
+    try:
+        use_case = SubscribeTopicUseCase(broadcast_service)
+        added = await use_case.execute(
+            SubscribeTopicCommand(topic=topic, user_ids=request.user_ids)
+        )
+        return TopicSubscribersResponse(
+            topic=topic,
+            changed=added,
+            subscribers=await broadcast_service.count_subscribers(topic),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="토픽 구독 실패"
+        )
+
+
+@router.delete("/topic/{topic}/subscribers", response_model=TopicSubscribersResponse)
+async def unsubscribe_topic(
+    topic: str,
+    request: TopicSubscribersRequest,
+    broadcast_service: TopicBroadcastService = Depends(get_topic_broadcast_service),
+):
+    """토픽 구독자 제거"""
+    try:
+        use_case = UnsubscribeTopicUseCase(broadcast_service)
+        removed = await use_case.execute(
+            UnsubscribeTopicCommand(topic=topic, user_ids=request.user_ids)
+        )
+        return TopicSubscribersResponse(
+            topic=topic,
+            changed=removed,
+            subscribers=await broadcast_service.count_subscribers(topic),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="토픽 구독 해지 실패"
+        )
+
+
+@router.get("/topic/{topic}/subscribers", response_model=TopicSubscribersResponse)
+async def count_topic_subscribers(
+    topic: str,
+    broadcast_service: TopicBroadcastService = Depends(get_topic_broadcast_service),
+):
+    """토픽 구독자 수 조회"""
+    try:
+        return TopicSubscribersResponse(
+            topic=topic, subscribers=await broadcast_service.count_subscribers(topic)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="토픽 구독자 수 조회 실패"
+        )
+
+
+@router.post(
+    "/topic/{topic}/broadcast",
+    response_model=BroadcastJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def broadcast_topic(
+    topic: str,
+    request: TopicBroadcastRequest,
+    broadcast_service: TopicBroadcastService = Depends(get_topic_broadcast_service),
+    rate_limiter: Optional[PushRateLimiter] = Depends(get_push_rate_limiter),
+):
+    """토픽 구독자 전체에게 푸시 일괄 발송 (작업을 만들고 바로 202 반환, 진행은 작업 조회로 확인)
+
+    발송 시작 한 번을 토픽 한도의 요청 하나로 계산하며, 한도를 넘으면 429와 Retry-After로
+    거절합니다.
+    """
+    await enforce_push_rate_limit(rate_limiter, None, topic)
+    try:
+        use_case = StartTopicBroadcastUseCase(broadcast_service)
+        job = await use_case.execute(
+            StartTopicBroadcastCommand(topic=topic, message=request.message)
+        )
+        return _to_job_response(job)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="토픽 일괄 발송 시작 실패"
+        )
+
+
+@router.get("/broadcast/{job_id}", response_model=BroadcastJobResponse)
+async def get_broadcast_job(
+    job_id: UUID,
+    broadcast_service: TopicBroadcastService = Depends(get_topic_broadcast_service),
+):
+    """일괄 발송 작업 진행 상황 조회"""
+    try:
+        use_case = GetBroadcastJobUseCase(broadcast_service)
+        job = await use_case.execute(GetBroadcastJobQuery(job_id=job_id))
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="발송 작업을 찾을 수 없습니다"
+            )
+        return _to_job_response(job)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="발송 작업 조회 실패"
+        )
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=Response)
+async def metrics() -> Response:
+    """Prometheus 메트릭 엔드포인트 (워커 프로세스 단위)"""
+    return Response(content=generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -1,13 +1,20 @@
+import asyncio
+import json
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import ValidationError
 
 from app.application.services import PushNotificationService
 from app.application.use_cases import (
     CreatePushNotificationCommand,
     CreatePushNotificationUseCase,
+    CreatePushNotificationsBatchCommand,
+    CreatePushNotificationsBatchUseCase,
     DeletePushNotificationCommand, 
     DeletePushNotificationUseCase,
     GetPushNotificationQuery,
@@ -17,9 +24,15 @@ from app.application.use_cases import (
     GetUserPushNotificationsQuery,
     GetUserPushNotificationsUseCase,
 )
-from app.domain.entities import PushNotification
+from app.domain.entities import PushNotification, PushNotificationPage
+from app.infrastructure.messaging import PushEventHub
+from app.infrastructure.monitoring import timing_span
+from app.infrastructure.rate_limiting import PushRateLimiter
 from app.presentation.schemas import (
+    BatchPushItemResult,
+    BatchPushResponse,
     ErrorResponse,
+    PushNotificationListResponse,
     PushNotificationResponse,
     UserPushRequest,
     UserPushResponse,
@@ -27,6 +40,23 @@ from app.presentation.schemas import (
 
 router = APIRouter(prefix="/push", tags=["Push Notifications"])
 
+# 일괄 생성 시 한 번에 서비스로 넘기는 항목 수 (스트리밍 입력의 메모리 상한)
+_BATCH_CHUNK_SIZE = 1000
+_NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+# 실시간 스트림이 조용할 때 프록시/로드밸런서가 연결을 끊지 않도록 보내는 주석 간격
+_SSE_HEARTBEAT_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class BatchPushLimits:
+    """일괄 생성 요청 하나의 상한 (넘으면 413)"""
+    max_items: int = 10_000
+    max_bytes: int = 10 * 1024 * 1024
+
+
+class _BatchLimitExceeded(Exception):
+    """일괄 생성 본문을 읽는 도중 상한을 넘음"""
+
 
 def get_push_notification_service() -> PushNotificationService:
     """푸시 알림 서비스 의존성 주입"""
@@ -34,25 +64,108 @@ def get_push_notification_service() -> PushNotificationService:
     raise NotImplementedError
 
 
+def get_push_rate_limiter() -> Optional[PushRateLimiter]:
+    """푸시 생성 요청 제한기 (None이면 제한 없음)"""
+    # main.py에서 PUSH_RATE_LIMIT_USER/PUSH_RATE_LIMIT_TOPIC 설정으로 오버라이드됩니다
+    return None
+
+
+async def enforce_push_rate_limit(
+    rate_limiter: Optional[PushRateLimiter], user_id: Optional[str], topic: Optional[str]
+) -> None:
+    """요청 한도를 넘으면 429와 Retry-After로 거절"""
+    if rate_limiter is None:
+        return
+    decision = await rate_limiter.check(user_id, topic)
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"요청 한도를 초과했습니다 ({decision.scope})",
+            headers={"Retry-After": decision.retry_after_header},
+        )
+
+
+def get_push_event_hub() -> Optional[PushEventHub]:
+    """새 푸시 실시간 스트림 허브 (None이면 실시간 전달 꺼짐)"""
+    # main.py에서 PUSH_REALTIME_ENABLED 설정으로 오버라이드됩니다
+    return None
+
+
+def get_batch_push_limits() -> BatchPushLimits:
+    """일괄 생성 요청 상한"""
+    # main.py에서 PUSH_BATCH_MAX_ITEMS/PUSH_BATCH_MAX_BYTES 설정으로 오버라이드됩니다
+    return BatchPushLimits()
+
+
+def get_fast_serialization() -> bool:
+    """목록 응답의 빠른 직렬화 사용 여부"""
+    # main.py에서 PUSH_FAST_SERIALIZATION 값으로 오버라이드됩니다
+    return False
+
+
 def _to_push_response(entity: PushNotification) -> PushNotificationResponse:
     """엔티티를 응답 스키마로 변환"""
-    return PushNotificationResponse(
-        push_uuid=entity.push_uuid,
-        user_id=entity.user_id,
-        message=entity.message,
-        topic=entity.topic,
-        created_at=entity.created_at,
-        api_call_time=entity.api_call_time,
-        status=entity.status,
-    )
+    with timing_span("serialize"):
+        return PushNotificationResponse(
+            push_uuid=entity.push_uuid,
+            user_id=entity.user_id,
+            message=entity.message,
+            topic=entity.topic,
+            created_at=entity.created_at,
+            api_call_time=entity.api_call_time,
+            status=entity.status,
+        )
+
+
+def _to_push_list_response(page: PushNotificationPage) -> PushNotificationListResponse:
+    """페이지를 목록 응답 스키마로 변환"""
+    with timing_span("serialize"):
+        return PushNotificationListResponse(
+            items=[_to_push_response(entity) for entity in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+
+def _to_push_payload(entity: PushNotification) -> Dict[str, Any]:
+    """엔티티를 PushNotificationResponse와 같은 모양의 dict로 변환
+
+    UUID/datetime은 orjson이 직렬화합니다.
+    """
+    return {
+        "push_uuid": entity.push_uuid,
+        "user_id": entity.user_id,
+        "message": entity.message,
+        "topic": entity.topic,
+        "created_at": entity.created_at,
+        "api_call_time": entity.api_call_time,
+        "status": entity.status,
+    }
+
+
+def _to_fast_push_list_response(page: PushNotificationPage) -> ORJSONResponse:
+    """페이지를 검증 없이 바로 JSON 응답으로 변환
+
+    엔티티는 생성 시 이미 검증되었고 필드 타입이 응답 스키마와 같으므로, 응답 모델 생성과
+    FastAPI의 response_model 재검증/jsonable_encoder를 건너뛰고 orjson으로 한 번에
+    직렬화합니다. Response를 직접 반환하면 FastAPI는 response_model 처리를 하지 않습니다.
+    """
+    with timing_span("serialize"):
+        return ORJSONResponse(
+            {
+                "items": [_to_push_payload(entity) for entity in page.items],
+                "next_cursor": page.next_cursor,
+            }
+        )
 
 
 @router.post("", response_model=UserPushResponse)
 async def create_push(
     request: UserPushRequest,
-    push_service: PushNotificationService = Depends(get_push_notification_service)
+    push_service: PushNotificationService = Depends(get_push_notification_service),
+    rate_limiter: Optional[PushRateLimiter] = Depends(get_push_rate_limiter),
 ):
-    """푸시 알림 생성"""
+    """푸시 알림 생성 (사용자/토픽별 요청 한도 초과 시 429)"""
+    await enforce_push_rate_limit(rate_limiter, request.user_id, request.topic)
     try:
         use_case = CreatePushNotificationUseCase(push_service)
         command = CreatePushNotificationCommand(
@@ -83,6 +196,218 @@ async def create_push(
         )
 
 
+async def _iter_body(request: Request, max_bytes: int) -> AsyncIterator[bytes]:
+    """요청 본문을 받는 대로 전달 (max_bytes를 넘으면 _BatchLimitExceeded)"""
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise _BatchLimitExceeded(f"요청 본문이 최대 {max_bytes}바이트를 넘었습니다")
+        yield chunk
+
+
+async def _iter_batch_items(request: Request, limits: BatchPushLimits) -> AsyncIterator[Any]:
+    """요청 본문에서 일괄 생성 항목을 하나씩 읽음 (NDJSON은 줄 단위 스트리밍, JSON은 배열)
+
+    JSON 배열은 본문 전체를 읽어 항목 수까지 확인한 뒤 넘겨주므로 상한 초과는 저장 전에 413이
+    됩니다. NDJSON은 읽는 도중 상한을 넘을 수 있어 _BatchLimitExceeded로 알립니다.
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > limits.max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"요청 본문이 최대 {limits.max_bytes}바이트를 넘었습니다"
+        )
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in _NDJSON_MEDIA_TYPES:
+        buffer = b""
+        async for chunk in _iter_body(request, limits.max_bytes):
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+        if buffer.strip():
+            yield buffer
+        return
+
+    body = bytearray()
+    try:
+        async for chunk in _iter_body(request, limits.max_bytes):
+            body += chunk
+    except _BatchLimitExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e)
+        )
+    try:
+        items = json.loads(body)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid JSON body"
+        )
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Body must be a JSON array or an NDJSON stream"
+        )
+    if len(items) > limits.max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"항목 수가 최대 {limits.max_items}개를 넘었습니다"
+        )
+    for item in items:
+        yield item
+
+
+def _parse_batch_item(raw: Any) -> UserPushRequest:
+    """일괄 생성 항목 하나를 요청 스키마로 검증"""
+    if isinstance(raw, bytes):
+        return UserPushRequest.model_validate_json(raw)
+    return UserPushRequest.model_validate(raw)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """검증 오류를 한 줄 메시지로 변환"""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc']) or 'item'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=BatchPushResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/UserPushRequest"},
+                    }
+                },
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def create_push_batch(
+    request: Request,
+    response: Response,
+    push_service: PushNotificationService = Depends(get_push_notification_service),
+    limits: BatchPushLimits = Depends(get_batch_push_limits),
+    rate_limiter: Optional[PushRateLimiter] = Depends(get_push_rate_limiter),
+):
+    """푸시 알림 일괄 생성 (JSON 배열 또는 NDJSON 스트림, 항목별 결과 반환)
+
+    요청 제한은 항목마다 `POST /push` 한 건과 같이 적용하며, 한도를 넘은 항목은 저장하지 않고
+    `retry_after`와 함께 실패로 표시합니다(응답에는 가장 긴 대기 시간의 Retry-After 헤더).
+
+    항목은 청크 단위로 저장되므로, 이미 일부를 저장한 뒤 중단되면(NDJSON 상한 초과 413, 저장 오류
+    500) 그때까지의 항목별 결과와 `error`를 담아 응답합니다. 결과에 없는 항목은 처리하지 않았고,
+    저장 오류 시 진행 중이던 청크의 항목은 저장 여부를 알 수 없다는 실패로 표시합니다.
+    """
+    use_case = CreatePushNotificationsBatchUseCase(push_service)
+    results: List[BatchPushItemResult] = []
+    pending: List[Tuple[int, CreatePushNotificationCommand]] = []
+
+    retry_after: Optional[str] = None
+
+    async def _flush() -> None:
+        nonlocal retry_after
+        allowed = pending
+        if rate_limiter is not None:
+            decisions = await rate_limiter.check_many(
+                [(item.user_id, item.topic) for _, item in pending]
+            )
+            allowed = []
+            for (index, item), decision in zip(pending, decisions, strict=True):
+                if decision.allowed:
+                    allowed.append((index, item))
+                    continue
+                results.append(BatchPushItemResult(
+                    index=index,
+                    success=False,
+                    error=f"요청 한도를 초과했습니다 ({decision.scope})",
+                    retry_after=int(decision.retry_after_header),
+                ))
+                if retry_after is None or int(decision.retry_after_header) > int(retry_after):
+                    retry_after = decision.retry_after_header
+        command = CreatePushNotificationsBatchCommand(items=[item for _, item in allowed])
+        for (index, _), result in zip(allowed, await use_case.execute(command), strict=True):
+            entity = result.push_notification
+            results.append(BatchPushItemResult(
+                index=index,
+                success=result.succeeded,
+                push_uuid=entity.push_uuid if entity else None,
+                error=result.error,
+            ))
+        pending.clear()
+
+    error_status: Optional[int] = None
+    error: Optional[str] = None
+    try:
+        index = 0
+        try:
+            async for raw in _iter_batch_items(request, limits):
+                if index >= limits.max_items:
+                    raise _BatchLimitExceeded(f"항목 수가 최대 {limits.max_items}개를 넘었습니다")
+                try:
+                    item = _parse_batch_item(raw)
+                except ValidationError as e:
+                    results.append(BatchPushItemResult(
+                        index=index, success=False, error=_format_validation_error(e)
+                    ))
+                else:
+                    pending.append((index, CreatePushNotificationCommand(
+                        user_id=item.user_id,
+                        message=item.message,
+                        topic=item.topic
+                    )))
+                    if len(pending) >= _BATCH_CHUNK_SIZE:
+                        await _flush()
+                index += 1
+        except _BatchLimitExceeded as e:
+            # 상한 전까지 읽은 항목은 저장하고 중단
+            error_status, error = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, str(e)
+        if pending:
+            await _flush()
+    except HTTPException:
+        raise
+    except Exception:
+        if not results and not pending:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="푸시 일괄 생성 실패"
+            )
+        error_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+        error = "푸시 일괄 생성 중 저장 실패로 중단"
+        results.extend(
+            BatchPushItemResult(index=index, success=False, error="저장 여부를 확인할 수 없습니다")
+            for index, _ in pending
+        )
+
+    results.sort(key=lambda result: result.index)
+    succeeded = sum(1 for result in results if result.success)
+    body = BatchPushResponse(
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+        error=error,
+    )
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    if error_status is not None:
+        return JSONResponse(
+            status_code=error_status, content=body.model_dump(mode="json"), headers=headers
+        )
+    response.headers.update(headers)
+    return body
+
+
 @router.get("/{push_uuid}", response_model=PushNotificationResponse)
 async def get_push(
     push_uuid: UUID,
@@ -137,19 +462,28 @@ async def delete_push(
         )
 
 
-@router.get("/user/{user_id}/pushes", response_model=List[PushNotificationResponse])
+@router.get("/user/{user_id}/pushes", response_model=PushNotificationListResponse)
 async def get_user_pushes(
     user_id: str,
     limit: int = 10,
-    push_service: PushNotificationService = Depends(get_push_notification_service)
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    push_service: PushNotificationService = Depends(get_push_notification_service),
+    fast_serialization: bool = Depends(get_fast_serialization),
 ):
     """사용자별 푸시 알림 목록 조회"""
     try:
         use_case = GetUserPushNotificationsUseCase(push_service)
-        query = GetUserPushNotificationsQuery(user_id=user_id, limit=limit)
+        query = GetUserPushNotificationsQuery(user_id=user_id, limit=limit, cursor=cursor)
         
-        entities = await use_case.execute(query)
-        return [_to_push_response(entity) for entity in entities]
+        page = await use_case.execute(query)
+        if fast_serialization:
+            return _to_fast_push_list_response(page)
+        return _to_push_list_response(page)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -157,19 +491,68 @@ async def get_user_pushes(
         )
 
 
-@router.get("/topic/{topic}/pushes", response_model=List[PushNotificationResponse])
+async def _iter_push_events(
+    hub: PushEventHub, user_id: str, heartbeat_seconds: float = _SSE_HEARTBEAT_SECONDS
+) -> AsyncIterator[str]:
+    """사용자의 새 푸시를 SSE 이벤트로 변환 (구독 확인 후 첫 주석을 보내고, 조용하면 주석 전송)"""
+    async with hub.listen(user_id) as queue:
+        yield "retry: 3000\n: connected\n\n"
+        while True:
+            try:
+                async with asyncio.timeout(heartbeat_seconds):
+                    data = await queue.get()
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if data is None:
+                # 서버 종료 드레인: 클라이언트는 retry 간격 뒤 다른 인스턴스로 재연결
+                return
+            yield f"event: push\ndata: {data}\n\n"
+
+
+@router.get("/user/{user_id}/stream")
+async def stream_user_pushes(
+    user_id: str,
+    hub: Optional[PushEventHub] = Depends(get_push_event_hub),
+):
+    """사용자의 새 푸시 실시간 스트림 (Server-Sent Events, `event: push`의 data는 푸시 JSON)
+
+    연결 전후에 생성된 푸시는 전달되지 않을 수 있으므로 연결(재연결) 직후 목록 조회로 맞춥니다.
+    """
+    if hub is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="실시간 전달이 꺼져 있습니다"
+        )
+    return StreamingResponse(
+        _iter_push_events(hub, user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/topic/{topic}/pushes", response_model=PushNotificationListResponse)
 async def get_topic_pushes(
     topic: str,
     limit: int = 10,
-    push_service: PushNotificationService = Depends(get_push_notification_service)
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    push_service: PushNotificationService = Depends(get_push_notification_service),
+    fast_serialization: bool = Depends(get_fast_serialization),
 ):
     """토픽별 푸시 알림 목록 조회"""
     try:
         use_case = GetTopicPushNotificationsUseCase(push_service)
-        query = GetTopicPushNotificationsQuery(topic=topic, limit=limit)
+        query = GetTopicPushNotificationsQuery(topic=topic, limit=limit, cursor=cursor)
         
-        entities = await use_case.execute(query)
-        return [_to_push_response(entity) for entity in entities]
+        page = await use_case.execute(query)
+        if fast_serialization:
+            return _to_fast_push_list_response(page)
+        return _to_push_list_response(page)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
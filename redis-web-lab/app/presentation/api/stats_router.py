@@ -0,0 +1,72 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.application.services import PushStatsService
+from app.application.use_cases import GetPushStatsQuery, GetPushStatsUseCase
+from app.domain.entities import PushStatsBucket, TopicPushStats
+from app.presentation.schemas import (
+    PushStatsBucketResponse,
+    PushStatsResponse,
+    PushStatusCounts,
+    TopicPushStatsResponse,
+)
+
+# push_router의 `/push/{push_uuid}`보다 먼저 등록해야 `/push/stats`가 이 라우터로 옵니다
+router = APIRouter(prefix="/push", tags=["Push Stats"])
+
+
+def get_push_stats_service() -> Optional[PushStatsService]:
+    """토픽별 푸시 통계 서비스 (None이면 통계 집계 꺼짐)"""
+    # main.py에서 PUSH_STATS_ENABLED 설정으로 오버라이드됩니다
+    return None
+
+
+def _to_bucket_response(bucket: PushStatsBucket) -> PushStatsBucketResponse:
+    """시간 구간 통계를 응답 스키마로 변환"""
+    return PushStatsBucketResponse(
+        hour=bucket.hour,
+        counts=PushStatusCounts(**bucket.counts),
+        unique_users=bucket.unique_users,
+    )
+
+
+def _to_topic_stats_response(stats: TopicPushStats) -> TopicPushStatsResponse:
+    """토픽 통계를 응답 스키마로 변환"""
+    return TopicPushStatsResponse(
+        topic=stats.topic,
+        counts=PushStatusCounts(**stats.counts),
+        unique_users=stats.unique_users,
+        hourly=[_to_bucket_response(bucket) for bucket in stats.hourly],
+    )
+
+
+@router.get("/stats", response_model=PushStatsResponse)
+async def get_push_stats(
+    topic: Optional[str] = Query(None, description="토픽 (없으면 구간 안의 모든 토픽)"),
+    hours: int = Query(24, ge=1, le=24 * 31, description="조회 구간 (시간, 보존 시간까지)"),
+    stats_service: Optional[PushStatsService] = Depends(get_push_stats_service),
+):
+    """토픽별/상태별 푸시 수와 고유 사용자 수 (저장 시 누적한 카운터로 데이터 양과 무관하게 조회)"""
+    if stats_service is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="푸시 통계 집계가 꺼져 있습니다"
+        )
+    try:
+        use_case = GetPushStatsUseCase(stats_service)
+        stats = await use_case.execute(GetPushStatsQuery(hours=hours, topic=topic))
+        return PushStatsResponse(
+            hours=len(stats[0].hourly) if stats else hours,
+            topics=[_to_topic_stats_response(topic_stats) for topic_stats in stats],
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="푸시 통계 조회 실패"
+        )
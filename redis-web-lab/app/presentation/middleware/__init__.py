@@ -0,0 +1,5 @@
+"""Presentation middleware package"""
+from .drain_middleware import DrainController, DrainMiddleware
+from .request_timing_middleware import RequestTimingMiddleware
+
+__all__ = ["DrainController", "DrainMiddleware", "RequestTimingMiddleware"]
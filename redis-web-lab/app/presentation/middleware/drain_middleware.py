@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class DrainController:
+    """종료 드레인 상태와 처리 중인 요청 수 관리
+
+    begin()이 불리면 드레인 상태가 되어 새 요청을 거절하고, 등록한 콜백(예: 실시간
+    스트림 종료)을 실행합니다. 처리 중인 요청은 wait_idle()로 끝날 때까지 기다립니다.
+    begin()은 시그널 핸들러에서도 불리므로 이벤트 루프 스레드에서 동기로 동작합니다.
+    """
+
+    def __init__(self) -> None:
+        self._draining = False
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def draining(self) -> bool:
+        """드레인 중 여부"""
+        return self._draining
+
+    @property
+    def in_flight(self) -> int:
+        """처리 중인 요청 수"""
+        return self._in_flight
+
+    def on_drain(self, callback: Callable[[], None]) -> None:
+        """드레인 시작 시 실행할 콜백 등록"""
+        self._callbacks.append(callback)
+
+    def begin(self) -> None:
+        """드레인 시작 (여러 번 불러도 한 번만 동작)"""
+        if self._draining:
+            return
+        self._draining = True
+        logger.info(f"드레인 시작: 처리 중인 요청 {self._in_flight}개")
+        for callback in self._callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"드레인 콜백 실패: {e}")
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """요청 하나를 처리 중으로 집계"""
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """처리 중인 요청이 모두 끝날 때까지 최대 timeout초 대기 (모두 끝났으면 True)"""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+class DrainMiddleware:
+    """드레인 중에는 새 요청을 503으로 거절하고, 그 외 요청은 처리 중으로 집계하는 ASGI 미들웨어
+
+    거절 응답에는 `Connection: close`와 `Retry-After`를 붙여 클라이언트가 keep-alive
+    연결을 닫고 다른 인스턴스로 재시도하게 합니다.
+    """
+
+    def __init__(self, app: ASGIApp, controller: DrainController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.controller.draining:
+            response = JSONResponse(
+                {"detail": "서버가 종료 중입니다"},
+                status_code=503,
+                headers={"Retry-After": "1", "Connection": "close"},
+            )
+            await response(scope, receive, send)
+            return
+
+        with self.controller.track():
+            await self.app(scope, receive, send)
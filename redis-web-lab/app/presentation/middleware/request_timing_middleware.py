@@ -0,0 +1,93 @@
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+from prometheus_client import Histogram
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.monitoring import begin_request_timing, end_request_timing
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "요청 처리 시간(응답 헤더 전송까지)",
+    ["method", "route", "status"],
+)
+REQUEST_REDIS_SECONDS = Histogram(
+    "http_request_redis_seconds",
+    "요청당 Redis 왕복 누적 시간",
+    ["route"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+REQUEST_REDIS_COMMANDS = Histogram(
+    "http_request_redis_commands",
+    "요청당 Redis 명령 수",
+    ["route"],
+    buckets=(0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 1024),
+)
+REQUEST_SPAN_SECONDS = Histogram(
+    "http_request_span_seconds",
+    "요청 안의 구간별 처리 시간 (예: serialize)",
+    ["route", "span"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+
+class RequestTimingMiddleware:
+    """요청별 처리 시간과 Redis 명령 수/시간을 측정하는 ASGI 미들웨어
+
+    측정값은 Prometheus 히스토그램으로 기록하고 Server-Timing 헤더로도 돌려줍니다
+    (total, redis, 그리고 timing_span으로 측정한 구간). 라벨은 경로 템플릿을 사용해
+    푸시 UUID 등이 메트릭 카디널리티를 늘리지 않도록 합니다.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing_header: bool = True):
+        self.app = app
+        self.server_timing_header = server_timing_header
+        self._route_paths: Dict[Callable[..., Any], str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = begin_request_timing()
+        started = perf_counter()
+        status_code = 500
+        elapsed = 0.0
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code, elapsed
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = perf_counter() - started
+                if self.server_timing_header:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timing.server_timing(elapsed))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request_timing(token)
+            route = self._route_label(scope)
+            REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(
+                elapsed or perf_counter() - started
+            )
+            REQUEST_REDIS_SECONDS.labels(route).observe(timing.redis_seconds)
+            REQUEST_REDIS_COMMANDS.labels(route).observe(timing.redis_commands)
+            for name, seconds in timing.spans.items():
+                REQUEST_SPAN_SECONDS.labels(route, name).observe(seconds)
+
+    def _route_label(self, scope: Scope) -> str:
+        """라우팅된 엔드포인트의 경로 템플릿 (라우팅 실패 시 unmatched)"""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if endpoint not in self._route_paths:
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) == endpoint:
+                    self._route_paths[endpoint] = route.path
+                    break
+            else:
+                return "unmatched"
+        return self._route_paths[endpoint]
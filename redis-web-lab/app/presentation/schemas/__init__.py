@@ -1,16 +1,42 @@
 """Presentation schemas package"""
+from .broadcast_schemas import (
+    BroadcastJobResponse,
+    TopicBroadcastRequest,
+    TopicSubscribersRequest,
+    TopicSubscribersResponse,
+)
 from .push_schemas import (
+    BatchPushItemResult,
+    BatchPushResponse,
     ErrorResponse,
     HealthResponse,
+    PushNotificationListResponse,
     PushNotificationResponse,
     UserPushRequest,
     UserPushResponse,
 )
+from .stats_schemas import (
+    PushStatsBucketResponse,
+    PushStatsResponse,
+    PushStatusCounts,
+    TopicPushStatsResponse,
+)
 
 __all__ = [
     "UserPushRequest",
     "UserPushResponse", 
+    "BatchPushItemResult",
+    "BatchPushResponse",
     "PushNotificationResponse",
+    "PushNotificationListResponse",
     "HealthResponse",
     "ErrorResponse",
+    "TopicSubscribersRequest",
+    "TopicSubscribersResponse",
+    "TopicBroadcastRequest",
+    "BroadcastJobResponse",
+    "PushStatusCounts",
+    "PushStatsBucketResponse",
+    "TopicPushStatsResponse",
+    "PushStatsResponse",
 ]
\ No newline at end of file
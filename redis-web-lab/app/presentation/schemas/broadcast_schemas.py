@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TopicSubscribersRequest(BaseModel):
+    """토픽 구독자 추가/제거 요청 스키마"""
+    user_ids: List[str] = Field(..., description="사용자 ID 목록", min_length=1)
+
+
+class TopicSubscribersResponse(BaseModel):
+    """토픽 구독자 변경/조회 응답 스키마"""
+    topic: str = Field(..., description="토픽")
+    changed: int = Field(0, description="실제로 추가/제거된 구독자 수")
+    subscribers: int = Field(..., description="현재 구독자 수")
+
+
+class TopicBroadcastRequest(BaseModel):
+    """토픽 일괄 발송 요청 스키마"""
+    message: str = Field(..., description="푸시 메시지", min_length=1)
+
+
+class BroadcastJobResponse(BaseModel):
+    """일괄 발송 작업 응답 스키마"""
+    job_id: UUID = Field(..., description="작업 ID")
+    topic: str = Field(..., description="토픽")
+    status: str = Field(..., description="작업 상태 (pending/running/completed/failed/cancelled)")
+    total: int = Field(..., description="시작 시점 구독자 수")
+    succeeded: int = Field(..., description="생성된 푸시 수")
+    failed: int = Field(..., description="생성 실패 수")
+    progress: float = Field(..., description="진행률 (0~1)")
+    created_at: datetime = Field(..., description="생성 시간")
+    finished_at: Optional[datetime] = Field(None, description="종료 시간")
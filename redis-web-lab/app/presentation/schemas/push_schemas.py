@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -22,6 +22,28 @@ class UserPushResponse(BaseModel):
     status: str = Field(..., description="푸시 상태")
 
 
+class BatchPushItemResult(BaseModel):
+    """일괄 푸시 생성 항목별 결과 스키마"""
+    index: int = Field(..., description="요청 내 항목 순번 (0부터)")
+    success: bool = Field(..., description="생성 성공 여부")
+    push_uuid: Optional[UUID] = Field(None, description="생성된 푸시 UUID")
+    error: Optional[str] = Field(None, description="실패 사유")
+    retry_after: Optional[int] = Field(
+        None, description="요청 한도 초과로 거절된 경우 다시 시도할 수 있을 때까지의 시간(초)"
+    )
+
+
+class BatchPushResponse(BaseModel):
+    """일괄 푸시 생성 응답 스키마"""
+    total: int = Field(..., description="처리한 항목 수")
+    succeeded: int = Field(..., description="성공 항목 수")
+    failed: int = Field(..., description="실패 항목 수")
+    results: List[BatchPushItemResult] = Field(..., description="항목별 결과 (요청 순서)")
+    error: Optional[str] = Field(
+        None, description="처리를 중단한 사유 (있으면 results에 없는 이후 항목은 처리하지 않음)"
+    )
+
+
 class PushNotificationResponse(BaseModel):
     """푸시 알림 응답 스키마"""
     push_uuid: UUID = Field(..., description="푸시 UUID")
@@ -33,6 +55,14 @@ class PushNotificationResponse(BaseModel):
     status: str = Field(..., description="푸시 상태")
 
 
+class PushNotificationListResponse(BaseModel):
+    """푸시 알림 목록 응답 스키마 (커서 기반 페이지)"""
+    items: List[PushNotificationResponse] = Field(..., description="푸시 알림 목록 (최신순)")
+    next_cursor: Optional[str] = Field(
+        None, description="다음 페이지 커서 (마지막 페이지면 null)"
+    )
+
+
 class HealthResponse(BaseModel):
     """헬스체크 응답 스키마"""
     status: str = Field(..., description="서비스 상태")
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class PushStatusCounts(BaseModel):
+    """상태별 푸시 수 스키마"""
+    created: int = Field(0, description="생성된 푸시 수")
+    sent: int = Field(0, description="sent로 바뀐 푸시 수")
+    delivered: int = Field(0, description="delivered로 바뀐 푸시 수")
+    failed: int = Field(0, description="failed로 바뀐 푸시 수")
+
+
+class PushStatsBucketResponse(BaseModel):
+    """한 시간 구간의 토픽 푸시 통계 스키마"""
+    hour: datetime = Field(..., description="구간 시작 시각 (푸시 생성 시각 기준)")
+    counts: PushStatusCounts = Field(..., description="상태별 푸시 수")
+    unique_users: int = Field(..., description="고유 사용자 수 (HyperLogLog 근사값)")
+
+
+class TopicPushStatsResponse(BaseModel):
+    """토픽 푸시 통계 스키마"""
+    topic: str = Field(..., description="토픽")
+    counts: PushStatusCounts = Field(..., description="구간 전체의 상태별 푸시 수")
+    unique_users: int = Field(..., description="구간 전체의 고유 사용자 수 (HyperLogLog 근사값)")
+    hourly: List[PushStatsBucketResponse] = Field(..., description="시간별 통계 (최신순)")
+
+
+class PushStatsResponse(BaseModel):
+    """토픽별 푸시 통계 응답 스키마"""
+    hours: int = Field(..., description="조회 구간 (시간)")
+    topics: List[TopicPushStatsResponse] = Field(..., description="토픽별 통계 (토픽 이름순)")
@@ -0,0 +1,45 @@
+"""SIGTERM을 받으면 드레인부터 시작하는 uvicorn 실행 진입점
+
+`uvicorn app.main:app`은 SIGTERM 후 새 연결을 막고 처리 중인 요청이 끝나기를 기다린 다음에야
+lifespan 종료를 실행하므로, 끝나지 않는 실시간 스트림이 있으면 종료가 시한까지 밀립니다.
+이 진입점은 시그널을 받는 즉시 드레인을 시작해(새 요청 503, 스트림 종료) uvicorn의 대기가
+바로 끝나게 하고, 대기 시한(--timeout-graceful-shutdown)도 PUSH_DRAIN_TIMEOUT_SECONDS로 맞춥니다.
+
+    python -m app.server --host 0.0.0.0 --port 8000
+"""
+import argparse
+from types import FrameType
+from typing import Optional
+
+import uvicorn
+
+from app.main import app, drain_controller, drain_timeout
+
+
+class DrainingServer(uvicorn.Server):
+    """종료 시그널에서 드레인을 먼저 시작하는 uvicorn 서버"""
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        drain_controller.begin()
+        super().handle_exit(sig, frame)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Redis Web Lab API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        log_level=args.log_level,
+        timeout_graceful_shutdown=max(1, int(drain_timeout)),
+    )
+    DrainingServer(config).run()
+
+
+if __name__ == "__main__":
+    main()
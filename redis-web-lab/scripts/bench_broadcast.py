@@ -0,0 +1,99 @@
+"""토픽 일괄 발송 벤치마크
+
+구독자 N명에게 같은 메시지를 보내는 두 방식의 초당 생성 건수를 비교합니다.
+
+- per-request: 구독자마다 POST /push 한 번 (앱을 프로세스 안 ASGI로 호출하므로 네트워크
+  비용은 빠지고 라우팅/검증/미들웨어 비용만 남음, 실제 HTTP 호출보다 유리한 조건)
+- broadcast: 구독자를 청크 단위로 읽어 save_many로 저장 (POST /push/topic/{topic}/broadcast)
+
+    poetry run python -m scripts.bench_broadcast --subscribers 20000
+"""
+import argparse
+import asyncio
+import time
+
+from httpx import AsyncClient
+
+from app.application.services import PushNotificationService, TopicBroadcastService
+from app.domain.entities import BroadcastJob
+from app.infrastructure.repositories import (
+    RedisBroadcastJobRepository,
+    RedisPushNotificationRepository,
+    RedisTopicSubscriptionRepository,
+)
+from app.main import app
+from app.presentation.api.push_router import get_push_notification_service, get_push_rate_limiter
+from scripts.bench_redis import add_bench_redis_arguments, bench_redis
+
+
+async def run_per_request(
+    push_service: PushNotificationService, user_ids: list, topic: str, concurrency: int
+) -> float:
+    """구독자마다 POST /push를 호출해 초당 생성 건수 반환"""
+    app.dependency_overrides[get_push_notification_service] = lambda: push_service
+    app.dependency_overrides[get_push_rate_limiter] = lambda: None
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        async def _one(user_id: str) -> None:
+            async with semaphore:
+                response = await client.post(
+                    "/push", json={"user_id": user_id, "message": "bench", "topic": topic}
+                )
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_one(user_id) for user_id in user_ids))
+        elapsed = time.perf_counter() - started
+
+    rate = len(user_ids) / elapsed
+    print(f"{'per-request':<12} {len(user_ids)} pushes in {elapsed:.3f}s -> {rate:,.0f} pushes/sec")
+    return rate
+
+
+async def run_broadcast(
+    broadcast_service: TopicBroadcastService,
+    job_repository: RedisBroadcastJobRepository,
+    topic: str,
+) -> float:
+    """토픽 일괄 발송 작업 하나를 실행해 초당 생성 건수 반환"""
+    job = BroadcastJob.create_new(topic=topic, message="bench")
+    await job_repository.save(job)
+
+    started = time.perf_counter()
+    await broadcast_service.run_broadcast(job)
+    elapsed = time.perf_counter() - started
+
+    job = await job_repository.find_by_id(job.job_id)
+    rate = job.succeeded / elapsed
+    print(f"{'broadcast':<12} {job.succeeded} pushes in {elapsed:.3f}s -> {rate:,.0f} pushes/sec")
+    return rate
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="토픽 일괄 발송 벤치마크")
+    add_bench_redis_arguments(parser)
+    parser.add_argument("--subscribers", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    async with bench_redis(args) as connection:
+        push_service = PushNotificationService(RedisPushNotificationRepository(connection))
+        subscriptions = RedisTopicSubscriptionRepository(connection)
+        jobs = RedisBroadcastJobRepository(connection)
+        broadcast_service = TopicBroadcastService(
+            push_service, subscriptions, jobs, chunk_size=args.chunk_size
+        )
+
+        user_ids = [f"bench_subscriber_{i}" for i in range(args.subscribers)]
+        await subscriptions.subscribe("bench_broadcast", user_ids)
+        before = await run_per_request(
+            push_service, user_ids, "bench_per_request", args.concurrency
+        )
+        after = await run_broadcast(broadcast_service, jobs, "bench_broadcast")
+        print(f"speedup      x{after / before:.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
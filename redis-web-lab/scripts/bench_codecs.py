@@ -0,0 +1,87 @@
+"""푸시 기록 저장 형식(코덱) 벤치마크
+
+코덱별로 같은 푸시 기록을 저장한 뒤 키당 메모리(MEMORY USAGE), 순수 역직렬화 처리량,
+파이프라인 일괄 조회(find_many) 처리량을 로컬 redis-server 대상으로 비교합니다.
+hash 형식은 필드 분해가 응답 파싱(hiredis) 단계에서 이미 끝나므로 역직렬화 수치는
+hash 쪽에 유리하게 나오며, 전체 비용은 find_many 처리량으로 비교합니다.
+
+    poetry run python -m scripts.bench_codecs --count 20000
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from app.domain.entities import PushNotification
+from app.infrastructure.codecs import (
+    HashPushRecordCodec,
+    MsgpackPushRecordCodec,
+    PushRecordCodec,
+)
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import RedisPushNotificationRepository
+from scripts.bench_redis import add_bench_redis_arguments, bench_redis
+
+MEMORY_SAMPLE_SIZE = 1000
+FETCH_BATCH_SIZE = 100
+
+
+async def bench_codec(
+    connection: RedisConnection, codec: PushRecordCodec, entities: List[PushNotification]
+) -> None:
+    """한 코덱의 메모리/역직렬화/조회 처리량 측정 (bench_redis로 연결한 전용 DB를 비우고 시작)"""
+    client = connection.client
+    await client.flushdb()
+    repository = RedisPushNotificationRepository(connection, codec=codec)
+    await repository.save_many(entities)
+
+    sample = entities[:MEMORY_SAMPLE_SIZE]
+    async with client.pipeline(transaction=False) as pipe:
+        for entity in sample:
+            # SAMPLES 0: Hash의 모든 필드를 세어 정확한 값을 구함
+            pipe.memory_usage(f"push:{entity.push_uuid}", samples=0)
+        usages = await pipe.execute()
+    memory_per_key = sum(usages) / len(usages)
+
+    async with client.pipeline(transaction=False) as pipe:
+        for entity in entities:
+            codec.queue_read(pipe, f"push:{entity.push_uuid}")
+        raws = await pipe.execute()
+    started = time.perf_counter()
+    for raw in raws:
+        codec.decode(raw)
+    decode_rate = len(raws) / (time.perf_counter() - started)
+
+    push_uuids = [entity.push_uuid for entity in entities]
+    started = time.perf_counter()
+    for start in range(0, len(push_uuids), FETCH_BATCH_SIZE):
+        await repository.find_many(push_uuids[start:start + FETCH_BATCH_SIZE])
+    fetch_rate = len(push_uuids) / (time.perf_counter() - started)
+
+    print(
+        f"{codec.name:<8} {memory_per_key:>8,.0f} B/key  "
+        f"decode {decode_rate:>10,.0f} rec/s  find_many {fetch_rate:>9,.0f} rec/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="푸시 기록 코덱 벤치마크")
+    add_bench_redis_arguments(parser)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--message-size", type=int, default=40)
+    args = parser.parse_args()
+
+    entities = [
+        PushNotification.create_new(
+            user_id=f"bench_user_{i % 100}", message="m" * args.message_size
+        )
+        for i in range(args.count)
+    ]
+
+    async with bench_redis(args) as connection:
+        for codec in (HashPushRecordCodec(), MsgpackPushRecordCodec()):
+            await bench_codec(connection, codec, entities)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
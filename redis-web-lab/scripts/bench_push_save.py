@@ -0,0 +1,106 @@
+"""푸시 저장 경로 벤치마크
+
+순차 명령(HSET/EXPIRE/SADD/EXPIRE/SADD/EXPIRE) 방식, 트랜잭션 파이프라인 방식,
+청크 단위 일괄 저장(save_many) 방식의 초당 저장 건수를 로컬 redis-server 대상으로 비교합니다.
+
+    poetry run python -m scripts.bench_push_save --count 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+
+from app.domain.entities import PushNotification
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import RedisPushNotificationRepository
+from scripts.bench_redis import add_bench_redis_arguments, bench_redis
+
+TTL_SECONDS = 60
+
+
+async def save_sequential(connection: RedisConnection, entity: PushNotification) -> None:
+    """기존 방식: 명령마다 한 번씩 왕복"""
+    client = connection.client
+    push_uuid = str(entity.push_uuid)
+    key = f"push:{push_uuid}"
+    await client.hset(
+        key,
+        mapping={
+            "push_uuid": push_uuid,
+            "user_id": entity.user_id,
+            "message": entity.message,
+            "topic": entity.topic,
+            "created_at": entity.created_at.isoformat(),
+            "api_call_time": entity.api_call_time.isoformat(),
+            "status": entity.status,
+        },
+    )
+    await client.expire(key, TTL_SECONDS)
+    user_key = f"bench_seq_user:{entity.user_id}"
+    await client.sadd(user_key, push_uuid)
+    await client.expire(user_key, TTL_SECONDS)
+    topic_key = f"bench_seq_topic:{entity.topic}"
+    await client.sadd(topic_key, push_uuid)
+    await client.expire(topic_key, TTL_SECONDS)
+
+
+async def run(name: str, save, count: int, concurrency: int) -> float:
+    """동시성 제한 하에 count건 저장 후 초당 처리량 반환"""
+    semaphore = asyncio.Semaphore(concurrency)
+    entities = [
+        PushNotification.create_new(user_id=f"bench_user_{i % 100}", message="bench")
+        for i in range(count)
+    ]
+
+    async def _one(entity: PushNotification) -> None:
+        async with semaphore:
+            await save(entity)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one(entity) for entity in entities))
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed
+    print(f"{name:<12} {count} pushes in {elapsed:.3f}s -> {rate:,.0f} pushes/sec")
+    return rate
+
+
+async def run_batch(
+    repository: RedisPushNotificationRepository, count: int, batch_size: int
+) -> float:
+    """batch_size 단위 save_many로 count건 저장 후 초당 처리량 반환"""
+    entities = [
+        PushNotification.create_new(user_id=f"bench_user_{i % 100}", message="bench")
+        for i in range(count)
+    ]
+
+    started = time.perf_counter()
+    for start in range(0, count, batch_size):
+        await repository.save_many(entities[start:start + batch_size])
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed
+    print(f"{'save_many':<12} {count} pushes in {elapsed:.3f}s -> {rate:,.0f} pushes/sec")
+    return rate
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="푸시 저장 경로 벤치마크")
+    add_bench_redis_arguments(parser)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    async with bench_redis(args) as connection:
+        repository = RedisPushNotificationRepository(connection)
+        before = await run(
+            "sequential",
+            lambda entity: save_sequential(connection, entity),
+            args.count,
+            args.concurrency,
+        )
+        after = await run("pipeline", repository.save, args.count, args.concurrency)
+        batch = await run_batch(repository, args.count, args.batch_size)
+        print(f"speedup      pipeline x{after / before:.2f}, save_many x{batch / before:.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
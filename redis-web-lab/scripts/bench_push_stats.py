@@ -0,0 +1,120 @@
+"""토픽별 푸시 통계 벤치마크
+
+같은 푸시를 통계를 켜고/끄고 저장(save, save_many)해 저장 처리량 차이를 보고, 저장된 양을
+늘려 가며 통계 조회(RedisPushStatsStore.read) 시간과 `push:*` 키를 SCAN해 직접 세는 시간을
+비교합니다. 통계 조회는 저장된 양과 무관하게 구간 수만큼의 명령을 파이프라인 한두 번으로 보냅니다.
+
+    poetry run python -m scripts.bench_push_stats --count 20000 --topics 20 --users 5000
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import List, Optional
+
+from app.domain.entities import PushNotification
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import RedisPushNotificationRepository
+from app.infrastructure.storage import RedisPushStatsStore
+from scripts.bench_redis import add_bench_redis_arguments, bench_redis
+
+
+def make_entities(count: int, topics: int, users: int, offset: int = 0) -> List[PushNotification]:
+    """벤치마크용 푸시 목록"""
+    return [
+        PushNotification.create_new(
+            user_id=f"user_{(offset + i) % users}",
+            message="bench",
+            topic=f"topic_{(offset + i) % topics}",
+        )
+        for i in range(count)
+    ]
+
+
+async def bench_save(
+    connection: RedisConnection,
+    stats: Optional[RedisPushStatsStore],
+    count: int,
+    concurrency: int,
+    batch_size: int,
+    topics: int,
+    users: int,
+) -> None:
+    """단건 저장(동시 concurrency개)과 일괄 저장 처리량 출력"""
+    name = "stats" if stats else "no stats"
+    repository = RedisPushNotificationRepository(connection, ttl_seconds=600, stats=stats)
+
+    entities = make_entities(count, topics, users)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(entity: PushNotification) -> None:
+        async with semaphore:
+            await repository.save(entity)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one(entity) for entity in entities))
+    single = count / (time.perf_counter() - started)
+
+    entities = make_entities(count, topics, users)
+    started = time.perf_counter()
+    for start in range(0, count, batch_size):
+        await repository.save_many(entities[start:start + batch_size])
+    batch = count / (time.perf_counter() - started)
+    print(f"{name:<9} save {single:>9,.0f}/s  save_many {batch:>9,.0f}/s")
+
+
+async def count_by_scan(connection: RedisConnection) -> Counter:
+    """통계 없이 모든 기록을 SCAN해 토픽별 수를 세는 방식"""
+    client = connection.client
+    counts: Counter = Counter()
+    async for key in client.scan_iter(match="push:*", count=1000):
+        topic = await client.hget(key, "topic")
+        if topic is not None:
+            counts[topic] += 1
+    return counts
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="토픽별 푸시 통계 벤치마크")
+    add_bench_redis_arguments(parser)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--hours", type=int, default=24)
+    args = parser.parse_args()
+
+    async with bench_redis(args) as connection:
+        for stats in (None, RedisPushStatsStore(connection)):
+            await bench_save(
+                connection, stats, args.count, args.concurrency, args.batch_size,
+                args.topics, args.users,
+            )
+            await connection.client.flushdb()
+
+        stats = RedisPushStatsStore(connection)
+        repository = RedisPushNotificationRepository(connection, ttl_seconds=600, stats=stats)
+        stored = 0
+        for size in (args.count // 10, args.count - args.count // 10):
+            entities = make_entities(size, args.topics, args.users, offset=stored)
+            for start in range(0, size, args.batch_size):
+                await repository.save_many(entities[start:start + args.batch_size])
+            stored += size
+
+            started = time.perf_counter()
+            for _ in range(20):
+                result = await stats.read(args.hours)
+            read_ms = (time.perf_counter() - started) / 20 * 1000
+            started = time.perf_counter()
+            scanned = await count_by_scan(connection)
+            scan_ms = (time.perf_counter() - started) * 1000
+            assert sum(s.counts["created"] for s in result) == sum(scanned.values()) == stored
+            print(
+                f"{stored:>9,} pushes  stats read ({args.hours}h) {read_ms:>7.2f}ms  "
+                f"SCAN count {scan_ms:>9,.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
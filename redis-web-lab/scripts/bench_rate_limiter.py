@@ -0,0 +1,89 @@
+"""요청 제한 판정 지연 시간 벤치마크
+
+사용자 + 토픽 버킷 두 개를 확인하는 PushRateLimiter.check()의 지연 시간 분포를 같은 커넥션
+풀의 PING 왕복과 비교합니다. 판정은 한 번의 왕복이므로 PING과의 차이가 요청당 추가 비용
+(스크립트 실행 + 클라이언트 인코딩)입니다. 동시성을 높이면 한 프로세스의 클라이언트 CPU가
+먼저 포화되어 두 값 모두 이벤트 루프 대기 시간이 지배하므로 기본값은 동시성 1입니다.
+
+    poetry run python -m scripts.bench_rate_limiter --requests 20000
+    poetry run python -m scripts.bench_rate_limiter --cluster --redis-url redis://127.0.0.1:7000
+"""
+import argparse
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, List
+
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.rate_limiting import PushRateLimiter, RateLimit
+
+
+def percentile(samples: List[float], ratio: float) -> float:
+    """정렬된 표본의 백분위 값"""
+    return samples[min(len(samples) - 1, int(len(samples) * ratio))]
+
+
+async def measure(
+    name: str, call: Callable[[int], Awaitable[object]], requests: int, concurrency: int
+) -> float:
+    """requests번 호출의 지연 시간 분포 출력 (p99 ms 반환)"""
+    latencies: List[float] = []
+
+    async def worker(offset: int) -> None:
+        for i in range(offset, requests, concurrency):
+            started = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    p50, p95, p99 = (percentile(latencies, r) * 1000 for r in (0.50, 0.95, 0.99))
+    print(
+        f"{name:<12} {requests / elapsed:>9,.0f} req/s  "
+        f"p50 {p50:.3f}ms  p95 {p95:.3f}ms  p99 {p99:.3f}ms"
+    )
+    return p99
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="요청 제한 판정 지연 시간 벤치마크")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/15"))
+    parser.add_argument("--cluster", action="store_true", help="Redis Cluster로 연결")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--topics", type=int, default=10)
+    args = parser.parse_args()
+
+    connection = RedisConnection(redis_url=args.redis_url, cluster=args.cluster)
+    await connection.connect()
+    # 판정 비용만 보기 위해 거절되지 않을 만큼 큰 한도 사용
+    limiter = PushRateLimiter(
+        connection,
+        user_limit=RateLimit(rate=1_000_000, burst=1_000_000),
+        topic_limit=RateLimit(rate=1_000_000, burst=1_000_000),
+        key_prefix="bench_rate_limit",
+    )
+    try:
+        client = connection.client
+        await limiter.check("warmup", "warmup")
+        ping_p99 = await measure(
+            "ping", lambda i: client.ping(), args.requests, args.concurrency
+        )
+        check_p99 = await measure(
+            "check",
+            lambda i: limiter.check(f"user_{i % args.users}", f"topic_{i % args.topics}"),
+            args.requests,
+            args.concurrency,
+        )
+        print(f"p99 overhead vs ping: {check_p99 - ping_p99:+.3f}ms")
+    finally:
+        async for key in client.scan_iter(match="bench_rate_limit:*", count=1000):
+            await client.delete(key)
+        await connection.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
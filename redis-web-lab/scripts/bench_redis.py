@@ -0,0 +1,44 @@
+"""벤치마크 스크립트 공용 Redis 연결
+
+벤치마크는 실행 중/후에 DB를 비우므로 앱 연결 변수(REDIS_URL)를 읽지 않고 전용 DB 15를
+기본값으로 씁니다. 대상 DB에 키가 있으면 --flush를 명시하지 않는 한 아무것도 쓰기 전에
+중단합니다.
+"""
+import argparse
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.infrastructure.database import RedisConnection
+
+DEFAULT_BENCH_REDIS_URL = "redis://localhost:6379/15"
+
+
+def add_bench_redis_arguments(parser: argparse.ArgumentParser) -> None:
+    """--redis-url / --flush 인자 추가"""
+    parser.add_argument(
+        "--redis-url", default=DEFAULT_BENCH_REDIS_URL, help="벤치마크 전용 DB (실행 중 비움)"
+    )
+    parser.add_argument(
+        "--flush", action="store_true", help="대상 DB에 키가 있어도 비우고 실행"
+    )
+
+
+@asynccontextmanager
+async def bench_redis(args: argparse.Namespace) -> AsyncIterator[RedisConnection]:
+    """비어 있거나 --flush로 비우기를 허락한 DB에 연결 (끝나면 비우고 연결 해제)"""
+    connection = RedisConnection(redis_url=args.redis_url)
+    await connection.connect()
+    try:
+        keys = await connection.client.dbsize()
+        if keys and not args.flush:
+            raise SystemExit(
+                f"{args.redis_url}에 키 {keys}개가 있습니다. "
+                "벤치마크가 DB를 비우도록 허락하려면 --flush를 붙이세요."
+            )
+        await connection.client.flushdb()
+        try:
+            yield connection
+        finally:
+            await connection.client.flushdb()
+    finally:
+        await connection.disconnect()
@@ -0,0 +1,79 @@
+"""목록 응답 직렬화 벤치마크
+
+100건짜리 목록 페이지 하나를 JSON 응답 바이트로 만드는 비용을 비교합니다 (Redis 불필요).
+
+- default: 응답 모델 생성 → FastAPI response_model 재검증/jsonable_encoder → JSONResponse
+  (FastAPI가 엔드포인트 반환값을 처리하는 경로와 같음)
+- fast: 엔티티 dict → ORJSONResponse (PUSH_FAST_SERIALIZATION=true)
+
+    poetry run python -m scripts.bench_serialization --items 100 --rounds 2000
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute, serialize_response
+
+from app.domain.entities import PushNotification, PushNotificationPage
+from app.presentation.api.push_router import (
+    _to_fast_push_list_response,
+    _to_push_list_response,
+    get_user_pushes,
+    router,
+)
+
+
+async def bench(name: str, render: Callable[[], Awaitable[Response]], rounds: int) -> float:
+    """rounds번 응답을 만들어 한 번당 평균 시간(µs) 출력"""
+    for _ in range(min(rounds, 100)):
+        await render()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        response = await render()
+    per_listing = (time.perf_counter() - started) / rounds * 1_000_000
+    print(f"{name:<8} {per_listing:>9,.1f} µs/listing  ({len(response.body):,} bytes)")
+    return per_listing
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 벤치마크")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--message-size", type=int, default=40)
+    args = parser.parse_args()
+
+    page = PushNotificationPage(
+        items=[
+            PushNotification.create_new(
+                user_id="bench_user", message="m" * args.message_size, topic="bench"
+            )
+            for _ in range(args.items)
+        ],
+        next_cursor="bmV4dA",
+    )
+    route = next(
+        route
+        for route in router.routes
+        if isinstance(route, APIRoute) and route.endpoint is get_user_pushes
+    )
+
+    async def render_default() -> Response:
+        content = await serialize_response(
+            field=route.response_field,
+            response_content=_to_push_list_response(page),
+            is_coroutine=True,
+        )
+        return JSONResponse(content)
+
+    async def render_fast() -> Response:
+        return _to_fast_push_list_response(page)
+
+    default = await bench("default", render_default, args.rounds)
+    fast = await bench("fast", render_fast, args.rounds)
+    print(f"speedup  {default / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+"""실시간 스트림(SSE) 유휴 연결당 메모리 벤치마크
+
+서버 프로세스 하나(app.server)를 PUSH_REALTIME_ENABLED=true로 띄우고 사용자마다 SSE 스트림을 하나씩
+연결한 뒤, 연결 전후 서버 프로세스 RSS 차이를 연결 수로 나눠 유휴 연결당 메모리를 구합니다.
+이어서 일부 사용자에게 푸시를 만들어 스트림으로 도착하기까지의 지연 시간을 잽니다.
+클라이언트는 asyncio 소켓으로 직접 요청해 측정 프로세스 자체의 부담을 줄입니다.
+
+    poetry run python -m scripts.bench_sse_connections --connections 2000
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+import httpx
+
+
+def rss_bytes(pid: int) -> int:
+    """프로세스 RSS (Linux /proc 기준)"""
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    raise RuntimeError("VmRSS not found")
+
+
+def spawn_server(args: argparse.Namespace) -> subprocess.Popen:
+    """실시간 전달을 켠 서버 프로세스 하나를 실행하고 /health가 응답할 때까지 대기"""
+    command = [
+        sys.executable, "-m", "app.server",
+        "--host", "127.0.0.1", "--port", str(args.port), "--log-level", "warning",
+    ]
+    env = {
+        **os.environ,
+        "REDIS_URL": args.redis_url,
+        "PUSH_REALTIME_ENABLED": "true",
+        "PUSH_INDEX_SWEEP_INTERVAL_SECONDS": "0",
+    }
+    process = subprocess.Popen(
+        command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{args.base_url}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            raise RuntimeError("server exited before becoming healthy")
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("server did not become healthy within 30s")
+
+
+async def open_stream(port: int, user_id: str) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """SSE 스트림을 열고 구독 확인 주석까지 읽음"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"GET /push/user/{user_id}/stream HTTP/1.1\r\nHost: bench\r\n"
+        "Accept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    await reader.readuntil(b": connected\n\n")
+    return reader, writer
+
+
+async def wait_push(reader: asyncio.StreamReader) -> None:
+    """다음 push 이벤트까지 읽음 (하트비트는 건너뜀)"""
+    while b"event: push" not in await reader.readuntil(b"\n\n"):
+        pass
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="SSE 유휴 연결당 메모리 벤치마크")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/15"))
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--connections", type=int, default=2000)
+    parser.add_argument("--deliveries", type=int, default=100)
+    args = parser.parse_args()
+    args.base_url = f"http://127.0.0.1:{args.port}"
+
+    server = spawn_server(args)
+    streams: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+    try:
+        # 첫 연결 경로(import, 라우팅 캐시 등)를 데운 뒤 기준 RSS 측정
+        warmup = await open_stream(args.port, "bench_sse_warmup")
+        await asyncio.sleep(1)
+        before = rss_bytes(server.pid)
+
+        started = time.perf_counter()
+        for start in range(0, args.connections, 200):
+            streams.extend(await asyncio.gather(*(
+                open_stream(args.port, f"bench_sse_{i}")
+                for i in range(start, min(start + 200, args.connections))
+            )))
+        connect_seconds = time.perf_counter() - started
+        await asyncio.sleep(1)
+        after = rss_bytes(server.pid)
+
+        per_connection = (after - before) / args.connections
+        print(f"connections  {args.connections} opened in {connect_seconds:.2f}s")
+        print(
+            f"server RSS   {before / 2**20:.1f} MiB -> {after / 2**20:.1f} MiB "
+            f"({per_connection / 1024:.1f} KiB per idle stream)"
+        )
+
+        latencies: List[float] = []
+        async with httpx.AsyncClient(base_url=args.base_url) as client:
+            for i in range(min(args.deliveries, args.connections)):
+                reader, _ = streams[i]
+                sent = time.perf_counter()
+                response = await client.post(
+                    "/push", json={"user_id": f"bench_sse_{i}", "message": "bench"}
+                )
+                response.raise_for_status()
+                await asyncio.wait_for(wait_push(reader), timeout=5)
+                latencies.append(time.perf_counter() - sent)
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+        print(f"delivery     POST /push -> SSE event p50 {p50:.2f}ms  p99 {p99:.2f}ms")
+        warmup[1].close()
+    finally:
+        for _, writer in streams:
+            writer.close()
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
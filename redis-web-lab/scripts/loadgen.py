@@ -0,0 +1,306 @@
+"""푸시 API 부하 생성기
+
+지정한 동시성과 요청 비율(mix)로 푸시 API를 호출해 엔드포인트별 처리량과
+p50/p95/p99 지연 시간을 출력하고, 버전 간 비교를 위해 결과를 JSON으로 저장합니다.
+get 요청은 최근 생성된 uuid(최대 10,000개) 중 --push-ttl(서버의 PUSH_TTL_SECONDS)이 지나지
+않은 것만 고릅니다. mix에 create가 없어 살아 있는 uuid가 없으면 마지막 uuid를 조회하므로
+404(오류)로 집계됩니다.
+
+    # 이미 떠 있는 서버 대상
+    poetry run python -m scripts.loadgen --duration 30 --concurrency 64 --output results/v1.json
+
+    # uvicorn을 직접 띄워서 측정하고 이전 결과와 비교
+    poetry run python -m scripts.loadgen --spawn-server --workers 4 \\
+        --mix create=4,user_list=2,topic_list=1,get=2 --compare results/v1.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+ENDPOINTS = ("create", "user_list", "topic_list", "get")
+# get 요청에 쓸 최근 생성 uuid 수
+RECENT_PUSH_UUIDS = 10000
+# 조회 도중 만료되지 않도록 TTL보다 이만큼(초) 먼저 후보에서 제외
+PUSH_TTL_MARGIN_SECONDS = 1.0
+
+
+@dataclass
+class EndpointStats:
+    """엔드포인트별 측정값"""
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, elapsed: float, status_code: Optional[int]) -> None:
+        """요청 한 건 기록 (status_code가 None이면 연결 오류)"""
+        code = str(status_code) if status_code is not None else "error"
+        self.status_codes[code] = self.status_codes.get(code, 0) + 1
+        if status_code is None or status_code >= 400:
+            self.errors += 1
+        else:
+            self.latencies.append(elapsed)
+
+    def summary(self, duration: float) -> Dict[str, object]:
+        """처리량/지연 시간 요약 (지연 시간은 밀리초)"""
+        latencies = sorted(self.latencies)
+        return {
+            "requests": len(latencies) + self.errors,
+            "errors": self.errors,
+            "throughput_rps": round(len(latencies) / duration, 1) if duration else 0.0,
+            "p50_ms": _percentile(latencies, 50),
+            "p95_ms": _percentile(latencies, 95),
+            "p99_ms": _percentile(latencies, 99),
+            "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+            "status_codes": self.status_codes,
+        }
+
+
+def _percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """정렬된 값의 백분위수 (nearest-rank, 밀리초)"""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return round(sorted_values[rank] * 1000, 2)
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """'create=3,get=1' 형식의 요청 비율 파싱"""
+    mix: Dict[str, int] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint {name!r} (choose from {ENDPOINTS})")
+        mix[name] = int(weight or 1)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("mix must have at least one positive weight")
+    return mix
+
+
+class LoadGenerator:
+    """동시성 제한 하에 요청 비율에 맞춰 API를 호출하는 부하 생성기"""
+
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace):
+        self._client = client
+        self._args = args
+        self._names = list(args.mix)
+        self._weights = [args.mix[name] for name in self._names]
+        self._message = "m" * args.message_size
+        # (생성 시각 monotonic, uuid), 오래된 순
+        self._push_uuids: Deque[Tuple[float, str]] = deque(maxlen=RECENT_PUSH_UUIDS)
+        self.stats: Dict[str, EndpointStats] = {name: EndpointStats() for name in self._names}
+
+    async def seed(self) -> None:
+        """조회 요청이 빈 결과만 받지 않도록 사용자/토픽별로 미리 생성"""
+        for index in range(max(self._args.users, self._args.topics)):
+            response = await self._client.post("/push", json=self._payload(index))
+            response.raise_for_status()
+            self._remember(response.json()["push_uuid"])
+
+    async def run(self, duration: float, total_requests: Optional[int]) -> float:
+        """duration초 동안(또는 total_requests건) 부하를 걸고 실제 소요 시간 반환"""
+        started = time.perf_counter()
+        deadline = started + duration
+        remaining = [total_requests]
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                if remaining[0] is not None:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                await self._request(random.choices(self._names, self._weights)[0])
+
+        await asyncio.gather(*(worker() for _ in range(self._args.concurrency)))
+        return time.perf_counter() - started
+
+    async def _request(self, name: str) -> None:
+        index = random.randrange(max(self._args.users, self._args.topics))
+        started = time.perf_counter()
+        status_code: Optional[int] = None
+        try:
+            if name == "create":
+                response = await self._client.post("/push", json=self._payload(index))
+                if response.status_code < 400:
+                    self._remember(response.json()["push_uuid"])
+            elif name == "user_list":
+                response = await self._client.get(
+                    f"/push/user/{self._user_id(index)}/pushes", params={"limit": self._args.limit}
+                )
+            elif name == "topic_list":
+                response = await self._client.get(
+                    f"/push/topic/{self._topic(index)}/pushes", params={"limit": self._args.limit}
+                )
+            else:
+                response = await self._client.get(f"/push/{self._recent_push_uuid()}")
+            status_code = response.status_code
+        except httpx.HTTPError:
+            pass
+        self.stats[name].record(time.perf_counter() - started, status_code)
+
+    def _remember(self, push_uuid: str) -> None:
+        self._push_uuids.append((time.monotonic(), push_uuid))
+
+    def _recent_push_uuid(self) -> str:
+        """아직 만료되지 않은 uuid 중 하나 (모두 만료되었으면 가장 최근 uuid)"""
+        expires_before = time.monotonic() - self._args.push_ttl + PUSH_TTL_MARGIN_SECONDS
+        while len(self._push_uuids) > 1 and self._push_uuids[0][0] < expires_before:
+            self._push_uuids.popleft()
+        return random.choice(self._push_uuids)[1]
+
+    def _payload(self, index: int) -> Dict[str, str]:
+        return {
+            "user_id": self._user_id(index),
+            "message": self._message,
+            "topic": self._topic(index),
+        }
+
+    def _user_id(self, index: int) -> str:
+        return f"load_user_{index % self._args.users}"
+
+    def _topic(self, index: int) -> str:
+        return f"load_topic_{index % self._args.topics}"
+
+
+def spawn_server(args: argparse.Namespace) -> subprocess.Popen:
+    """uvicorn 서버를 하위 프로세스로 실행하고 /health가 응답할 때까지 대기"""
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(args.port),
+        "--workers", str(args.workers), "--log-level", "warning",
+    ]
+    env = {**os.environ, "REDIS_URL": args.redis_url}
+    # 서버 로그가 결과 출력과 섞이지 않도록 파일로 보냄
+    log_file = open(args.server_log, "ab")
+    process = subprocess.Popen(command, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+    log_file.close()
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{args.base_url}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited before becoming healthy (see {args.server_log})")
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not become healthy within 30s")
+
+
+def print_report(results: Dict[str, Dict[str, object]], baseline: Optional[dict]) -> None:
+    """엔드포인트별 결과 표 출력 (기준 결과가 있으면 변화율 포함)"""
+    print(f"{'endpoint':<12}{'reqs':>9}{'err':>6}{'rps':>10}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, summary in results.items():
+        line = (
+            f"{name:<12}{summary['requests']:>9}{summary['errors']:>6}"
+            f"{summary['throughput_rps']:>10}{_fmt(summary['p50_ms'])}"
+            f"{_fmt(summary['p95_ms'])}{_fmt(summary['p99_ms'])}"
+        )
+        before = (baseline or {}).get("endpoints", {}).get(name)
+        if before and before.get("throughput_rps") and before.get("p99_ms"):
+            rps_change = summary["throughput_rps"] / before["throughput_rps"] - 1
+            p99_change = (summary["p99_ms"] or 0) / before["p99_ms"] - 1
+            line += f"   rps {rps_change:+.1%}  p99 {p99_change:+.1%}"
+        print(line)
+
+
+def _fmt(value: Optional[float]) -> str:
+    return f"{value:>9.2f}" if value is not None else f"{'-':>9}"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="푸시 API 부하 생성기")
+    parser.add_argument("--base-url", default=None, help="기본값: http://127.0.0.1:{port}")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간(초)")
+    parser.add_argument("--requests", type=int, default=None, help="총 요청 수 (duration보다 우선)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("create=1,user_list=1"))
+    parser.add_argument("--users", type=int, default=1000, help="사용자 ID 카디널리티")
+    parser.add_argument("--topics", type=int, default=50, help="토픽 카디널리티")
+    parser.add_argument("--message-size", type=int, default=64)
+    parser.add_argument("--limit", type=int, default=10, help="목록 조회 limit")
+    parser.add_argument(
+        "--push-ttl",
+        type=float,
+        default=float(os.getenv("PUSH_TTL_SECONDS", "60")),
+        help="서버의 PUSH_TTL_SECONDS, get은 이보다 오래된 uuid를 고르지 않음",
+    )
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--label", default=None, help="결과에 남길 버전/설명")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--spawn-server", action="store_true", help="uvicorn을 직접 실행")
+    parser.add_argument("--workers", type=int, default=1, help="--spawn-server 워커 수")
+    parser.add_argument("--server-log", default=os.devnull, help="--spawn-server 로그 경로")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379"))
+    args = parser.parse_args()
+    args.base_url = args.base_url or f"http://127.0.0.1:{args.port}"
+    if args.requests is not None:
+        args.duration = float("inf")
+
+    server = spawn_server(args) if args.spawn_server else None
+    try:
+        limits = httpx.Limits(
+            max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+        )
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+            generator = LoadGenerator(client, args)
+            await generator.seed()
+            elapsed = await generator.run(args.duration, args.requests)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    results = {name: stats.summary(elapsed) for name, stats in generator.stats.items()}
+    report = {
+        "label": args.label,
+        "timestamp": datetime.now().isoformat(),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "config": {
+            "base_url": args.base_url,
+            "duration_seconds": round(elapsed, 3),
+            "concurrency": args.concurrency,
+            "mix": args.mix,
+            "users": args.users,
+            "topics": args.topics,
+            "message_size": args.message_size,
+            "limit": args.limit,
+            "workers": args.workers if args.spawn_server else None,
+        },
+        "endpoints": results,
+        "total_throughput_rps": round(
+            sum(summary["throughput_rps"] for summary in results.values()), 1
+        ),
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+    print(f"total {report['total_throughput_rps']} req/s over {elapsed:.1f}s")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"saved {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
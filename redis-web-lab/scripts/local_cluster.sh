@@ -0,0 +1,83 @@
+#!/bin/sh
+
+# 로컬 Redis Cluster(마스터 3개, 복제본 없음) 실행 스크립트
+#
+# 사용법:
+#   scripts/local_cluster.sh start   # 백그라운드로 노드 실행 후 클러스터 구성
+#   scripts/local_cluster.sh stop    # 노드 종료 및 데이터 삭제
+#   scripts/local_cluster.sh run     # 포그라운드 실행 (docker-compose cluster 프로필에서 사용)
+#
+# 환경 변수: CLUSTER_PORTS (기본값: "7000 7001 7002"), CLUSTER_DATA_DIR, CLUSTER_HOST
+# 연결: REDIS_URL=redis://127.0.0.1:7000 REDIS_CLUSTER=true
+
+set -e
+
+PORTS="${CLUSTER_PORTS:-7000 7001 7002}"
+DATA_DIR="${CLUSTER_DATA_DIR:-/tmp/redis-web-lab-cluster}"
+HOST="${CLUSTER_HOST:-127.0.0.1}"
+
+start_nodes() {
+    daemonize="$1"
+    for port in $PORTS; do
+        mkdir -p "$DATA_DIR/$port"
+        redis-server \
+            --port "$port" \
+            --bind 0.0.0.0 \
+            --protected-mode no \
+            --cluster-enabled yes \
+            --cluster-config-file "$DATA_DIR/$port/nodes.conf" \
+            --cluster-node-timeout 5000 \
+            --cluster-announce-ip "$HOST" \
+            --dir "$DATA_DIR/$port" \
+            --appendonly no \
+            --save "" \
+            --daemonize "$daemonize" &
+    done
+    for port in $PORTS; do
+        until redis-cli -p "$port" ping > /dev/null 2>&1; do
+            sleep 0.1
+        done
+    done
+}
+
+create_cluster() {
+    first_port="${PORTS%% *}"
+    if redis-cli -p "$first_port" cluster info | grep -q "cluster_state:ok"; then
+        echo "클러스터가 이미 구성되어 있습니다"
+        return
+    fi
+    nodes=""
+    for port in $PORTS; do
+        nodes="$nodes $HOST:$port"
+    done
+    # shellcheck disable=SC2086
+    redis-cli --cluster create $nodes --cluster-replicas 0 --cluster-yes
+    until redis-cli -p "$first_port" cluster info | grep -q "cluster_state:ok"; do
+        sleep 0.1
+    done
+    echo "Redis Cluster 준비 완료: redis://$HOST:$first_port"
+}
+
+case "${1:-start}" in
+    start)
+        start_nodes yes
+        wait
+        create_cluster
+        ;;
+    run)
+        start_nodes no
+        create_cluster
+        wait
+        ;;
+    stop)
+        for port in $PORTS; do
+            redis-cli -p "$port" shutdown nosave > /dev/null 2>&1 || true
+        done
+        rm -rf "$DATA_DIR"
+        echo "Redis Cluster 종료"
+        ;;
+    *)
+        echo "사용법: $0 [start|stop|run]"
+        exit 1
+        ;;
+esac
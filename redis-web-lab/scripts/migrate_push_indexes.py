@@ -0,0 +1,130 @@
+"""Set 기반 푸시 인덱스를 Sorted Set으로 마이그레이션
+
+`user_pushes:*` / `topic_pushes:*` 키 중 아직 Set 타입인 것을 찾아 각 멤버의
+`push:{uuid}` Hash에 기록된 created_at을 score로 하는 Sorted Set으로 교체합니다.
+이미 만료된 Hash를 가리키는 멤버는 옮기지 않으며, 기존 키의 TTL은 유지됩니다.
+
+Sorted Set은 임시 키에 만든 뒤 원래 키를 WATCH한 상태에서 MULTI/EXEC로 RENAME합니다.
+복사하는 동안 SADD/SREM으로 바뀐 멤버는 교체 직전에 다시 맞추고, 그 사이 또 바뀌면 교체를
+다시 시도하므로 동시에 들어온 쓰기를 잃지 않습니다.
+
+키 타입이 바뀌는 시점 때문에 이전 버전(SADD)과 새 버전(ZADD) 서버가 같은 키에 쓰면
+한쪽이 WRONGTYPE으로 실패합니다. 이전 버전 서버를 멈춘 상태(쓰기 중지)에서 실행하고 끝난
+뒤 새 버전을 배포하세요.
+
+    poetry run python -m scripts.migrate_push_indexes --dry-run
+    poetry run python -m scripts.migrate_push_indexes
+"""
+import argparse
+import asyncio
+import os
+from datetime import datetime
+from typing import Dict, List, Set
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from app.infrastructure.database import RedisConnection
+
+INDEX_PATTERNS = ("user_pushes:*", "topic_pushes:*")
+BATCH_SIZE = 500
+# 교체 중 다른 쓰기와 겹쳤을 때 다시 시도하는 횟수
+SWAP_ATTEMPTS = 10
+
+
+async def _scores_for(client: Redis, push_uuids: List[str]) -> Dict[str, float]:
+    """멤버별 created_at epoch 조회 (만료된 멤버는 제외)"""
+    async with client.pipeline(transaction=False) as pipe:
+        for push_uuid in push_uuids:
+            pipe.hget(f"push:{push_uuid}", "created_at")
+        created_ats = await pipe.execute()
+    return {
+        push_uuid: datetime.fromisoformat(created_at).timestamp()
+        for push_uuid, created_at in zip(push_uuids, created_ats, strict=True)
+        if created_at
+    }
+
+
+async def migrate_key(client: Redis, key: str, dry_run: bool) -> int:
+    """Set 인덱스 하나를 Sorted Set으로 교체하고 옮긴 멤버 수 반환"""
+    tmp_key = f"{key}:zset_migration"
+    seen: Set[str] = set()
+    migrated = 0
+
+    async def _copy(push_uuids: List[str]) -> None:
+        nonlocal migrated
+        seen.update(push_uuids)
+        for start in range(0, len(push_uuids), BATCH_SIZE):
+            scores = await _scores_for(client, push_uuids[start:start + BATCH_SIZE])
+            if scores and not dry_run:
+                await client.zadd(tmp_key, scores)
+            migrated += len(scores)
+
+    await client.delete(tmp_key)
+    batch: List[str] = []
+    async for push_uuid in client.sscan_iter(key, count=BATCH_SIZE):
+        batch.append(push_uuid)
+        if len(batch) >= BATCH_SIZE:
+            await _copy(batch)
+            batch = []
+    await _copy(batch)
+
+    if dry_run:
+        return migrated
+
+    async with client.pipeline(transaction=True) as pipe:
+        for _ in range(SWAP_ATTEMPTS):
+            try:
+                # 복사하는 동안 추가된 멤버를 옮긴 뒤, 그 사이 키가 바뀌지 않았을 때만 교체
+                await pipe.watch(key)
+                if await pipe.type(key) != "set":
+                    raise RuntimeError(f"{key} is no longer a set")
+                members = await pipe.smembers(key)
+                await _copy([m for m in members if m not in seen])
+                removed = [m for m in seen if m not in members]
+                if removed:
+                    await client.zrem(tmp_key, *removed)
+                    seen.difference_update(removed)
+                migrated = await client.zcard(tmp_key)
+                ttl_ms = await pipe.pttl(key)
+                pipe.multi()
+                if migrated:
+                    pipe.rename(tmp_key, key)
+                    if ttl_ms > 0:
+                        pipe.pexpire(key, ttl_ms)
+                else:
+                    pipe.delete(key)
+                await pipe.execute()
+                return migrated
+            except WatchError:
+                continue
+    await client.delete(tmp_key)
+    raise RuntimeError(f"{key} kept changing during migration, retry with writers stopped")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="푸시 인덱스 Set -> Sorted Set 마이그레이션")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379"))
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 대상만 출력")
+    args = parser.parse_args()
+
+    connection = RedisConnection(redis_url=args.redis_url)
+    await connection.connect()
+    client = connection.client
+
+    try:
+        keys = 0
+        members = 0
+        for pattern in INDEX_PATTERNS:
+            async for key in client.scan_iter(match=pattern, count=BATCH_SIZE, _type="set"):
+                moved = await migrate_key(client, key, args.dry_run)
+                keys += 1
+                members += moved
+                print(f"{'[dry-run] ' if args.dry_run else ''}{key}: {moved} members")
+        print(f"migrated {keys} keys, {members} members")
+    finally:
+        await connection.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,6 +3,11 @@ import pytest_asyncio
 from httpx import AsyncClient
 import redis.asyncio as redis
 from app.main import app
+from app.application.services import PushNotificationService
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import RedisPushNotificationRepository
+from app.presentation.api.health_router import get_redis_connection
+from app.presentation.api.push_router import get_push_notification_service
 from app.redis_service import RedisService
 import os
 
@@ -17,34 +22,44 @@ async def test_redis_service():
     service = RedisService(redis_url=TEST_REDIS_URL)
     await service.connect()
     yield service
-    
+
+    # 테스트 데이터 정리
+    await service.connection.client.flushdb()
+    await service.disconnect()
+
+
+@pytest_asyncio.fixture
+async def test_redis_connection():
+    """테스트용 Redis 연결 픽스처"""
+    connection = RedisConnection(redis_url=TEST_REDIS_URL)
+    await connection.connect()
+    yield connection
+
     # 테스트 데이터 정리
-    if service._redis:
-        await service._redis.flushdb()
-        await service.disconnect()
+    await connection.client.flushdb()
+    await connection.disconnect()
 
 
 @pytest_asyncio.fixture
-async def async_client():
+async def push_repository(test_redis_connection: RedisConnection):
+    """테스트용 푸시 알림 저장소 픽스처"""
+    return RedisPushNotificationRepository(test_redis_connection)
+
+
+@pytest_asyncio.fixture
+async def async_client(test_redis_connection: RedisConnection):
     """비동기 HTTP 클라이언트 픽스처"""
-    # 테스트용 Redis URL로 오버라이드
-    app.dependency_overrides = {}
-    
-    async def override_redis_service():
-        service = RedisService(redis_url=TEST_REDIS_URL)
-        await service.connect()
-        return service
-    
-    from app.main import get_redis_service
-    app.dependency_overrides[get_redis_service] = override_redis_service
-    
+    # 테스트용 Redis 연결로 오버라이드
+    original_overrides = dict(app.dependency_overrides)
+    push_service = PushNotificationService(
+        RedisPushNotificationRepository(test_redis_connection)
+    )
+    app.dependency_overrides[get_redis_connection] = lambda: test_redis_connection
+    app.dependency_overrides[get_push_notification_service] = lambda: push_service
+
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
-    
+
     # 클리너업
-    redis_service = await override_redis_service()
-    if redis_service._redis:
-        await redis_service._redis.flushdb()
-        await redis_service.disconnect()
-    
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(original_overrides)
@@ -1,7 +1,15 @@
+import importlib
 import pytest
 from httpx import AsyncClient
 import json
 from uuid import UUID
+from app.application.services import PushNotificationService
+from app.main import app
+from app.presentation.api.push_router import (
+    BatchPushLimits,
+    get_batch_push_limits,
+    get_fast_serialization,
+)
 
 
 class TestFastAPIEndpoints:
@@ -105,12 +113,13 @@ class TestFastAPIEndpoints:
             await async_client.post("/push", json=push_data)
         
         # 사용자별 조회
-        response = await async_client.get(f"/user/{user_id}/pushes")
+        response = await async_client.get(f"/push/user/{user_id}/pushes")
         assert response.status_code == 200
         
         data = response.json()
-        assert len(data) == 3
-        assert all(push["user_id"] == user_id for push in data)
+        assert len(data["items"]) == 3
+        assert all(push["user_id"] == user_id for push in data["items"])
+        assert data["next_cursor"] is None
 
     @pytest.mark.asyncio
     async def test_get_topic_pushes(self, async_client: AsyncClient):
@@ -127,12 +136,31 @@ class TestFastAPIEndpoints:
             await async_client.post("/push", json=push_data)
         
         # 토픽별 조회
-        response = await async_client.get(f"/topic/{topic}/pushes")
+        response = await async_client.get(f"/push/topic/{topic}/pushes")
         assert response.status_code == 200
         
         data = response.json()
-        assert len(data) == 2
-        assert all(push["topic"] == topic for push in data)
+        assert len(data["items"]) == 2
+        assert all(push["topic"] == topic for push in data["items"])
+
+    @pytest.mark.asyncio
+    async def test_fast_serialization_matches_default_response(self, async_client: AsyncClient):
+        """빠른 직렬화 목록 응답이 기본 응답과 같은 JSON인지 테스트"""
+        for i in range(3):
+            await async_client.post(
+                "/push", json={"user_id": "fast_user", "message": f"빠른 {i}", "topic": "fast"}
+            )
+
+        urls = ["/push/user/fast_user/pushes?limit=2", "/push/topic/fast/pushes?limit=2"]
+        default = [await async_client.get(url) for url in urls]
+        app.dependency_overrides[get_fast_serialization] = lambda: True
+        fast = [await async_client.get(url) for url in urls]
+
+        for expected, response in zip(default, fast, strict=True):
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            assert response.json() == expected.json()
+            assert "serialize;dur=" in response.headers["server-timing"]
 
     @pytest.mark.asyncio
     async def test_delete_push(self, async_client: AsyncClient):
@@ -187,8 +215,197 @@ class TestFastAPIEndpoints:
             await async_client.post("/push", json=push_data)
         
         # 3개만 조회
-        response = await async_client.get(f"/user/{user_id}/pushes?limit=3")
+        response = await async_client.get(f"/push/user/{user_id}/pushes?limit=3")
         assert response.status_code == 200
         
         data = response.json()
-        assert len(data) == 3
\ No newline at end of file
+        assert len(data["items"]) == 3
+        assert data["next_cursor"] is not None
+
+    @pytest.mark.asyncio
+    async def test_get_user_pushes_cursor_pagination(self, async_client: AsyncClient):
+        """커서로 사용자 푸시 전체를 페이지 단위로 조회하는 테스트"""
+        user_id = "test_user_cursor"
+
+        created = []
+        for i in range(5):
+            push_data = {
+                "user_id": user_id,
+                "message": f"커서 테스트 푸시 {i}"
+            }
+            response = await async_client.post("/push", json=push_data)
+            created.append(response.json()["push_uuid"])
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await async_client.get(f"/push/user/{user_id}/pushes", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(push["push_uuid"] for push in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        # 최신순으로 중복/누락 없이 모두 조회되어야 함
+        assert seen == list(reversed(created))
+
+    @pytest.mark.asyncio
+    async def test_get_user_pushes_invalid_cursor(self, async_client: AsyncClient):
+        """잘못된 커서 조회 테스트"""
+        response = await async_client.get("/push/user/anyone/pushes?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_create_push_batch_json_array(self, async_client: AsyncClient):
+        """JSON 배열로 푸시 일괄 생성 테스트 (항목별 결과)"""
+        items = [
+            {"user_id": "batch_user", "message": "일괄 푸시 0"},
+            {"message": "user_id 없음"},
+            {"user_id": "batch_user", "message": "일괄 푸시 2", "topic": "batch_topic"},
+        ]
+
+        response = await async_client.post("/push/batch", json=items)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 3
+        assert data["succeeded"] == 2
+        assert data["failed"] == 1
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+        assert data["results"][1]["success"] is False
+        assert "user_id" in data["results"][1]["error"]
+
+        # 생성된 푸시는 조회 가능해야 함
+        push_uuid = data["results"][2]["push_uuid"]
+        get_response = await async_client.get(f"/push/{push_uuid}")
+        assert get_response.json()["topic"] == "batch_topic"
+
+    @pytest.mark.asyncio
+    async def test_create_push_batch_ndjson(self, async_client: AsyncClient):
+        """NDJSON 스트림으로 푸시 일괄 생성 테스트"""
+        lines = [
+            json.dumps({"user_id": "ndjson_user", "message": f"스트림 푸시 {i}"})
+            for i in range(5)
+        ]
+        body = ("\n".join(lines) + "\n").encode()
+
+        response = await async_client.post(
+            "/push/batch",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.json()["succeeded"] == 5
+
+        list_response = await async_client.get("/push/user/ndjson_user/pushes")
+        assert len(list_response.json()["items"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_create_push_batch_rejects_non_array(self, async_client: AsyncClient):
+        """배열이 아닌 JSON 본문 거부 테스트"""
+        response = await async_client.post("/push/batch", json={"user_id": "x", "message": "y"})
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_create_push_batch_limits(self, async_client: AsyncClient):
+        """항목 수/본문 크기 상한을 넘으면 저장 전에 413으로 거절하는지 테스트"""
+        app.dependency_overrides[get_batch_push_limits] = lambda: BatchPushLimits(
+            max_items=2, max_bytes=1024
+        )
+        items = [{"user_id": "limit_user", "message": f"상한 {i}"} for i in range(3)]
+        response = await async_client.post("/push/batch", json=items)
+        assert response.status_code == 413
+
+        response = await async_client.post(
+            "/push/batch", json=[{"user_id": "limit_user", "message": "x" * 2000}]
+        )
+        assert response.status_code == 413
+
+        list_response = await async_client.get("/push/user/limit_user/pushes")
+        assert list_response.json()["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_create_push_batch_ndjson_limit_returns_partial_results(
+        self, async_client: AsyncClient
+    ):
+        """NDJSON 스트림이 도중에 상한을 넘으면 처리한 항목 결과와 함께 413으로 응답하는지 테스트"""
+        app.dependency_overrides[get_batch_push_limits] = lambda: BatchPushLimits(max_items=3)
+
+        async def body():
+            for i in range(5):
+                yield (json.dumps({"user_id": "partial_user", "message": f"{i}"}) + "\n").encode()
+
+        response = await async_client.post(
+            "/push/batch", content=body(), headers={"Content-Type": "application/x-ndjson"}
+        )
+        assert response.status_code == 413
+        data = response.json()
+        assert data["total"] == data["succeeded"] == 3
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+        assert "3" in data["error"]
+
+        list_response = await async_client.get("/push/user/partial_user/pushes")
+        assert len(list_response.json()["items"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_create_push_batch_storage_error_returns_partial_results(
+        self, async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """저장 오류로 중단되면 저장된 항목과 저장 여부를 모르는 항목을 구분해 응답하는지 테스트"""
+        # 패키지가 라우터 객체를 같은 이름으로 내보내므로 모듈은 직접 가져옴
+        push_router = importlib.import_module("app.presentation.api.push_router")
+        monkeypatch.setattr(push_router, "_BATCH_CHUNK_SIZE", 2)
+        original = PushNotificationService.create_push_notifications
+        calls = 0
+
+        async def flaky(self, items):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise ConnectionError("redis down")
+            return await original(self, items)
+
+        monkeypatch.setattr(PushNotificationService, "create_push_notifications", flaky)
+        items = [{"user_id": "flaky_user", "message": f"{i}"} for i in range(5)]
+        response = await async_client.post("/push/batch", json=items)
+
+        assert response.status_code == 500
+        data = response.json()
+        assert data["error"]
+        assert [r["success"] for r in data["results"]] == [True, True, False, False]
+        assert data["results"][2]["error"] == "저장 여부를 확인할 수 없습니다"
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self, async_client: AsyncClient):
+        """Prometheus 메트릭 엔드포인트 테스트"""
+        response = await async_client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+
+    @pytest.mark.asyncio
+    async def test_server_timing_and_request_metrics(self, async_client: AsyncClient):
+        """요청별 Server-Timing 헤더와 Redis 명령 히스토그램 테스트"""
+        create = await async_client.post(
+            "/push", json={"user_id": "timing_user", "message": "타이밍"}
+        )
+        assert create.status_code == 200
+        server_timing = create.headers["server-timing"]
+        assert "total;dur=" in server_timing
+        # 저장은 트랜잭션 파이프라인 한 번의 왕복
+        assert 'desc="6 cmds/1 rtt"' in server_timing
+
+        push_uuid = create.json()["push_uuid"]
+        response = await async_client.get(f"/push/{push_uuid}")
+        assert 'desc="1 cmds/1 rtt"' in response.headers["server-timing"]
+        assert "serialize;dur=" in response.headers["server-timing"]
+
+        metrics = (await async_client.get("/metrics")).text
+        assert 'http_request_redis_commands_count{route="/push/{push_uuid}"}' in metrics
+        assert (
+            'http_request_duration_seconds_count{method="POST",route="/push",status="200"}'
+            in metrics
+        )
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import httpx
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from app.infrastructure.database import RedisConnection
+from app.presentation.middleware import DrainController, DrainMiddleware
+
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL", "redis://localhost:6379/1")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _spawn_server(port: int) -> subprocess.Popen:
+    """드레인 진입점으로 서버를 띄우고 /health가 응답할 때까지 대기"""
+    env = {
+        **os.environ,
+        "REDIS_URL": TEST_REDIS_URL,
+        "PUSH_TTL_SECONDS": "600",
+        "PUSH_REALTIME_ENABLED": "true",
+        "PUSH_INDEX_SWEEP_INTERVAL_SECONDS": "0",
+        "PUSH_DRAIN_TIMEOUT_SECONDS": "30",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "app.server", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    process.kill()
+    pytest.fail("서버가 시작되지 않음")
+
+
+class TestGracefulShutdown:
+    """종료 드레인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_draining_rejects_new_requests(self):
+        """드레인 중 새 요청은 503 + Connection: close, 처리 중인 요청은 끝까지 처리되는지 테스트"""
+        controller = DrainController()
+        app = FastAPI()
+        app.add_middleware(DrainMiddleware, controller=controller)
+        release = asyncio.Event()
+
+        @app.get("/slow")
+        async def slow():
+            await release.wait()
+            return {"ok": True}
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            in_flight = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.05)
+            assert controller.in_flight == 1
+
+            controller.begin()
+            rejected = await client.get("/slow")
+            assert rejected.status_code == 503
+            assert rejected.headers["connection"] == "close"
+            assert await controller.wait_idle(0.05) is False
+
+            release.set()
+            assert (await in_flight).status_code == 200
+            assert await controller.wait_idle(1) is True
+
+    @pytest.mark.asyncio
+    async def test_sigterm_under_load_loses_no_pushes(
+        self, test_redis_connection: RedisConnection
+    ):
+        """부하 중 SIGTERM을 받아도 200으로 응답한 푸시와 진행 중인 발송이 모두 저장되는지 테스트"""
+        port = _free_port()
+        process = _spawn_server(port)
+        base_url = f"http://127.0.0.1:{port}"
+        client = test_redis_connection.client
+        try:
+            async with httpx.AsyncClient(base_url=base_url, timeout=30) as http:
+                await http.post(
+                    "/push/topic/drain_topic/subscribers",
+                    json={"user_ids": [f"drain_sub_{i}" for i in range(20000)]},
+                )
+                job = (await http.post(
+                    "/push/topic/drain_topic/broadcast", json={"message": "드레인"}
+                )).json()
+
+                stream_closed = asyncio.Event()
+
+                async def watch_stream() -> None:
+                    async with http.stream("GET", "/push/user/drain_stream/stream") as response:
+                        async for _ in response.aiter_text():
+                            pass
+                    stream_closed.set()
+
+                stream_task = asyncio.create_task(watch_stream())
+
+                acknowledged = []
+                statuses = []
+
+                async def load(worker: int) -> None:
+                    for i in range(100000):
+                        try:
+                            response = await http.post("/push", json={
+                                "user_id": f"drain_user_{worker}", "message": f"부하 {i}"
+                            })
+                        except httpx.HTTPError:
+                            return
+                        statuses.append(response.status_code)
+                        if response.status_code == 200:
+                            acknowledged.append(response.json()["push_uuid"])
+                        elif response.status_code == 503:
+                            return
+
+                workers = [asyncio.create_task(load(worker)) for worker in range(20)]
+                await asyncio.sleep(1.0)
+                process.send_signal(signal.SIGTERM)
+                await asyncio.gather(*workers)
+                await asyncio.wait_for(stream_task, timeout=10)
+                assert stream_closed.is_set()
+
+            assert await asyncio.to_thread(process.wait, 60) == 0
+        finally:
+            if process.poll() is None:
+                process.kill()
+
+        assert acknowledged
+        assert set(statuses) <= {200, 503}
+        async with client.pipeline(transaction=False) as pipe:
+            for push_uuid in acknowledged:
+                pipe.exists(f"push:{push_uuid}")
+            assert all(await pipe.execute())
+
+        stored = await client.hgetall(f"broadcast_job:{job['job_id']}")
+        assert stored["status"] == "completed"
+        assert (stored["total"], stored["succeeded"]) == ("20000", "20000")
@@ -0,0 +1,64 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from app.infrastructure.database import RedisConnection
+from scripts import migrate_push_indexes
+from scripts.migrate_push_indexes import migrate_key
+
+
+async def _save_legacy_record(client, created_at: datetime) -> str:
+    """이전 버전 형식의 기록 Hash 저장 (uuid 반환)"""
+    push_uuid = str(uuid4())
+    await client.hset(f"push:{push_uuid}", mapping={"created_at": created_at.isoformat()})
+    return push_uuid
+
+
+class TestMigratePushIndexes:
+    """Set 인덱스 → Sorted Set 마이그레이션 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_converts_set_index(self, test_redis_connection: RedisConnection):
+        """created_at을 score로 옮기고 만료된 멤버는 버리며 TTL을 유지하는지 테스트"""
+        client = test_redis_connection.client
+        now = datetime.now()
+        live = [await _save_legacy_record(client, now - timedelta(minutes=i)) for i in range(3)]
+        await client.sadd("user_pushes:legacy", *live, str(uuid4()))
+        await client.expire("user_pushes:legacy", 600)
+
+        assert await migrate_key(client, "user_pushes:legacy", dry_run=True) == 3
+        assert await client.type("user_pushes:legacy") == "set"
+
+        assert await migrate_key(client, "user_pushes:legacy", dry_run=False) == 3
+        assert await client.type("user_pushes:legacy") == "zset"
+        assert await client.zrevrange("user_pushes:legacy", 0, -1) == live
+        assert 0 < await client.ttl("user_pushes:legacy") <= 600
+        assert await client.exists("user_pushes:legacy:zset_migration") == 0
+
+    @pytest.mark.asyncio
+    async def test_keeps_members_written_during_migration(
+        self, test_redis_connection: RedisConnection, monkeypatch: pytest.MonkeyPatch
+    ):
+        """복사 중 이전 버전 서버가 추가/제거한 멤버가 교체 결과에 반영되는지 테스트"""
+        client = test_redis_connection.client
+        now = datetime.now()
+        first, second = [await _save_legacy_record(client, now) for _ in range(2)]
+        late = await _save_legacy_record(client, now + timedelta(seconds=1))
+        await client.sadd("topic_pushes:legacy", first, second)
+
+        scores_for = migrate_push_indexes._scores_for
+        writes = iter([
+            lambda: client.sadd("topic_pushes:legacy", late),
+            lambda: client.srem("topic_pushes:legacy", second),
+        ])
+
+        async def racing_scores_for(redis_client, push_uuids):
+            # 복사 단계마다 쓰기 하나를 끼워 넣음 (두 번째는 WATCH 이후라 교체를 다시 시도)
+            write = next(writes, None)
+            if write is not None:
+                await write()
+            return await scores_for(redis_client, push_uuids)
+
+        monkeypatch.setattr(migrate_push_indexes, "_scores_for", racing_scores_for)
+
+        assert await migrate_key(client, "topic_pushes:legacy", dry_run=False) == 2
+        assert await client.zrevrange("topic_pushes:legacy", 0, -1) == [late, first]
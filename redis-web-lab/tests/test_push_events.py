@@ -0,0 +1,101 @@
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from app.application.services import PushNotificationService
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.messaging import PushEventHub, RedisPushEventPublisher
+from app.infrastructure.repositories import RedisPushNotificationRepository
+from app.presentation.api.push_router import _iter_push_events
+
+
+@pytest_asyncio.fixture
+async def event_hub(test_redis_connection: RedisConnection):
+    """테스트용 새 푸시 이벤트 허브 픽스처"""
+    hub = PushEventHub(test_redis_connection, queue_size=2)
+    await hub.start()
+    yield hub
+    await hub.stop()
+
+
+@pytest_asyncio.fixture
+async def realtime_push_service(test_redis_connection: RedisConnection):
+    """저장 후 새 푸시를 발행하는 서비스 픽스처"""
+    return PushNotificationService(
+        RedisPushNotificationRepository(test_redis_connection),
+        event_publisher=RedisPushEventPublisher(test_redis_connection),
+    )
+
+
+class TestPushEvents:
+    """새 푸시 실시간 전달 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_streams_share_one_channel_subscription(
+        self,
+        event_hub: PushEventHub,
+        realtime_push_service: PushNotificationService,
+        test_redis_connection: RedisConnection,
+    ):
+        """같은 사용자의 스트림들이 채널 하나를 공유하고 각자 새 푸시를 받는지 테스트"""
+        client = test_redis_connection.client
+        async with event_hub.listen("live_user") as first, event_hub.listen("live_user") as second:
+            async with event_hub.listen("other_user") as other:
+                assert await client.pubsub_numsub("push_events:live_user") == [
+                    ("push_events:live_user", 1)
+                ]
+                entity = await realtime_push_service.create_push_notification(
+                    "live_user", "실시간", topic="live"
+                )
+                for queue in (first, second):
+                    payload = json.loads(await asyncio.wait_for(queue.get(), timeout=1))
+                    assert payload["push_uuid"] == str(entity.push_uuid)
+                    assert (payload["message"], payload["topic"]) == ("실시간", "live")
+                assert other.empty()
+
+        # 마지막 스트림이 닫히면 구독 해제
+        for _ in range(20):
+            if await client.pubsub_numsub("push_events:live_user") == [
+                ("push_events:live_user", 0)
+            ]:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("채널 구독이 해제되지 않음")
+
+    @pytest.mark.asyncio
+    async def test_slow_stream_drops_overflow(
+        self, event_hub: PushEventHub, realtime_push_service: PushNotificationService
+    ):
+        """큐가 가득 찬 스트림은 넘치는 이벤트를 버리고 일괄 생성분도 발행되는지 테스트"""
+        async with event_hub.listen("slow_user") as queue:
+            results = await realtime_push_service.create_push_notifications(
+                [("slow_user", f"일괄 {i}", None) for i in range(5)]
+            )
+            assert all(result.succeeded for result in results)
+            await asyncio.sleep(0.1)
+            assert queue.qsize() == 2
+            assert json.loads(queue.get_nowait())["message"] == "일괄 0"
+
+    @pytest.mark.asyncio
+    async def test_sse_stream_formats_events(
+        self, event_hub: PushEventHub, realtime_push_service: PushNotificationService
+    ):
+        """SSE 스트림이 구독 확인, 새 푸시, 하트비트 순으로 이벤트를 보내는지 테스트"""
+        stream = _iter_push_events(event_hub, "sse_user", heartbeat_seconds=0.05)
+        try:
+            assert await stream.__anext__() == "retry: 3000\n: connected\n\n"
+            entity = await realtime_push_service.create_push_notification("sse_user", "스트림")
+            event = await asyncio.wait_for(stream.__anext__(), timeout=1)
+            assert event.startswith("event: push\ndata: {")
+            assert json.loads(event.split("data: ", 1)[1])["push_uuid"] == str(entity.push_uuid)
+            assert await stream.__anext__() == ": keepalive\n\n"
+        finally:
+            await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_endpoint_disabled_by_default(self, async_client: AsyncClient):
+        """실시간 전달이 꺼져 있으면 503을 반환하는지 테스트"""
+        response = await async_client.get("/push/user/anyone/stream")
+        assert response.status_code == 503
@@ -0,0 +1,405 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from redis.crc import key_slot
+from app.application.services import PushNotificationService
+from app.domain.entities import PushNotification
+from app.infrastructure.codecs import MsgpackPushRecordCodec, get_push_record_codec
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import (
+    CachedPushNotificationRepository,
+    RedisPushNotificationRepository,
+    RedisTrackingInvalidator,
+)
+from app.infrastructure.storage import PushIndexSweeper, RedisPushRecordStore
+
+
+class TestRedisPushNotificationRepository:
+    """Redis 푸시 알림 저장소 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_save_writes_hash_indexes_and_ttl(
+        self,
+        push_repository: RedisPushNotificationRepository,
+        test_redis_connection: RedisConnection,
+    ):
+        """저장 시 Hash, 인덱스, TTL이 함께 기록되는지 테스트"""
+        entity = PushNotification.create_new(
+            user_id="repo_user", message="저장 테스트", topic="repo_topic"
+        )
+
+        success = await push_repository.save(entity)
+        assert success is True
+
+        client = test_redis_connection.client
+        push_key = f"push:{entity.push_uuid}"
+        assert await client.hget(push_key, "message") == "저장 테스트"
+        for key in (push_key, "user_pushes:repo_user", "topic_pushes:repo_topic"):
+            ttl = await client.ttl(key)
+            assert 0 < ttl <= 60
+
+        retrieved = await push_repository.find_by_id(entity.push_uuid)
+        assert retrieved == entity
+
+    @pytest.mark.asyncio
+    async def test_find_by_user_id_returns_newest_first(
+        self, push_repository: RedisPushNotificationRepository
+    ):
+        """사용자별 목록이 최신순 limit개를 반환하는지 테스트"""
+        base = datetime.now()
+        entities = []
+        for i in range(5):
+            entity = PushNotification.create_new(user_id="order_user", message=f"푸시 {i}")
+            entity.created_at = base + timedelta(seconds=i)
+            entities.append(entity)
+
+        # 생성 순서와 무관하게 created_at 기준으로 정렬되어야 함
+        for entity in reversed(entities):
+            await push_repository.save(entity)
+
+        result = await push_repository.find_by_user_id("order_user", limit=3)
+        assert [e.push_uuid for e in result] == [e.push_uuid for e in entities[:1:-1]]
+
+    @pytest.mark.asyncio
+    async def test_find_many_keeps_order_and_skips_missing(
+        self, push_repository: RedisPushNotificationRepository
+    ):
+        """일괄 조회가 입력 순서를 유지하고 없는 항목은 제외하는지 테스트"""
+        entities = [
+            PushNotification.create_new(user_id="many_user", message=f"일괄 {i}")
+            for i in range(3)
+        ]
+        for entity in entities:
+            await push_repository.save(entity)
+
+        missing = PushNotification.create_new(user_id="many_user", message="없음").push_uuid
+        requested = [entities[2].push_uuid, missing, entities[0].push_uuid]
+
+        result = await push_repository.find_many(requested)
+        assert [e.push_uuid for e in result] == [entities[2].push_uuid, entities[0].push_uuid]
+        assert await push_repository.find_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_find_page_breaks_score_ties_by_uuid(
+        self, push_repository: RedisPushNotificationRepository
+    ):
+        """같은 생성시간을 가진 푸시도 페이지 경계에서 누락/중복되지 않는지 테스트"""
+        created_at = datetime.now()
+        expected = set()
+        for i in range(5):
+            entity = PushNotification.create_new(user_id="tie_user", message=f"동시 {i}")
+            entity.created_at = created_at
+            await push_repository.save(entity)
+            expected.add(entity.push_uuid)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await push_repository.find_page_by_user_id("tie_user", limit=2, cursor=cursor)
+            seen.extend(e.push_uuid for e in page.items)
+            cursor = page.next_cursor
+            if not page.has_more:
+                break
+
+        assert len(seen) == 5
+        assert set(seen) == expected
+
+
+class TestShardedKeyLayout:
+    """클러스터용 키 구조(hash tag, 토픽 인덱스 구간 분할) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_hash_tagged_record_shares_slot_with_user_index(
+        self, test_redis_connection: RedisConnection
+    ):
+        """next_identity로 발급한 uuid의 기록 키가 사용자 인덱스와 같은 슬롯인지 테스트"""
+        store = RedisPushRecordStore(test_redis_connection, hash_tags=True)
+        entity = PushNotification.create_new(
+            user_id="tag_user", message="태그", push_uuid=store.next_identity("tag_user")
+        )
+        record_key = store.record_key(entity.push_uuid)
+        user_key = store.user_index_key("tag_user")
+        assert entity.push_uuid.version == 4
+        assert record_key.startswith("push:{") and user_key.startswith("user_pushes:{")
+        assert key_slot(record_key.encode()) == key_slot(user_key.encode())
+
+        await store.save(entity)
+        assert await store.get(entity.push_uuid) == entity
+        items, _ = await store.find_user_page("tag_user", limit=10)
+        assert items == [entity]
+        assert await store.delete(entity.push_uuid) is True
+        assert await test_redis_connection.client.zcard(user_key) == 0
+
+    @pytest.mark.asyncio
+    async def test_topic_shards_page_across_buckets(
+        self, test_redis_connection: RedisConnection
+    ):
+        """구간별로 나뉜 토픽 인덱스를 최신순으로 이어서 페이지 조회하는지 테스트"""
+        repository = RedisPushNotificationRepository(
+            test_redis_connection, ttl_seconds=600, topic_shard_seconds=60
+        )
+        base = datetime.now()
+        entities = []
+        for i in range(6):
+            entity = PushNotification.create_new(
+                user_id="shard_user", message=f"구간 {i}", topic="shard_topic"
+            )
+            entity.created_at = base - timedelta(seconds=45 * i)
+            entities.append(entity)
+        await repository.save_many(entities)
+
+        client = test_redis_connection.client
+        shard_keys = [key async for key in client.scan_iter("topic_pushes:shard_topic:*")]
+        assert len(shard_keys) >= 4
+        assert not await client.exists("topic_pushes:shard_topic")
+
+        seen = []
+        cursor = None
+        while True:
+            page = await repository.find_page_by_topic("shard_topic", limit=4, cursor=cursor)
+            seen.extend(e.push_uuid for e in page.items)
+            cursor = page.next_cursor
+            if not page.has_more:
+                break
+        assert seen == [e.push_uuid for e in entities]
+
+        await repository.delete(entities[0].push_uuid)
+        result = await repository.find_by_topic("shard_topic", limit=10)
+        assert [e.push_uuid for e in result] == [e.push_uuid for e in entities[1:]]
+
+    @pytest.mark.asyncio
+    async def test_sparse_topic_reads_only_written_shards(
+        self, test_redis_connection: RedisConnection, monkeypatch: pytest.MonkeyPatch
+    ):
+        """긴 TTL/짧은 구간에서도 기록이 들어간 구간 키만 읽고 지난 구간 번호는 정리하는지 테스트"""
+        store = RedisPushRecordStore(
+            test_redis_connection, ttl_seconds=7 * 24 * 3600, topic_shard_seconds=60
+        )
+        now = datetime.now()
+        entities = []
+        for days in (0, 3):
+            entity = PushNotification.create_new(
+                user_id="sparse_user", message=f"{days}일 전", topic="sparse_topic"
+            )
+            entity.created_at = now - timedelta(days=days)
+            entities.append(entity)
+        await store.save(entities[0])
+        await store.save_many(entities[1:])
+
+        client = test_redis_connection.client
+        bucket_key = store.topic_bucket_key("sparse_topic")
+        await client.zadd(bucket_key, {"1": 1})
+        assert await client.zcard(bucket_key) == 3
+
+        read_keys = []
+        find_page = store._find_page
+
+        async def recording_find_page(index_keys, limit, position=None):
+            read_keys.extend(index_keys)
+            return await find_page(index_keys, limit, position)
+
+        monkeypatch.setattr(store, "_find_page", recording_find_page)
+        items, next_position = await store.find_topic_page("sparse_topic", limit=10)
+        assert items == entities
+        assert next_position is None
+        assert read_keys == [
+            store.topic_shard_key("sparse_topic", int(e.created_at.timestamp()) // 60)
+            for e in entities
+        ]
+        assert await client.zcard(bucket_key) == 2
+
+        read_keys.clear()
+        assert await store.find_topic_page("empty_topic", limit=10) == ([], None)
+        assert read_keys == []
+
+
+class TestPushIndexCleanup:
+    """만료된 인덱스 멤버 정리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_listing_prunes_dangling_members(
+        self,
+        push_repository: RedisPushNotificationRepository,
+        test_redis_connection: RedisConnection,
+    ):
+        """목록 조회 중 기록이 없는 멤버가 인덱스에서 제거되는지 테스트"""
+        client = test_redis_connection.client
+        live = PushNotification.create_new(user_id="prune_user", message="살아있음")
+        dead = PushNotification.create_new(user_id="prune_user", message="만료됨")
+        await push_repository.save_many([live, dead])
+        await client.delete(f"push:{dead.push_uuid}")
+
+        result = await push_repository.find_by_user_id("prune_user")
+
+        assert [e.push_uuid for e in result] == [live.push_uuid]
+        assert await client.zrange("user_pushes:prune_user", 0, -1) == [str(live.push_uuid)]
+
+    @pytest.mark.asyncio
+    async def test_sweeper_removes_dangling_members_in_batches(
+        self,
+        push_repository: RedisPushNotificationRepository,
+        test_redis_connection: RedisConnection,
+    ):
+        """스위퍼가 모든 인덱스를 순회하며 기록이 없는 멤버만 제거하는지 테스트"""
+        client = test_redis_connection.client
+        entities = [
+            PushNotification.create_new(user_id="sweep_user", message=f"스윕 {i}", topic="sweep")
+            for i in range(25)
+        ]
+        await push_repository.save_many(entities)
+        dead = entities[::2]
+        await client.delete(*(f"push:{e.push_uuid}" for e in dead))
+        await client.set("user_pushes:not_a_zset", "ignored")
+
+        sweeper = PushIndexSweeper(test_redis_connection, batch_size=5)
+        pruned = await sweeper.sweep_once()
+
+        # 사용자 인덱스와 토픽 인덱스에서 각각 제거
+        assert pruned == len(dead) * 2
+        live = {str(e.push_uuid) for e in entities[1::2]}
+        assert set(await client.zrange("user_pushes:sweep_user", 0, -1)) == live
+        assert set(await client.zrange("topic_pushes:sweep", 0, -1)) == live
+        assert await sweeper.sweep_once() == 0
+
+
+class TestPushRecordCodecs:
+    """푸시 기록 저장 형식 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_msgpack_codec_round_trip(self, test_redis_connection: RedisConnection):
+        """msgpack 형식으로 저장한 기록이 단일 문자열 값으로 저장되고 그대로 복원되는지 테스트"""
+        repository = RedisPushNotificationRepository(
+            test_redis_connection, codec=MsgpackPushRecordCodec()
+        )
+        entities = [
+            PushNotification.create_new(user_id="codec_user", message=f"메시지 {i} 🚀")
+            for i in range(3)
+        ]
+        assert await repository.save(entities[0]) is True
+        assert await repository.save_many(entities[1:]) == [True, True]
+
+        client = test_redis_connection.client
+        key = f"push:{entities[0].push_uuid}"
+        assert await client.type(key) == "string"
+        assert 0 < await client.ttl(key) <= 60
+
+        assert await repository.find_by_id(entities[0].push_uuid) == entities[0]
+        listed = await repository.find_by_user_id("codec_user", limit=10)
+        assert sorted(e.push_uuid for e in listed) == sorted(e.push_uuid for e in entities)
+        assert await repository.delete(entities[0].push_uuid) is True
+        assert await repository.exists(entities[0].push_uuid) is False
+
+    @pytest.mark.asyncio
+    async def test_corrupted_msgpack_record_is_skipped(
+        self, test_redis_connection: RedisConnection
+    ):
+        """손상된 값은 목록 조회에서 제외되는지 테스트"""
+        repository = RedisPushNotificationRepository(
+            test_redis_connection, codec=MsgpackPushRecordCodec()
+        )
+        entity = PushNotification.create_new(user_id="broken_user", message="정상")
+        await repository.save(entity)
+        broken = PushNotification.create_new(user_id="broken_user", message="손상")
+        await repository.save(broken)
+        await test_redis_connection.client.set(f"push:{broken.push_uuid}", b"\xc1")
+
+        result = await repository.find_many([broken.push_uuid, entity.push_uuid])
+        assert [e.push_uuid for e in result] == [entity.push_uuid]
+
+    def test_unknown_codec_name(self):
+        """알 수 없는 코덱 이름은 거부되는지 테스트"""
+        assert get_push_record_codec("MsgPack").name == "msgpack"
+        with pytest.raises(ValueError):
+            get_push_record_codec("protobuf")
+
+
+class TestCachedPushNotificationRepository:
+    """캐시 데코레이터 저장소 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_and_invalidation_on_status_change(
+        self, push_repository: RedisPushNotificationRepository
+    ):
+        """반복 조회는 캐시에서 처리되고 상태 변경 시 무효화되는지 테스트"""
+        cached = CachedPushNotificationRepository(push_repository, max_age_seconds=30)
+        service = PushNotificationService(cached)
+        entity = await service.create_push_notification(user_id="cache_user", message="캐시")
+
+        await cached.find_by_id(entity.push_uuid)
+        first = await cached.find_by_id(entity.push_uuid)
+        assert first.status == "created"
+        assert cached.stats()["hits"] == 1
+
+        # 반환된 엔티티를 변경해도 캐시 내용은 바뀌지 않아야 함
+        first.mark_as_failed()
+        assert (await cached.find_by_id(entity.push_uuid)).status == "created"
+
+        assert await service.mark_push_as_sent(entity.push_uuid) is True
+        assert (await cached.find_by_id(entity.push_uuid)).status == "sent"
+
+        assert await cached.delete(entity.push_uuid) is True
+        assert await cached.find_by_id(entity.push_uuid) is None
+
+    @pytest.mark.asyncio
+    async def test_cache_expiry_is_capped_by_redis_ttl(
+        self, push_repository: RedisPushNotificationRepository
+    ):
+        """캐시 만료가 Redis 키의 남은 TTL을 넘지 않는지 테스트"""
+        now = [1000.0]
+        cached = CachedPushNotificationRepository(
+            push_repository, max_age_seconds=3600, clock=lambda: now[0]
+        )
+        entity = PushNotification.create_new(user_id="ttl_user", message="TTL")
+        await push_repository.save(entity)
+
+        _, ttl = await cached.find_by_id_with_ttl(entity.push_uuid)
+        assert 0 < ttl <= 60
+
+        now[0] += 61
+        await cached.find_by_id(entity.push_uuid)
+        assert cached.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, push_repository: RedisPushNotificationRepository):
+        """용량 초과 시 가장 오래 사용되지 않은 항목이 제거되는지 테스트"""
+        cached = CachedPushNotificationRepository(push_repository, max_entries=2)
+        entities = [
+            PushNotification.create_new(user_id="lru_user", message=f"LRU {i}") for i in range(3)
+        ]
+        await push_repository.save_many(entities)
+
+        for entity in entities:
+            await cached.find_by_id(entity.push_uuid)
+        assert cached.stats()["entries"] == 2
+
+        await cached.find_by_id(entities[0].push_uuid)
+        assert cached.stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_client_tracking_invalidates_other_workers(
+        self,
+        push_repository: RedisPushNotificationRepository,
+        test_redis_connection: RedisConnection,
+    ):
+        """다른 워커의 변경이 CLIENT TRACKING으로 캐시를 무효화하는지 테스트"""
+        cached = CachedPushNotificationRepository(push_repository, max_age_seconds=30)
+        invalidator = RedisTrackingInvalidator(test_redis_connection, cached)
+        await invalidator.start()
+        try:
+            entity = PushNotification.create_new(user_id="tracking_user", message="추적")
+            await push_repository.save(entity)
+            await cached.find_by_id(entity.push_uuid)
+            assert cached.stats()["entries"] == 1
+
+            # 캐시를 거치지 않은 변경 (다른 워커 역할)
+            await test_redis_connection.client.hset(
+                f"push:{entity.push_uuid}", "status", "delivered"
+            )
+            for _ in range(50):
+                if cached.stats()["entries"] == 0:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert (await cached.find_by_id(entity.push_uuid)).status == "delivered"
+        finally:
+            await invalidator.stop()
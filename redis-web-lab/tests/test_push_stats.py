@@ -0,0 +1,112 @@
+import pytest
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+from app.application.services import PushNotificationService, PushStatsService
+from app.domain.entities import PushNotification
+from app.infrastructure.codecs import HashPushRecordCodec, MsgpackPushRecordCodec
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import (
+    RedisPushNotificationRepository,
+    RedisPushStatsRepository,
+)
+from app.infrastructure.storage import RedisPushStatsStore
+from app.main import app
+from app.presentation.api.push_router import get_push_notification_service
+from app.presentation.api.stats_router import get_push_stats_service
+
+
+class TestPushStats:
+    """토픽별 푸시 통계 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("codec", [HashPushRecordCodec(), MsgpackPushRecordCodec()])
+    async def test_counts_and_unique_users_per_hour(
+        self, test_redis_connection: RedisConnection, codec
+    ):
+        """생성/상태 변경 수와 고유 사용자 수가 생성 시각의 시간 구간별로 누적되는지 테스트"""
+        stats_store = RedisPushStatsStore(test_redis_connection, retention_hours=24)
+        repository = RedisPushNotificationRepository(
+            test_redis_connection, codec=codec, stats=stats_store
+        )
+        now = datetime.now()
+        earlier = now - timedelta(hours=2)
+
+        def make(user_id: str, topic: str, created_at: datetime) -> PushNotification:
+            entity = PushNotification.create_new(user_id=user_id, message="통계", topic=topic)
+            entity.created_at = created_at
+            return entity
+
+        current = [make(f"user_{i % 3}", "news", now) for i in range(5)]
+        older = [make("user_0", "news", earlier), make("user_9", "news", earlier)]
+        assert await repository.save(make("solo", "sale", now)) is True
+        assert all(await repository.save_many(current + older))
+
+        # 같은 상태를 다시 보내거나 되돌리는 요청은 집계하지 않음
+        assert all(
+            await repository.update_statuses(
+                [(e.push_uuid, "sent") for e in current]
+                + [(current[0].push_uuid, "sent"), (current[1].push_uuid, "delivered")]
+                + [(older[0].push_uuid, "failed"), (older[0].push_uuid, "sent")]
+            )
+        )
+
+        stats = await stats_store.read(hours=3, now=now)
+        assert [s.topic for s in stats] == ["news", "sale"]
+        news = stats[0]
+        assert news.counts == {"created": 7, "sent": 5, "delivered": 1, "failed": 1}
+        assert news.unique_users == 4
+        assert [bucket.hour for bucket in news.hourly] == [
+            now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=i)
+            for i in range(3)
+        ]
+        assert news.hourly[0].counts["created"] == 5
+        assert news.hourly[0].unique_users == 3
+        assert news.hourly[1].counts["created"] == 0
+        assert news.hourly[2].counts == {"created": 2, "sent": 0, "delivered": 0, "failed": 1}
+        assert news.hourly[2].unique_users == 2
+
+        # 토픽을 지정하면 해당 토픽만, 구간 밖의 푸시는 제외
+        (only_news,) = await stats_store.read(hours=1, topic="news", now=now)
+        assert only_news.counts["created"] == 5
+        assert await stats_store.read(hours=3, topic="unknown", now=now) == []
+
+        # 카운터는 토픽별 키로 나뉘고, 조회 구간은 보존 시간까지만
+        client = test_redis_connection.client
+        assert await client.hgetall(stats_store.counters_key("sale", now)) == {"created": "1"}
+        ttl = await client.ttl(stats_store.counters_key("news", earlier))
+        assert 0 < ttl <= 24 * 3600
+        (clamped,) = await stats_store.read(hours=24 * 31, topic="sale", now=now)
+        assert len(clamped.hourly) == 24
+
+    @pytest.mark.asyncio
+    async def test_stats_endpoint(
+        self, async_client: AsyncClient, test_redis_connection: RedisConnection
+    ):
+        """통계 API가 `/push/{push_uuid}`보다 먼저 매칭되고 꺼져 있으면 503인지 테스트"""
+        assert (await async_client.get("/push/stats")).status_code == 503
+
+        stats_store = RedisPushStatsStore(test_redis_connection)
+        push_service = PushNotificationService(
+            RedisPushNotificationRepository(test_redis_connection, stats=stats_store)
+        )
+        stats_service = PushStatsService(RedisPushStatsRepository(stats_store))
+        app.dependency_overrides[get_push_notification_service] = lambda: push_service
+        app.dependency_overrides[get_push_stats_service] = lambda: stats_service
+
+        for i in range(3):
+            response = await async_client.post(
+                "/push", json={"user_id": f"api_user_{i % 2}", "message": "통계", "topic": "api"}
+            )
+            assert response.status_code == 200
+
+        response = await async_client.get("/push/stats", params={"topic": "api", "hours": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["hours"] == 2
+        (topic_stats,) = data["topics"]
+        assert topic_stats["topic"] == "api"
+        assert topic_stats["counts"] == {"created": 3, "sent": 0, "delivered": 0, "failed": 0}
+        assert topic_stats["unique_users"] == 2
+        assert len(topic_stats["hourly"]) == 2
+
+        assert (await async_client.get("/push/stats", params={"hours": 0})).status_code == 422
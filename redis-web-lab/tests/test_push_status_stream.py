@@ -0,0 +1,109 @@
+import pytest
+from app.application.services import PushNotificationService
+from app.domain.entities import PushNotification
+from app.infrastructure.codecs import HashPushRecordCodec, MsgpackPushRecordCodec
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.messaging import PushStatusStreamConsumer, RedisPushStatusPublisher
+from app.infrastructure.repositories import RedisPushNotificationRepository
+
+
+STREAM_KEY = "test_push_status_events"
+GROUP_NAME = "test_push_status_workers"
+
+
+class TestPushStatusUpdates:
+    """상태 필드 갱신 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("codec", [HashPushRecordCodec(), MsgpackPushRecordCodec()])
+    async def test_update_statuses_only_moves_forward(
+        self, test_redis_connection: RedisConnection, codec
+    ):
+        """상태가 진행 방향으로만 바뀌고 TTL이 유지되는지 테스트"""
+        repository = RedisPushNotificationRepository(test_redis_connection, codec=codec)
+        entity = PushNotification.create_new(user_id="status_user", message="상태")
+        await repository.save(entity)
+        key = f"push:{entity.push_uuid}"
+        await test_redis_connection.client.expire(key, 30)
+
+        missing = PushNotification.create_new(user_id="status_user", message="없음")
+        result = await repository.update_statuses(
+            [
+                (entity.push_uuid, "delivered"),
+                (missing.push_uuid, "sent"),
+                (entity.push_uuid, "sent"),
+            ]
+        )
+
+        assert result == [True, False, True]
+        assert (await repository.find_by_id(entity.push_uuid)).status == "delivered"
+        assert 0 < await test_redis_connection.client.ttl(key) <= 30
+        assert await repository.exists(missing.push_uuid) is False
+
+
+class TestPushStatusStream:
+    """상태 변경 스트림 발행/소비 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_published_transitions_are_applied_and_acked(
+        self,
+        push_repository: RedisPushNotificationRepository,
+        test_redis_connection: RedisConnection,
+    ):
+        """발행된 상태 변경이 일괄 적용되고 ACK되는지 테스트"""
+        publisher = RedisPushStatusPublisher(test_redis_connection, stream_key=STREAM_KEY)
+        consumer = PushStatusStreamConsumer(
+            test_redis_connection, push_repository, stream_key=STREAM_KEY, group_name=GROUP_NAME
+        )
+        await consumer.start()
+        await consumer.stop()
+        service = PushNotificationService(push_repository, publisher)
+
+        first = await service.create_push_notification(user_id="stream_user", message="1")
+        second = await service.create_push_notification(user_id="stream_user", message="2")
+        assert await service.mark_push_as_sent(first.push_uuid) is True
+        assert await service.mark_push_as_delivered(second.push_uuid) is True
+        unknown = PushNotification.create_new(user_id="stream_user", message="x").push_uuid
+        assert await service.mark_push_as_sent(unknown) is False
+
+        # 발행만 된 상태에서는 아직 반영되지 않음
+        assert (await push_repository.find_by_id(first.push_uuid)).status == "created"
+
+        assert await consumer.process_once("test-consumer", block_ms=100) == 2
+        assert (await push_repository.find_by_id(first.push_uuid)).status == "sent"
+        assert (await push_repository.find_by_id(second.push_uuid)).status == "delivered"
+
+        pending = await test_redis_connection.client.xpending(STREAM_KEY, GROUP_NAME)
+        assert pending["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unacked_events_are_reclaimed(
+        self,
+        push_repository: RedisPushNotificationRepository,
+        test_redis_connection: RedisConnection,
+    ):
+        """ACK되지 않은 대기 이벤트를 다른 컨슈머가 다시 가져와 적용하는지 테스트"""
+        client = test_redis_connection.client
+        entity = PushNotification.create_new(user_id="reclaim_user", message="재처리")
+        await push_repository.save(entity)
+        consumer = PushStatusStreamConsumer(
+            test_redis_connection,
+            push_repository,
+            stream_key=STREAM_KEY,
+            group_name=GROUP_NAME,
+            min_idle_ms=0,
+        )
+        await consumer.start()
+        await consumer.stop()
+
+        publisher = RedisPushStatusPublisher(test_redis_connection, stream_key=STREAM_KEY)
+        await publisher.publish(entity.push_uuid, "sent")
+        await client.xadd(STREAM_KEY, {"push_uuid": "not-a-uuid", "status": "sent"})
+        # 읽기만 하고 ACK하지 않은 채 종료된 컨슈머
+        await client.xreadgroup(GROUP_NAME, "crashed-consumer", {STREAM_KEY: ">"}, count=10)
+
+        await consumer._reclaim("healthy-consumer")
+
+        assert (await push_repository.find_by_id(entity.push_uuid)).status == "sent"
+        pending = await client.xpending(STREAM_KEY, GROUP_NAME)
+        assert pending["pending"] == 0
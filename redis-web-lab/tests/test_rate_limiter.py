@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from httpx import AsyncClient
+from app.application.services import PushNotificationService, TopicBroadcastService
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.rate_limiting import PushRateLimiter, RateLimit
+from app.infrastructure.repositories import (
+    RedisBroadcastJobRepository,
+    RedisPushNotificationRepository,
+    RedisTopicSubscriptionRepository,
+)
+from app.main import app
+from app.presentation.api.broadcast_router import get_topic_broadcast_service
+from app.presentation.api.push_router import get_push_rate_limiter
+
+
+class TestPushRateLimiter:
+    """Redis 토큰 버킷 요청 제한 테스트"""
+
+    def test_parse_rate_limit(self):
+        """환경 변수 형식의 한도 해석 테스트"""
+        assert RateLimit.parse("10/50") == RateLimit(rate=10, burst=50)
+        assert RateLimit.parse("0.5") == RateLimit(rate=0.5, burst=1)
+        assert RateLimit.parse("") is None
+        with pytest.raises(ValueError):
+            RateLimit.parse("0/10")
+
+    @pytest.mark.asyncio
+    async def test_burst_then_refill(self, test_redis_connection: RedisConnection):
+        """최대 토큰만큼 허용 후 거절하고, 충전되면 다시 허용하는지 테스트"""
+        limiter = PushRateLimiter(test_redis_connection, user_limit=RateLimit(rate=20, burst=3))
+
+        decisions = [await limiter.check("burst_user") for _ in range(4)]
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        denied = decisions[-1]
+        assert denied.scope == "user"
+        assert 0 < denied.retry_after <= 0.05
+        assert denied.retry_after_header == "1"
+
+        # 다른 사용자는 영향 없음
+        assert (await limiter.check("other_user")).allowed is True
+
+        await asyncio.sleep(denied.retry_after + 0.01)
+        assert (await limiter.check("burst_user")).allowed is True
+
+    @pytest.mark.asyncio
+    async def test_topic_limit_applies_across_users(self, test_redis_connection: RedisConnection):
+        """토픽 한도가 여러 사용자에 걸쳐 적용되고 토픽이 없으면 확인하지 않는지 테스트"""
+        limiter = PushRateLimiter(
+            test_redis_connection,
+            user_limit=RateLimit(rate=100, burst=100),
+            topic_limit=RateLimit(rate=1, burst=2),
+        )
+
+        results = [await limiter.check(f"user_{i}", "hot") for i in range(3)]
+        assert [d.allowed for d in results] == [True, True, False]
+        assert results[-1].scope == "topic"
+        assert 0.5 < results[-1].retry_after <= 1
+        # 거절된 요청은 사용자 버킷도 차감하지 않음 (단일 노드에서는 버킷을 함께 판정)
+        client = test_redis_connection.client
+        assert float(await client.hget("rate_limit:push:user:user_2", "tokens")) == 100
+        assert (await limiter.check("user_0")).allowed is True
+
+    @pytest.mark.asyncio
+    async def test_create_push_returns_429_with_retry_after(
+        self, async_client: AsyncClient, test_redis_connection: RedisConnection
+    ):
+        """한도를 넘은 생성 요청이 429와 Retry-After로 거절되는지 테스트"""
+        limiter = PushRateLimiter(test_redis_connection, user_limit=RateLimit(rate=0.5, burst=2))
+        app.dependency_overrides[get_push_rate_limiter] = lambda: limiter
+
+        payload = {"user_id": "flood_user", "message": "폭주"}
+        responses = [await async_client.post("/push", json=payload) for _ in range(3)]
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert responses[-1].headers["retry-after"] == "2"
+        assert await test_redis_connection.client.zcard("user_pushes:flood_user") == 2
+
+    @pytest.mark.asyncio
+    async def test_create_push_batch_marks_limited_items_failed(
+        self, async_client: AsyncClient, test_redis_connection: RedisConnection
+    ):
+        """일괄 생성에서 한도를 넘은 항목만 실패로 표시되고 저장되지 않는지 테스트"""
+        limiter = PushRateLimiter(test_redis_connection, user_limit=RateLimit(rate=0.5, burst=2))
+        app.dependency_overrides[get_push_rate_limiter] = lambda: limiter
+
+        items = [{"user_id": "batch_flood", "message": f"m{i}"} for i in range(3)]
+        items.append({"user_id": "batch_calm", "message": "m3"})
+        response = await async_client.post("/push/batch", json=items)
+
+        assert response.status_code == 200
+        assert response.headers["retry-after"] == "2"
+        body = response.json()
+        assert (body["total"], body["succeeded"], body["failed"]) == (4, 3, 1)
+        denied = [r for r in body["results"] if not r["success"]]
+        assert [(r["index"], r["retry_after"]) for r in denied] == [(2, 2)]
+        assert "user" in denied[0]["error"]
+        client = test_redis_connection.client
+        assert await client.zcard("user_pushes:batch_flood") == 2
+        assert await client.zcard("user_pushes:batch_calm") == 1
+
+    @pytest.mark.asyncio
+    async def test_broadcast_is_limited_per_topic(
+        self, async_client: AsyncClient, test_redis_connection: RedisConnection
+    ):
+        """토픽 발송 시작이 토픽 한도로 제한되고 다른 토픽에는 영향이 없는지 테스트"""
+        service = TopicBroadcastService(
+            PushNotificationService(RedisPushNotificationRepository(test_redis_connection)),
+            RedisTopicSubscriptionRepository(test_redis_connection),
+            RedisBroadcastJobRepository(test_redis_connection),
+        )
+        limiter = PushRateLimiter(test_redis_connection, topic_limit=RateLimit(rate=0.5, burst=1))
+        app.dependency_overrides[get_topic_broadcast_service] = lambda: service
+        app.dependency_overrides[get_push_rate_limiter] = lambda: limiter
+        try:
+            payload = {"message": "공지"}
+            first = await async_client.post("/push/topic/limited/broadcast", json=payload)
+            second = await async_client.post("/push/topic/limited/broadcast", json=payload)
+            other = await async_client.post("/push/topic/other/broadcast", json=payload)
+        finally:
+            await service.stop()
+
+        assert [first.status_code, second.status_code, other.status_code] == [202, 429, 202]
+        assert second.headers["retry-after"] == "2"
+        assert "topic" in second.json()["detail"]
@@ -0,0 +1,179 @@
+import os
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+from redis.asyncio import RedisCluster
+from app.application.services import PushNotificationService
+from app.domain.entities import PushNotification
+from app.infrastructure.codecs import HashPushRecordCodec, MsgpackPushRecordCodec
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import RedisPushNotificationRepository
+from app.infrastructure.storage import PushIndexSweeper, PushStoreSettings, RedisPushStatsStore
+from app.models import PushRecord
+from app.redis_service import RedisService
+
+
+# 로컬 클러스터: scripts/local_cluster.sh start 후 TEST_REDIS_CLUSTER_URL=redis://127.0.0.1:7000
+TEST_REDIS_CLUSTER_URL = os.getenv("TEST_REDIS_CLUSTER_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_REDIS_CLUSTER_URL, reason="TEST_REDIS_CLUSTER_URL이 설정되지 않음"
+)
+
+
+@pytest_asyncio.fixture
+async def cluster_connection():
+    """테스트용 Redis Cluster 연결 픽스처"""
+    connection = RedisConnection(redis_url=TEST_REDIS_CLUSTER_URL, cluster=True)
+    await connection.connect()
+    yield connection
+
+    # 모든 마스터의 테스트 데이터 정리
+    await connection.client.flushdb(target_nodes=RedisCluster.PRIMARIES)
+    await connection.disconnect()
+
+
+class TestRedisCluster:
+    """Redis Cluster 저장소 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("codec", [HashPushRecordCodec(), MsgpackPushRecordCodec()])
+    async def test_push_lifecycle_on_cluster(self, cluster_connection: RedisConnection, codec):
+        """클러스터에서 저장/조회/상태 변경/삭제와 기록-사용자 인덱스 같은 슬롯 테스트"""
+        repository = RedisPushNotificationRepository(cluster_connection, codec=codec)
+        service = PushNotificationService(repository)
+        client = cluster_connection.client
+
+        entities = [
+            await service.create_push_notification(f"cluster_user_{i % 3}", f"클러스터 {i}")
+            for i in range(9)
+        ]
+        store = repository.store
+        for entity in entities:
+            record_slot = await client.cluster_keyslot(store.record_key(entity.push_uuid))
+            user_slot = await client.cluster_keyslot(store.user_index_key(entity.user_id))
+            assert record_slot == user_slot
+
+        # 기록이 여러 노드에 흩어져 있어도 한 번에 조회
+        assert await repository.find_many([e.push_uuid for e in entities]) == entities
+        user_items = await repository.find_by_user_id("cluster_user_0")
+        assert [e.push_uuid for e in user_items] == [e.push_uuid for e in entities[::3][::-1]]
+
+        result = await repository.update_statuses(
+            [(entities[0].push_uuid, "delivered"), (entities[0].push_uuid, "sent")]
+            + [(entity.push_uuid, "sent") for entity in entities[1:]]
+        )
+        assert all(result)
+        assert (await repository.find_by_id(entities[0].push_uuid)).status == "delivered"
+        assert (await repository.find_by_id(entities[1].push_uuid)).status == "sent"
+
+        assert await repository.delete(entities[0].push_uuid) is True
+        assert await repository.exists(entities[0].push_uuid) is False
+
+    @pytest.mark.asyncio
+    async def test_hot_topic_shards_spread_across_nodes(self, cluster_connection: RedisConnection):
+        """구간별 토픽 인덱스가 여러 노드에 나뉘고 페이지 조회가 이어지는지 테스트"""
+        repository = RedisPushNotificationRepository(
+            cluster_connection, ttl_seconds=3600, topic_shard_seconds=60
+        )
+        base = datetime.now()
+        entities = []
+        for i in range(30):
+            entity = PushNotification.create_new(
+                user_id=f"hot_user_{i}", message=f"핫 토픽 {i}", topic="hot_topic",
+                push_uuid=repository.next_identity(f"hot_user_{i}"),
+            )
+            entity.created_at = base - timedelta(seconds=60 * i)
+            entities.append(entity)
+        assert all(await repository.save_many(entities))
+
+        client = cluster_connection.client
+        shard_keys = [key async for key in client.scan_iter(match="topic_pushes:hot_topic:*")]
+        assert len(shard_keys) == 30
+        nodes = {client.get_node_from_key(key).name for key in shard_keys}
+        assert len(nodes) > 1
+
+        seen = []
+        cursor = None
+        while True:
+            page = await repository.find_page_by_topic("hot_topic", limit=7, cursor=cursor)
+            seen.extend(e.push_uuid for e in page.items)
+            cursor = page.next_cursor
+            if not page.has_more:
+                break
+        assert seen == [e.push_uuid for e in entities]
+
+    @pytest.mark.asyncio
+    async def test_sweeper_scans_every_node(self, cluster_connection: RedisConnection):
+        """스위퍼가 모든 노드의 인덱스를 정리하는지 테스트"""
+        repository = RedisPushNotificationRepository(cluster_connection)
+        service = PushNotificationService(repository)
+        entities = [
+            await service.create_push_notification(f"sweep_user_{i}", "스윕", topic=f"sweep_{i}")
+            for i in range(10)
+        ]
+        client = cluster_connection.client
+        for entity in entities:
+            await client.delete(repository.store.record_key(entity.push_uuid))
+
+        sweeper = PushIndexSweeper(cluster_connection, record_key=repository.store.record_key)
+        assert await sweeper.sweep_once() == 20
+
+    @pytest.mark.asyncio
+    async def test_push_stats_on_cluster(self, cluster_connection: RedisConnection):
+        """통계 키가 여러 노드에 있어도 집계되고 여러 시간의 고유 사용자 수를 합치는지 테스트"""
+        stats_store = RedisPushStatsStore(cluster_connection)
+        repository = RedisPushNotificationRepository(cluster_connection, stats=stats_store)
+        now = datetime.now()
+        entities = []
+        for i in range(12):
+            entity = PushNotification.create_new(
+                user_id=f"stats_user_{i % 4}", message="통계", topic=f"stats_{i % 3}",
+                push_uuid=repository.next_identity(f"stats_user_{i % 4}"),
+            )
+            entity.created_at = now - timedelta(hours=i % 2)
+            entities.append(entity)
+        assert all(await repository.save_many(entities))
+        assert all(await repository.update_statuses([(e.push_uuid, "sent") for e in entities]))
+
+        stats = await stats_store.read(hours=2, now=now)
+        assert [s.topic for s in stats] == ["stats_0", "stats_1", "stats_2"]
+        for topic_stats in stats:
+            assert topic_stats.counts["created"] == 4
+            assert topic_stats.counts["sent"] == 4
+            assert topic_stats.unique_users == 4
+
+    @pytest.mark.asyncio
+    async def test_redis_service_shares_cluster_layout(self, cluster_connection: RedisConnection):
+        """RedisService로 저장한 기록을 같은 설정의 저장소가 클러스터 키 구조로 읽는지 테스트"""
+        settings = PushStoreSettings(cluster=True)
+        service = RedisService(redis_url=TEST_REDIS_CLUSTER_URL, settings=settings)
+        assert service.connection.cluster is True
+        await service.connect()
+        try:
+            now = datetime.now().isoformat()
+            record = PushRecord(
+                push_uuid=str(uuid4()),
+                user_id="cluster_service_user",
+                message="레거시 서비스",
+                topic="cluster_service",
+                created_at=now,
+                api_call_time=now,
+                status="created"
+            )
+            assert await service.save_push_record(record) is True
+        finally:
+            await service.disconnect()
+
+        repository = RedisPushNotificationRepository(
+            cluster_connection, store=settings.create_store(cluster_connection)
+        )
+        store = repository.store
+        assert store.record_key(record.push_uuid).startswith("push:{")
+        assert await cluster_connection.client.exists(store.record_key(record.push_uuid)) == 1
+
+        entity = await repository.find_by_id(UUID(record.push_uuid))
+        assert entity is not None and entity.message == "레거시 서비스"
+        user_items = await repository.find_by_user_id("cluster_service_user")
+        assert [e.push_uuid for e in user_items] == [UUID(record.push_uuid)]
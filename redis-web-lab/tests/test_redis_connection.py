@@ -0,0 +1,66 @@
+import asyncio
+import pytest
+from app.infrastructure.database import RedisConnection, RedisPoolSettings
+from tests.conftest import TEST_REDIS_URL
+
+
+class TestRedisConnection:
+    """Redis 연결/커넥션 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_blocking_pool_records_waits(self):
+        """풀이 가득 찼을 때 대기 횟수와 대기 시간이 기록되는지 테스트"""
+        connection = RedisConnection(
+            redis_url=TEST_REDIS_URL,
+            pool_settings=RedisPoolSettings(max_connections=1, blocking=True, pool_timeout=2),
+        )
+        await connection.connect()
+        try:
+            client = connection.client
+            # 하나뿐인 커넥션을 BLPOP으로 잠시 점유한 상태에서 PING 실행
+            holder = asyncio.create_task(client.blpop("pool_test_empty_list", timeout=0.3))
+            await asyncio.sleep(0.05)
+            assert await client.ping() is True
+            await holder
+
+            stats = connection.pool_stats()["default"]
+            assert stats.max_connections == 1
+            assert stats.waits >= 1
+            assert stats.wait_seconds > 0
+            assert stats.timeouts == 0
+            assert stats.in_use == 0
+            assert stats.idle == 1
+        finally:
+            await connection.disconnect()
+
+    def test_pool_settings_from_env(self, monkeypatch):
+        """환경 변수로 풀 설정을 읽는지 테스트"""
+        monkeypatch.setenv("REDIS_MAX_CONNECTIONS", "7")
+        monkeypatch.setenv("REDIS_POOL_BLOCKING", "false")
+        monkeypatch.setenv("REDIS_SOCKET_TIMEOUT", "")
+
+        settings = RedisPoolSettings.from_env()
+        assert settings.max_connections == 7
+        assert settings.blocking is False
+        assert settings.socket_timeout is None
+        assert "timeout" not in settings.pool_kwargs()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_releases_client(self, caplog):
+        """종료 후 클라이언트를 비우고 다시 연결할 수 있는지 테스트"""
+        connection = RedisConnection(redis_url=TEST_REDIS_URL)
+        await connection.connect()
+        with caplog.at_level("INFO"):
+            await connection.disconnect()
+            await connection.disconnect()
+        assert [r.message for r in caplog.records].count("Redis 연결 종료") == 1
+        assert await connection.is_connected() is False
+        assert connection.pool_stats() == {}
+        with pytest.raises(Exception):
+            connection.client
+
+        await connection.connect()
+        try:
+            assert await connection.is_connected() is True
+        finally:
+            await connection.disconnect()
@@ -1,6 +1,10 @@
 import pytest
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import RedisPushNotificationRepository
+from app.infrastructure.storage import PushStoreSettings
 from app.models import PushRecord
 from app.redis_service import RedisService
+from tests.conftest import TEST_REDIS_URL
 from uuid import uuid4
 from datetime import datetime
 
@@ -138,4 +142,68 @@ class TestRedisService:
         """존재하지 않는 기록 삭제 테스트"""
         fake_uuid = str(uuid4())
         success = await test_redis_service.delete_push_record(fake_uuid)
-        assert success is False
\ No newline at end of file
+        assert success is False
+
+    @pytest.mark.asyncio
+    async def test_shares_storage_engine_with_repository(self, test_redis_service: RedisService):
+        """기존 서비스와 저장소가 같은 키 구조를 공유하고 TTL만 다르게 설정되는지 테스트"""
+        now = datetime.now().isoformat()
+        record = PushRecord(
+            push_uuid=str(uuid4()),
+            user_id="shared_user",
+            message="공유 엔진",
+            topic="shared_topic",
+            created_at=now,
+            api_call_time=now,
+            status="created"
+        )
+        assert await test_redis_service.save_push_record(record) is True
+
+        client = test_redis_service.connection.client
+        assert 600000 < await client.ttl(f"push:{record.push_uuid}") <= 604800
+
+        repository = RedisPushNotificationRepository(test_redis_service.connection, ttl_seconds=30)
+        entities = await repository.find_by_user_id("shared_user")
+        assert [str(e.push_uuid) for e in entities] == [record.push_uuid]
+
+        entities[0].message = "저장소에서 다시 저장"
+        assert await repository.save(entities[0]) is True
+        assert 0 < await client.ttl(f"push:{record.push_uuid}") <= 30
+        assert (await test_redis_service.get_push_record(record.push_uuid)).message == (
+            "저장소에서 다시 저장"
+        )
+
+    @pytest.mark.asyncio
+    async def test_uses_shared_store_settings(self, test_redis_connection: RedisConnection):
+        """저장소와 같은 PushStoreSettings로 코덱/토픽 구간/통계가 맞춰지는지 테스트"""
+        settings = PushStoreSettings(codec="msgpack", topic_shard_seconds=3600, stats_enabled=True)
+        service = RedisService(redis_url=TEST_REDIS_URL, settings=settings)
+        await service.connect()
+        try:
+            now = datetime.now()
+            record = PushRecord(
+                push_uuid=str(uuid4()),
+                user_id="settings_user",
+                message="공유 설정",
+                topic="settings_topic",
+                created_at=now.isoformat(),
+                api_call_time=now.isoformat(),
+                status="created"
+            )
+            assert await service.save_push_record(record) is True
+        finally:
+            await service.disconnect()
+
+        client = test_redis_connection.client
+        assert await client.type(f"push:{record.push_uuid}") == "string"
+        bucket = int(now.timestamp()) // 3600
+        assert await client.zcard(f"topic_pushes:settings_topic:{bucket}") == 1
+        assert 600000 < await client.ttl(f"push:{record.push_uuid}") <= 604800
+
+        repository = RedisPushNotificationRepository(
+            test_redis_connection, store=settings.create_store(test_redis_connection)
+        )
+        assert [str(e.push_uuid) for e in await repository.find_by_topic("settings_topic")] == [
+            record.push_uuid
+        ]
+        assert repository.store.stats is not None
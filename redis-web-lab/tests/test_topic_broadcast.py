@@ -0,0 +1,128 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from app.application.services import PushNotificationService, TopicBroadcastService
+from app.domain.entities import BroadcastJob
+from app.infrastructure.database import RedisConnection
+from app.infrastructure.repositories import (
+    RedisBroadcastJobRepository,
+    RedisPushNotificationRepository,
+    RedisTopicSubscriptionRepository,
+)
+from app.main import app
+from app.presentation.api.broadcast_router import get_topic_broadcast_service
+
+
+@pytest_asyncio.fixture
+async def broadcast_service(test_redis_connection: RedisConnection):
+    """테스트용 토픽 일괄 발송 서비스 픽스처"""
+    service = TopicBroadcastService(
+        PushNotificationService(RedisPushNotificationRepository(test_redis_connection)),
+        RedisTopicSubscriptionRepository(test_redis_connection),
+        RedisBroadcastJobRepository(test_redis_connection),
+        chunk_size=300,
+    )
+    yield service
+    await service.stop()
+
+
+class TestTopicBroadcast:
+    """토픽 구독/일괄 발송 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_iterate_in_chunks(self, test_redis_connection: RedisConnection):
+        """구독자 추가/제거와 청크 단위 순회 테스트"""
+        repository = RedisTopicSubscriptionRepository(test_redis_connection, chunk_size=100)
+        user_ids = [f"sub_user_{i}" for i in range(1050)]
+
+        assert await repository.subscribe("news", user_ids) == 1050
+        assert await repository.subscribe("news", user_ids[:10]) == 0
+        assert await repository.unsubscribe("news", user_ids[:50] + ["unknown"]) == 50
+        assert await repository.count_subscribers("news") == 1000
+
+        chunks = [chunk async for chunk in repository.iter_subscribers("news", 300)]
+        assert all(len(chunk) <= 300 for chunk in chunks)
+        assert sorted(u for chunk in chunks for u in chunk) == sorted(user_ids[50:])
+
+    @pytest.mark.asyncio
+    async def test_run_broadcast_creates_push_per_subscriber(
+        self, broadcast_service: TopicBroadcastService, test_redis_connection: RedisConnection
+    ):
+        """구독자마다 푸시가 만들어지고 진행 수치가 누적되는지 테스트"""
+        await broadcast_service.subscribe("sale", [f"buyer_{i}" for i in range(1000)])
+        job = BroadcastJob.create_new(topic="sale", message="세일 시작")
+        await RedisBroadcastJobRepository(test_redis_connection).save(job)
+
+        await broadcast_service.run_broadcast(job)
+
+        finished = await broadcast_service.get_broadcast_job(job.job_id)
+        assert finished.status == "completed"
+        assert (finished.total, finished.succeeded, finished.failed) == (1000, 1000, 0)
+        assert finished.progress == 1.0
+        assert finished.finished_at is not None
+
+        client = test_redis_connection.client
+        assert await client.zcard("topic_pushes:sale") == 1000
+        assert await client.zcard("user_pushes:buyer_7") == 1
+
+    @pytest.mark.asyncio
+    async def test_run_broadcast_marks_job_failed_when_start_fails(
+        self,
+        broadcast_service: TopicBroadcastService,
+        test_redis_connection: RedisConnection,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """구독자 수 조회처럼 시작 단계에서 오류가 나도 작업이 실패로 기록되는지 테스트"""
+
+        async def fail_count(topic: str) -> int:
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(
+            broadcast_service._subscription_repository, "count_subscribers", fail_count
+        )
+        job = BroadcastJob.create_new(topic="broken", message="실패")
+        await RedisBroadcastJobRepository(test_redis_connection).save(job)
+
+        await broadcast_service.run_broadcast(job)
+
+        assert (await broadcast_service.get_broadcast_job(job.job_id)).status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_broadcast_endpoint_tracks_progress(
+        self, async_client: AsyncClient, broadcast_service: TopicBroadcastService
+    ):
+        """구독 → 발송(202) → 작업 조회로 완료까지 확인하는 API 흐름 테스트"""
+        app.dependency_overrides[get_topic_broadcast_service] = lambda: broadcast_service
+
+        response = await async_client.post(
+            "/push/topic/alerts/subscribers",
+            json={"user_ids": [f"fan_{i}" for i in range(500)]},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"topic": "alerts", "changed": 500, "subscribers": 500}
+
+        response = await async_client.post(
+            "/push/topic/alerts/broadcast", json={"message": "긴급 공지"}
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        for _ in range(100):
+            job = (await async_client.get(f"/push/broadcast/{job_id}")).json()
+            if job["status"] == "completed":
+                break
+            await asyncio.sleep(0.05)
+        assert job["status"] == "completed"
+        assert (job["total"], job["succeeded"], job["progress"]) == (500, 500, 1.0)
+
+        pushes = (await async_client.get("/push/user/fan_3/pushes")).json()["items"]
+        assert [(p["message"], p["topic"]) for p in pushes] == [("긴급 공지", "alerts")]
+
+        response = await async_client.request(
+            "DELETE", "/push/topic/alerts/subscribers", json={"user_ids": ["fan_0", "fan_0"]}
+        )
+        assert response.json()["subscribers"] == 499
+
+        unknown = BroadcastJob.create_new(topic="alerts", message="없음").job_id
+        assert (await async_client.get(f"/push/broadcast/{unknown}")).status_code == 404